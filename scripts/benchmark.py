@@ -0,0 +1,141 @@
+"""A simple CLI command to benchmark the cold-start cost of disnake-compass.
+
+This measures:
+- the time it takes to import disnake-compass (in a fresh interpreter),
+- the time it takes to define a component class (i.e. ``ComponentMeta``),
+- the time it takes to register component classes to a manager at scale.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+import types
+import typing
+
+import disnake_compass
+
+_IMPORT_SNIPPET: typing.Final[str] = """
+import time
+import disnake
+
+start = time.perf_counter()
+import disnake_compass
+print(time.perf_counter() - start)
+"""
+
+_FIELD_TYPES: typing.Final[tuple[type, ...]] = (int, str, bool, float)
+
+
+def _format(seconds: float) -> str:
+    if seconds < 1e-3:  # noqa: PLR2004
+        return f"{seconds * 1e6:8.1f} us"
+    if seconds < 1:
+        return f"{seconds * 1e3:8.2f} ms"
+    return f"{seconds:8.3f} s "
+
+
+def _bench_import(repeat: int) -> list[float]:
+    # Every import has to happen in a fresh interpreter, otherwise we'd just
+    # be measuring a dict lookup in sys.modules.
+    results: list[float] = []
+    for _ in range(repeat):
+        output = subprocess.check_output([sys.executable, "-c", _IMPORT_SNIPPET], text=True)
+        results.append(float(output.strip()))
+
+    return results
+
+
+def _make_component_classes(
+    count: int,
+    *,
+    fields: int,
+    prefix: str,
+) -> typing.Iterator[type]:
+    async def callback(self: object, interaction: object) -> None:
+        pass
+
+    annotations = {f"field_{i}": _FIELD_TYPES[i % len(_FIELD_TYPES)] for i in range(fields)}
+
+    def populate(namespace: dict[str, typing.Any]) -> None:
+        namespace["__annotations__"] = dict(annotations)
+        namespace["callback"] = callback
+
+    for i in range(count):
+        yield types.new_class(
+            f"{prefix}{i}",
+            (disnake_compass.RichButton,),
+            exec_body=populate,
+        )
+
+
+def _bench_define(count: int, fields: int) -> float:
+    start = time.perf_counter()
+    for _ in _make_component_classes(count, fields=fields, prefix="DefineBench"):
+        pass
+
+    return (time.perf_counter() - start) / count
+
+
+def _bench_register(count: int, fields: int) -> float:
+    manager = disnake_compass.get_manager(f"benchmark{count}")
+    component_types = list(
+        _make_component_classes(count, fields=fields, prefix=f"RegisterBench{count}_"),
+    )
+
+    start = time.perf_counter()
+    for component_type in component_types:
+        manager.register_component(component_type)
+    elapsed = time.perf_counter() - start
+
+    for component_type in component_types:
+        manager.deregister_component(manager.lookup_identifier(component_type))
+
+    return elapsed
+
+
+def _main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="How many fresh interpreters to measure import time in.",
+    )
+    parser.add_argument(
+        "--classes",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000],
+        help="The number(s) of component classes to register.",
+    )
+    parser.add_argument(
+        "--fields",
+        type=int,
+        default=4,
+        help="The number of custom id fields per component class.",
+    )
+    args = parser.parse_args()
+
+    imports = _bench_import(args.repeat)
+    print(
+        f"import disnake_compass     min {_format(min(imports))}"
+        f"  median {_format(statistics.median(imports))}  (n={args.repeat})",
+    )
+
+    per_class = _bench_define(min(args.classes), args.fields)
+    print(f"ComponentMeta per class   {_format(per_class)}  ({args.fields} fields)")
+
+    for count in args.classes:
+        elapsed = _bench_register(count, args.fields)
+        print(
+            f"register_component x{count:<6} {_format(elapsed)}"
+            f"  ({_format(elapsed / count).strip()} per class)",
+        )
+
+
+if __name__ == "__main__":
+    _main()
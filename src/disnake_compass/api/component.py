@@ -13,6 +13,7 @@ __all__: typing.Sequence[str] = (
     "ComponentManager",
     "RichButton",
     "RichComponent",
+    "RichModal",
     "RichSelect",
 )
 
@@ -26,7 +27,7 @@ ComponentT = typing.TypeVar("ComponentT", bound="RichComponent")
 """A type hint for a (subclass of) a disnake-compass component.
 
 In practice, this will be any implementation of the :class:`RichButton`,
-or :class:`RichSelect` protocols.
+:class:`RichSelect` or :class:`RichModal` protocols.
 """
 
 
@@ -161,6 +162,27 @@ class RichSelect(RichComponent, typing.Protocol):
         ...
 
 
+@typing.runtime_checkable
+class RichModal(RichComponent, typing.Protocol):
+    """Baseline protocol for modals.
+
+    Unlike message components, modals are sent through
+    :meth:`disnake.InteractionResponse.send_modal` and invoked when they are
+    submitted.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    title: str
+    """The title of the modal."""
+
+    async def as_ui_component(  # pyright: ignore[reportIncompatibleMethodOverride]  # noqa: D102
+        self, manager: ComponentManager | None = None, /
+    ) -> disnake.ui.Modal:
+        # <<Docstring inherited from RichComponent>>
+        ...
+
+
 @typing.runtime_checkable
 class ComponentManager(typing.Protocol):
     """The baseline protocol for component managers.
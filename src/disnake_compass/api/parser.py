@@ -6,7 +6,7 @@ import typing
 
 import typing_extensions
 
-__all__: typing.Sequence[str] = ("Parser",)
+__all__: typing.Sequence[str] = ("PackableParser", "Parser", "PureParser", "SyncParser")
 
 
 ParserType = typing_extensions.TypeVar(
@@ -108,3 +108,157 @@ class Parser(typing.Protocol[ParserType]):
 
         """
         ...
+
+
+@typing.runtime_checkable
+class SyncParser(Parser[ParserType], typing.Protocol[ParserType]):
+    """The protocol for parsers that additionally support synchronous parsing.
+
+    This is an opt-in extension to :class:`Parser`. Parsers that do not need
+    to await anything (e.g. parsers for builtin types) can implement this to
+    allow disnake-compass to parse them without creating any coroutines, and
+    to allow users to parse custom ids outside of an async context.
+
+    Note that, for compound parsers, whether or not they can parse
+    synchronously may depend on their inner parsers. Therefore, a parser
+    implementing this protocol should always be checked for :attr:`is_sync`
+    before any of the synchronous methods are used.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @property
+    def is_sync(self) -> bool:
+        """Whether this parser instance can currently parse synchronously.
+
+        If this is ``False``, :meth:`loads_sync` and :meth:`dumps_sync` must
+        not be used.
+        """
+        ...
+
+    def loads_sync(self, argument: str, /) -> ParserType:
+        """Load a value from a string synchronously.
+
+        This must be equivalent to awaiting :meth:`~Parser.loads`.
+
+        Parameters
+        ----------
+        argument:
+            The argument to parse into the desired type.
+
+        Returns
+        -------
+        :data:`.ParserType`:
+            The parsed result.
+
+        """
+        ...
+
+    def dumps_sync(self, argument: ParserType, /) -> str:
+        """Dump a value from a given type and convert it to a string synchronously.
+
+        This must be equivalent to awaiting :meth:`~Parser.dumps`.
+
+        Parameters
+        ----------
+        argument:
+            The argument to parse into the desired type.
+
+        Returns
+        -------
+        :class:`str`:
+            The resulting dumped argument.
+
+        """
+        ...
+
+
+@typing.runtime_checkable
+class PackableParser(Parser[ParserType], typing.Protocol[ParserType]):
+    """The protocol for parsers that can store values in a fixed number of bits.
+
+    This is an opt-in extension to :class:`Parser`. Component managers that
+    are configured to pack custom ids combine all fields of which the parsers
+    implement this protocol into a single integer, which is then stored using
+    a wide alphabet. For example, a boolean only takes a single bit instead
+    of an entire character and a separator.
+
+    Note that whether or not a parser can pack values may depend on its
+    configuration. Therefore, a parser implementing this protocol should
+    always be checked for :attr:`bit_length` before any of the packing
+    methods are used.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @property
+    def bit_length(self) -> int | None:
+        """The number of bits required to store any value of this parser.
+
+        If this is ``None``, the parser cannot currently pack values and
+        :meth:`pack` and :meth:`unpack` must not be used.
+        """
+        ...
+
+    def pack(self, argument: ParserType, /) -> int:
+        """Pack a value into a non-negative integer.
+
+        The resulting integer must be smaller than ``2 ** bit_length``.
+
+        Parameters
+        ----------
+        argument:
+            The argument to pack.
+
+        Returns
+        -------
+        :class:`int`:
+            The packed argument.
+
+        """
+        ...
+
+    def unpack(self, argument: int, /) -> ParserType:
+        """Unpack a value from a non-negative integer.
+
+        This must be the inverse of :meth:`pack`.
+
+        Parameters
+        ----------
+        argument:
+            The integer to unpack.
+
+        Returns
+        -------
+        :data:`.ParserType`:
+            The unpacked value.
+
+        """
+        ...
+
+
+@typing.runtime_checkable
+class PureParser(Parser[ParserType], typing.Protocol[ParserType]):
+    """The protocol for parsers of which the results may be cached.
+
+    This is an opt-in extension to :class:`Parser`. A parser is pure if
+    loading the same string always results in an equal value, without
+    depending on any external state such as the cache of the bot or the
+    current time. Component managers with a decode cache store the loaded
+    values of components of which all fields are pure, such that repeated
+    interactions with the same custom id need not parse it again.
+
+    As cached values are shared between components, values loaded by pure
+    parsers must also be immutable.
+
+    Note that, for compound parsers, whether or not they are pure may depend
+    on their inner parsers. Therefore, a parser implementing this protocol
+    should always be checked for :attr:`is_pure`.
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    @property
+    def is_pure(self) -> bool:
+        """Whether the values loaded by this parser instance may be cached."""
+        ...
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import enum
+import operator
+import types
 import typing
+import weakref
 
 import attrs
 import typing_extensions
@@ -11,10 +14,11 @@ import typing_extensions
 if typing.TYPE_CHECKING:
     from disnake_compass.api import parser as parser_api
 
-__all__: typing.Sequence[str] = ("field",)
+__all__: typing.Sequence[str] = ("field", "modal_field")
 
 
 _T = typing_extensions.TypeVar("_T", default=typing.Any)
+_AnyAttr: typing_extensions.TypeAlias = "attrs.Attribute[typing.Any]"
 
 
 class FieldMetadata(enum.Enum):
@@ -155,6 +159,132 @@ def get_fields(
     return [field for field in attrs.fields(cls) if is_field_of_type(field, kind)]
 
 
+def _make_getter(names: typing.Sequence[str]) -> typing.Callable[[object], tuple[object, ...]]:
+    # operator.attrgetter only returns a tuple for two or more names.
+    if len(names) > 1:
+        return operator.attrgetter(*names)
+
+    if names:
+        getter = operator.attrgetter(names[0])
+        return lambda obj: (getter(obj),)
+
+    return lambda _: ()
+
+
+@attrs.define(slots=True, frozen=True)
+class FieldLayout:
+    """The layout of the fields of a component class.
+
+    Field metadata never changes after a class is created, so the layout is
+    computed only once per class, such that e.g. parsing a component does not
+    need to inspect all of its fields every time. Layouts of classes created
+    through :class:`~disnake_compass.impl.component.base.ComponentMeta` are
+    computed upon class creation.
+
+    This should be obtained through :func:`get_layout`.
+    """
+
+    custom_id: tuple[_AnyAttr, ...]
+    """The custom id fields, in the order in which they are stored in the custom id."""
+    parsers: typing.Mapping[str, parser_api.Parser[typing.Any]]
+    """A mapping of custom id field name to the parser set on that field.
+
+    Fields of which the parser is yet to be inferred are omitted.
+    """
+    internal: tuple[str, ...]
+    """The names of the internal fields, in definition order."""
+    modal: tuple[str, ...]
+    """The names of the modal fields, in definition order."""
+
+    _get_internal: typing.Callable[[object], tuple[object, ...]] = attrs.field(repr=False)
+
+    @classmethod
+    def from_class(cls, component_type: type, /) -> typing_extensions.Self:
+        """Compute the layout of the provided attrs class.
+
+        Parameters
+        ----------
+        component_type:
+            The class of which to compute the layout.
+
+        Returns
+        -------
+        :class:`FieldLayout`
+            The layout of the provided class.
+
+        """
+        custom_id: list[_AnyAttr] = []
+        internal: list[str] = []
+        modal: list[str] = []
+        for attribute in get_fields(component_type):
+            field_type = get_field_type(attribute)
+            if field_type is FieldType.CUSTOM_ID:
+                custom_id.append(attribute)
+            elif field_type is FieldType.INTERNAL:
+                internal.append(attribute.name)
+            elif field_type is FieldType.MODAL:
+                modal.append(attribute.name)
+
+        parsers = {
+            attribute.name: parser
+            for attribute in custom_id
+            if (parser := get_parser(attribute)) is not None
+        }
+
+        return cls(
+            tuple(custom_id),
+            types.MappingProxyType(parsers),
+            tuple(internal),
+            tuple(modal),
+            _make_getter(internal),
+        )
+
+    def get_internal(self, source: object, /) -> dict[str, object]:
+        """Read the values of the internal fields from an object.
+
+        Parameters
+        ----------
+        source:
+            The object from which to read the values, e.g. the raw disnake
+            component of a rich component. This must have an attribute for
+            each internal field.
+
+        Returns
+        -------
+        :class:`dict`[:class:`str`, :class:`object`]
+            A mapping of internal field name to the value read from the object.
+
+        """
+        return dict(zip(self.internal, self._get_internal(source), strict=True))
+
+
+_LAYOUTS: weakref.WeakKeyDictionary[type, FieldLayout] = weakref.WeakKeyDictionary()
+
+
+def get_layout(cls: type, /) -> FieldLayout:
+    """Get the :class:`FieldLayout` of an attrs class.
+
+    The layout is computed upon first use and then reused for the lifetime of
+    the class.
+
+    Parameters
+    ----------
+    cls:
+        The class of which to get the layout.
+
+    Returns
+    -------
+    :class:`FieldLayout`
+        The layout of the provided class.
+
+    """
+    layout = _LAYOUTS.get(cls)
+    if layout is None:
+        layout = _LAYOUTS[cls] = FieldLayout.from_class(cls)
+
+    return layout
+
+
 def field(
     default: _T | attrs.NothingType = attrs.NOTHING,
     *,
@@ -199,6 +329,40 @@ def field(
     )
 
 
+def modal_field(default: _T | attrs.NothingType = attrs.NOTHING) -> _T:
+    r"""Define a field that is set to a value submitted through a modal.
+
+    When a modal is submitted, this field is set to the value of the modal
+    component with a custom id equal to the name of this field. Values are
+    resolved as per :attr:`disnake.ModalInteraction.resolved_values`, so e.g.
+    text inputs provide a :class:`str` and user selects provide a list of
+    users.
+
+    This is a wrapper around :func:`attrs.field`.
+
+    .. note::
+        Fields created this way always have ``kw_only=True`` set.
+
+    Parameters
+    ----------
+    default:
+        The value for this field if the modal did not contain a component for
+        it. If no default is provided, the modal must contain a component for
+        this field.
+
+    Returns
+    -------
+    :func:`Field <attrs.field>`\[``T``]
+        A new field with the provided default.
+
+    """
+    return attrs.field(
+        default=typing.cast(_T, default),
+        kw_only=True,
+        metadata={FieldMetadata.FIELDTYPE: FieldType.MODAL},
+    )
+
+
 def internal(
     default: _T = attrs.NOTHING,
     *,
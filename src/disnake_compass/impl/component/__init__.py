@@ -6,4 +6,5 @@
 
 from disnake_compass.impl.component.base import *
 from disnake_compass.impl.component.button import *
+from disnake_compass.impl.component.modal import *
 from disnake_compass.impl.component.select import *
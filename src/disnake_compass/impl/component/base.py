@@ -157,7 +157,7 @@ def _field_transformer(
 
 @typing_extensions.dataclass_transform(
     kw_only_default=True,
-    field_specifiers=(fields.field, fields.internal, fields.meta),
+    field_specifiers=(fields.field, fields.internal, fields.meta, fields.modal_field),
 )
 class ComponentMeta(type(typing.Protocol)):
     """Metaclass for all disnake-compass component types.
@@ -189,6 +189,10 @@ class ComponentMeta(type(typing.Protocol)):
 
         cls = attrs.define(cls, slots=True, kw_only=True, field_transformer=_field_transformer)
 
+        # Field metadata is final now; compute the layout once such that
+        # parsing and rendering never need to inspect the fields again.
+        fields.get_layout(cls)
+
         # NOTE: Pyright complains about RichComponent being a data protocol
         #       here, but this is a false-positive, as the only non-method
         #       member is __slots__.
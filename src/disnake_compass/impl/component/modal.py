@@ -0,0 +1,78 @@
+"""Default implementation of modals."""
+
+from __future__ import annotations
+
+import abc
+import typing
+
+import attrs
+import disnake
+
+from disnake_compass import fields
+from disnake_compass.api import component as component_api
+from disnake_compass.api import disnake_compat as disnake_api
+from disnake_compass.impl.component import base as component_base
+
+__all__: typing.Sequence[str] = ("RichModal",)
+
+
+@typing.runtime_checkable
+class RichModal(
+    component_api.RichModal,
+    component_base.ComponentBase,
+    typing.Protocol,
+):
+    """The default implementation of a disnake-compass modal.
+
+    This works similar to a dataclass, but with some extra things to take into
+    account.
+
+    First and foremost, there are class variables for :attr:`title` and
+    :attr:`components`. These set the corresponding attributes on the modal
+    when it is sent to discord, and are meant to be overwritten by the user.
+
+    Next, fields can be defined similarly to dataclasses, by means of a name,
+    a type annotation, and an optional :func:`components.field` to set the
+    default or a custom parser. These are stored in the custom id of the modal,
+    exactly like they would be for buttons and selects.
+
+    Finally, fields defined with :func:`components.modal_field` receive the
+    values the user submitted. To receive a value, the modal must contain a
+    component with a custom id equal to the name of the field.
+
+    Classes created in this way have auto-generated slots and an auto-generated
+    ``__init__``. The init-signature contains all the custom id fields as
+    keyword-only arguments.
+    """
+
+    event: typing.ClassVar[str] = "on_modal_submit"
+
+    title: str = fields.internal(default="")
+    components: list[disnake_api.ModalTopLevelComponent_] = fields.internal(
+        default=attrs.Factory(list[disnake_api.ModalTopLevelComponent_]),
+    )
+    """The components of this modal.
+
+    Components that provide values for :func:`components.modal_field` fields
+    must have a custom id equal to the name of the field.
+    """
+
+    async def as_ui_component(  # pyright: ignore[reportIncompatibleMethodOverride]  # noqa: D102
+        self, manager: component_api.ComponentManager | None = None, /
+    ) -> disnake.ui.Modal:
+        # <<docstring inherited from component_api.RichModal>>
+
+        return disnake.ui.Modal(
+            title=self.title,
+            components=self.components,
+            custom_id=await self.make_custom_id(manager),
+        )
+
+    @abc.abstractmethod
+    async def callback(  # pyright: ignore[reportIncompatibleMethodOverride]  # noqa: D102
+        self,
+        inter: disnake.ModalInteraction[disnake.Client],
+        /,
+    ) -> None:
+        # <<docstring inherited from component_api.RichComponent>>
+        ...
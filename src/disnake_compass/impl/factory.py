@@ -2,23 +2,125 @@
 
 from __future__ import annotations
 
+import functools
+import time
 import types
 import typing
 
 import attrs
+import typing_extensions
 
 from disnake_compass import fields
 from disnake_compass.api import component as component_api
 from disnake_compass.api import parser as parser_api
 from disnake_compass.impl.parser import base as parser_base
+from disnake_compass.internal import alphabet as alphabet_utils
+from disnake_compass.internal import cache as cache_utils
 
-if typing.TYPE_CHECKING:
-    import typing_extensions
-
-__all__: typing.Sequence[str] = ("ComponentFactory",)
+__all__: typing.Sequence[str] = ("ComponentFactory", "DecodeCache", "DumpMemo")
 
 
 ParserMapping = typing.Mapping[str, parser_api.Parser[typing.Any]]
+DumpMemo: typing_extensions.TypeAlias = dict[tuple[int, type, object], str]
+"""A mapping used to share dumped values between :meth:`ComponentFactory.dump_params` calls.
+
+Keys consist of the id of the parser, the type of the dumped value, and the
+dumped value itself.
+"""
+
+_SyncLoader: typing_extensions.TypeAlias = typing.Callable[[str], object]
+_AsyncLoader: typing_extensions.TypeAlias = typing.Callable[
+    [str], typing.Coroutine[typing.Any, typing.Any, object]
+]
+_SyncDumper: typing_extensions.TypeAlias = typing.Callable[[typing.Any], str]
+_AsyncDumper: typing_extensions.TypeAlias = typing.Callable[
+    [typing.Any], typing.Coroutine[typing.Any, typing.Any, str]
+]
+_PackedField: typing_extensions.TypeAlias = tuple[str, parser_api.PackableParser[typing.Any], int]
+_DecodeKey: typing_extensions.TypeAlias = tuple[
+    type, alphabet_utils.Alphabet | None, tuple[str, ...]
+]
+
+
+class DecodeCache(cache_utils.FetchCache[_DecodeKey, typing.Mapping[str, object]]):
+    """A cache used to share loaded values between :meth:`ComponentFactory.build_component` calls.
+
+    Keys consist of the component type, the alphabet in which packed fields
+    were encoded (if any), and the custom id parameters. Only the values of
+    factories that are :attr:`~ComponentFactory.is_pure` are stored.
+
+    As values loaded by pure parsers never go stale, entries do not expire by
+    default.
+
+    Parameters
+    ----------
+    max_size:
+        The maximum number of entries to store. When exceeded, the least
+        recently used entry is evicted.
+    ttl:
+        The time in seconds after which an entry expires. Defaults to
+        ``None``, meaning entries never expire.
+    clock:
+        The function used to get the current time in seconds. Defaults to
+        :func:`time.monotonic`.
+
+    """
+
+    __slots__: typing.Sequence[str] = ()
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float | None = None,
+        *,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(max_size, ttl, clock=clock)
+
+
+@attrs.define(slots=True, frozen=True)
+class _Codec:
+    # The parsers of a factory, compiled for one particular custom id layout.
+    # Indices refer to positions in the custom id params.
+
+    size: int
+    sync_loaders: tuple[tuple[int, str, _SyncLoader], ...]
+    async_loaders: tuple[tuple[int, str, _AsyncLoader], ...]
+    sync_dumpers: tuple[tuple[int, str, _SyncDumper], ...]
+    async_dumpers: tuple[tuple[int, str, _AsyncDumper], ...]
+    # Fields that are packed together into the first param, in packing order.
+    packed: tuple[_PackedField, ...] = ()
+
+
+def _compile_codec(
+    parsers: typing.Iterable[tuple[int, str, parser_api.Parser[typing.Any]]],
+    *,
+    size: int,
+    packed: tuple[_PackedField, ...] = (),
+) -> _Codec:
+    sync_loaders: list[tuple[int, str, _SyncLoader]] = []
+    async_loaders: list[tuple[int, str, _AsyncLoader]] = []
+    sync_dumpers: list[tuple[int, str, _SyncDumper]] = []
+    async_dumpers: list[tuple[int, str, _AsyncDumper]] = []
+
+    for index, name, parser in parsers:
+        # Parsers that do not need to await anything skip creating a
+        # coroutine entirely.
+        if parser_base.is_sync_parser(parser):
+            sync_loaders.append((index, name, parser.loads_sync))
+            sync_dumpers.append((index, name, parser.dumps_sync))
+        else:
+            async_loaders.append((index, name, parser.loads))
+            async_dumpers.append((index, name, parser.dumps))
+
+    return _Codec(
+        size,
+        tuple(sync_loaders),
+        tuple(async_loaders),
+        tuple(sync_dumpers),
+        tuple(async_dumpers),
+        packed,
+    )
 
 
 @attrs.define(slots=True)
@@ -31,6 +133,16 @@ class ComponentFactory(
     A component factory holds information about all the custom id fields of a
     component, and contains that component's parsers. In most situations, a
     component factory can simply be created using :meth:`from_component`.
+
+    Upon creation, the factory compiles the parsers into a codec specialised
+    for the component type. Fields with parsers that support synchronous
+    parsing are loaded and dumped in a single pass without creating any
+    coroutines; only fields with parsers that are strictly asynchronous are
+    awaited.
+
+    If all of the parsers are pure, the loaded values may additionally be
+    stored in a :class:`DecodeCache`, such that components built from the
+    same custom id parameters need not parse them again.
     """
 
     parsers: ParserMapping = attrs.field(converter=types.MappingProxyType)  # pyright: ignore[reportGeneralTypeIssues]
@@ -38,6 +150,92 @@ class ComponentFactory(
     component: type[component_api.ComponentT]
     """The component type that this factory builds."""
 
+    _codec: _Codec = attrs.field(init=False, repr=False)
+    _packed_codec: _Codec = attrs.field(init=False, repr=False)
+    _pure: bool = attrs.field(init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        self.compile()
+
+    def compile(self) -> None:
+        """Compile the parsers of this factory into a specialised codec.
+
+        This is automatically done when the factory is created. This only
+        needs to be called manually if the sync-ness, packability or purity of
+        any of the parsers in :attr:`parsers` was changed after the factory was
+        created.
+        """
+        parsers = [
+            (index, name, parser) for index, (name, parser) in enumerate(self.parsers.items())
+        ]
+        self._codec = _compile_codec(parsers, size=len(parsers))
+        self._pure = all(parser_base.is_pure_parser(parser) for _, _, parser in parsers)
+
+        packed: list[_PackedField] = []
+        for _, name, parser in parsers:
+            if parser_base.is_packable_parser(parser):
+                assert parser.bit_length is not None
+                packed.append((name, parser, parser.bit_length))
+
+        if not packed:
+            self._packed_codec = self._codec
+            return
+
+        # The packed fields all go into the first param; the remaining fields
+        # follow in their usual order.
+        packed_names = {name for name, _, _ in packed}
+        remaining = [(name, parser) for _, name, parser in parsers if name not in packed_names]
+        unpacked = [
+            (index, name, parser) for index, (name, parser) in enumerate(remaining, start=1)
+        ]
+        self._packed_codec = _compile_codec(unpacked, size=len(unpacked) + 1, packed=tuple(packed))
+
+    @property
+    def is_sync(self) -> bool:
+        """Whether all of this factory's parsers can parse synchronously.
+
+        If this is ``True``, :meth:`load_params_sync`, :meth:`dump_params_sync`
+        and :meth:`build_component_sync` can be used to parse custom ids
+        outside of an async context.
+        """
+        return not self._codec.async_loaders
+
+    @property
+    def is_pure(self) -> bool:
+        """Whether all of this factory's parsers are pure.
+
+        If this is ``True``, the values loaded by this factory may be stored in
+        a :class:`DecodeCache` by :meth:`build_component` and
+        :meth:`build_component_packed`.
+        """
+        return self._pure
+
+    @property
+    def packed_fields(self) -> typing.Sequence[str]:
+        """The names of the fields that are packed by :meth:`dump_params_packed`.
+
+        These are the fields of which the parsers implement
+        :class:`~disnake_compass.api.PackableParser`, in packing order.
+        """
+        return tuple(name for name, _, _ in self._packed_codec.packed)
+
+    def _ensure_sync(self) -> None:
+        if self._codec.async_loaders:
+            names = ", ".join(repr(name) for _, name, _ in self._codec.async_loaders)
+            msg = (
+                f"Component {self.component.__name__!r} cannot be parsed"
+                f" synchronously as field(s) {names} require asynchronous parsing."
+            )
+            raise TypeError(msg)
+
+    def _validate_params(self, params: typing.Sequence[str], codec: _Codec) -> None:
+        if len(params) != codec.size:
+            msg = (
+                f"Expected {codec.size} custom id parameter(s) for component"
+                f" {self.component.__name__!r}, got {len(params)}."
+            )
+            raise ValueError(msg)
+
     @classmethod
     def from_component(  # noqa: D102
         cls,
@@ -46,13 +244,14 @@ class ComponentFactory(
         # <<docstring inherited from api.components.ComponentFactory>>
         parser: parser_api.Parser[typing.Any] | None
 
+        layout = fields.get_layout(component)
         parsers: dict[str, parser_api.Parser[typing.Any]] = {}
-        for field in fields.get_fields(component, kind=fields.FieldType.CUSTOM_ID):
-            parser = fields.get_parser(field)
+        for field in layout.custom_id:
+            parser = layout.parsers.get(field.name)
 
             if not parser:
                 parser_type = field.type or str
-                parser = parser_base.get_parser(parser_type).default(parser_type)
+                parser = parser_base.get_parser(parser_type)
 
             parsers[field.name] = parser
 
@@ -63,34 +262,444 @@ class ComponentFactory(
         params: typing.Sequence[str],
     ) -> typing.Mapping[str, object]:
         # <<docstring inherited from api.components.ComponentFactory>>
+
+        return await self._load_params(params, self._codec)
+
+    async def load_params_packed(
+        self,
+        params: typing.Sequence[str],
+        *,
+        alphabet: alphabet_utils.Alphabet = alphabet_utils.UNICODE,
+    ) -> typing.Mapping[str, object]:
+        """Load custom id parameters created by :meth:`dump_params_packed`.
+
+        Parameters
+        ----------
+        params:
+            A sequence of to-be-parsed field values.
+        alphabet:
+            The alphabet in which the packed fields were encoded.
+
+        Returns
+        -------
+        :class:`Mapping`[:class:`str`, :class:`object`]
+            A mapping containing all field names and their parsed values.
+
+        """
+        return await self._load_params(params, self._packed_codec, alphabet)
+
+    def _load_sync_params(
+        self,
+        params: typing.Sequence[str],
+        codec: _Codec,
+        alphabet: alphabet_utils.Alphabet | None = None,
+    ) -> dict[str, object]:
+        # Loads all fields that do not need to be awaited, i.e. the fields with
+        # sync parsers and the packed fields.
+        self._validate_params(params, codec)
+
+        # TODO: Check `if value`, I think this is wrong.
+        loaded = {
+            name: loads(params[index])
+            for index, name, loads in codec.sync_loaders
+            if params[index]
+        }  # fmt: skip
+
+        if codec.packed:
+            assert alphabet is not None
+            loaded.update(_unpack(codec.packed, alphabet.decode(params[0])))
+
+        return loaded
+
+    def _load_sync_params_timed(
+        self,
+        params: typing.Sequence[str],
+        codec: _Codec,
+        alphabet: alphabet_utils.Alphabet | None,
+        timings: dict[str, float],
+    ) -> dict[str, object]:
+        # Equivalent to _load_sync_params, but records the time taken per field.
+        self._validate_params(params, codec)
+        clock = time.perf_counter
+
+        loaded: dict[str, object] = {}
+        for index, name, loads in codec.sync_loaders:
+            if params[index]:
+                start = clock()
+                loaded[name] = loads(params[index])
+                timings[name] = clock() - start
+
+        if codec.packed:
+            assert alphabet is not None
+            packed = alphabet.decode(params[0])
+            for name, parser, bits in reversed(codec.packed):
+                start = clock()
+                loaded[name] = parser.unpack(packed & ((1 << bits) - 1))
+                packed >>= bits
+                timings[name] = clock() - start
+
+        return loaded
+
+    async def _load_params(
+        self,
+        params: typing.Sequence[str],
+        codec: _Codec,
+        alphabet: alphabet_utils.Alphabet | None = None,
+    ) -> dict[str, object]:
+        loaded = self._load_sync_params(params, codec, alphabet)
+
+        for index, name, loads in codec.async_loaders:
+            if params[index]:
+                loaded[name] = await loads(params[index])
+
+        return loaded
+
+    async def _load_params_timed(
+        self,
+        params: typing.Sequence[str],
+        codec: _Codec,
+        alphabet: alphabet_utils.Alphabet | None,
+        timings: dict[str, float],
+    ) -> dict[str, object]:
+        # Equivalent to _load_params, but records the time taken per field.
+        loaded = self._load_sync_params_timed(params, codec, alphabet, timings)
+        clock = time.perf_counter
+
+        for index, name, loads in codec.async_loaders:
+            if params[index]:
+                start = clock()
+                loaded[name] = await loads(params[index])
+                timings[name] = clock() - start
+
+        return loaded
+
+    async def dump_params(
+        self,
+        component: component_api.ComponentT,
+        /,
+        *,
+        memo: DumpMemo | None = None,
+    ) -> typing.Mapping[str, str]:
+        """Dump a component into a new set of custom id parameters.
+
+        Parameters
+        ----------
+        component:
+            The component to dump into custom id parameters.
+        memo:
+            A mapping in which to store dumped values, such that equal values
+            dumped by the same parser are only dumped once. This can be shared
+            between multiple calls, e.g. to render many components at once.
+            Unhashable values are always dumped.
+
+        Returns
+        -------
+        :class:`Mapping`[:class:`str`, :class:`str`]
+            A mapping containing all field names and their dumped values.
+
+        """
+        dumped = await self._dump_params(component, self._codec, memo)
+        return dict(zip(self.parsers, dumped, strict=True))
+
+    async def dump_params_packed(
+        self,
+        component: component_api.ComponentT,
+        /,
+        *,
+        alphabet: alphabet_utils.Alphabet = alphabet_utils.UNICODE,
+        memo: DumpMemo | None = None,
+    ) -> typing.Sequence[str]:
+        """Dump a component into a new set of packed custom id parameters.
+
+        All fields listed in :attr:`packed_fields` are combined into a single
+        integer, using only as many bits as their parsers require, which is
+        then encoded as the first parameter using the provided alphabet. The
+        remaining fields are dumped as usual and follow in their usual order.
+        If the component has no packable fields, this is equivalent to
+        :meth:`dump_params`.
+
+        Parameters
+        ----------
+        component:
+            The component to dump into custom id parameters.
+        alphabet:
+            The alphabet in which to encode the packed fields. This must not
+            contain the separator used to join the parameters.
+        memo:
+            A mapping in which to store dumped values. See :meth:`dump_params`.
+
+        Returns
+        -------
+        :class:`Sequence`[:class:`str`]
+            The dumped parameters.
+
+        """
+        codec = self._packed_codec
+        dumped = await self._dump_params(component, codec, memo)
+        if codec.packed:
+            dumped[0] = alphabet.encode(_pack(codec.packed, component))
+
+        return dumped
+
+    async def _dump_params(
+        self,
+        component: component_api.ComponentT,
+        codec: _Codec,
+        memo: DumpMemo | None,
+    ) -> list[str]:
+        if memo is not None:
+            return await self._dump_params_memo(component, codec, memo)
+
+        dumped = [""] * codec.size
+        for index, name, dumps in codec.sync_dumpers:
+            dumped[index] = dumps(getattr(component, name))
+
+        for index, name, dumps in codec.async_dumpers:
+            dumped[index] = await dumps(getattr(component, name))
+
+        return dumped
+
+    async def _dump_params_memo(
+        self,
+        component: component_api.ComponentT,
+        codec: _Codec,
+        memo: DumpMemo,
+    ) -> list[str]:
+        dumped = [""] * codec.size
+        parsers = self.parsers
+
+        for index, name, dumps in codec.sync_dumpers:
+            value: object = getattr(component, name)
+            key = (id(parsers[name]), type(value), value)
+            try:
+                dumped[index] = memo[key]
+            except KeyError:
+                dumped[index] = memo[key] = dumps(value)
+            except TypeError:  # Unhashable.
+                dumped[index] = dumps(value)
+
+        for index, name, dumps in codec.async_dumpers:
+            value: object = getattr(component, name)
+            key = (id(parsers[name]), type(value), value)
+            try:
+                dumped[index] = memo[key]
+            except KeyError:
+                dumped[index] = memo[key] = await dumps(value)
+            except TypeError:  # Unhashable.
+                dumped[index] = await dumps(value)
+
+        return dumped
+
+    async def build_component(
+        self,
+        params: typing.Sequence[str],
+        component_params: typing.Mapping[str, object] | None = None,
+        *,
+        timings: dict[str, float] | None = None,
+        cache: DecodeCache | None = None,
+    ) -> component_api.ComponentT:
+        """Create a new component instance from the provided custom id parameters.
+
+        Parameters
+        ----------
+        params:
+            A sequence of to-be-parsed field values.
+        component_params:
+            A mapping of parameters that is to be directly passed to the
+            component constructor.
+        timings:
+            A mapping in which to store the time in seconds taken to parse
+            each field, keyed by field name. Fields that were not parsed
+            because their parameter was empty are omitted.
+        cache:
+            The cache in which to look up and store the loaded values. This
+            is only used if this factory :attr:`is_pure`. No timings are
+            recorded if the values were found in the cache.
+
+        Returns
+        -------
+        :class:`RichComponent`:
+            The newly created component.
+
+        """
+        parsed = await self._load_params_cached(params, self._codec, None, timings, cache)
+        return self.component(**parsed, **(component_params or {}))
+
+    async def build_component_packed(
+        self,
+        params: typing.Sequence[str],
+        component_params: typing.Mapping[str, object] | None = None,
+        *,
+        alphabet: alphabet_utils.Alphabet = alphabet_utils.UNICODE,
+        timings: dict[str, float] | None = None,
+        cache: DecodeCache | None = None,
+    ) -> component_api.ComponentT:
+        """Create a new component instance from packed custom id parameters.
+
+        See :meth:`dump_params_packed` for further details on packing.
+
+        Parameters
+        ----------
+        params:
+            A sequence of to-be-parsed field values.
+        component_params:
+            A mapping of parameters that is to be directly passed to the
+            component constructor.
+        alphabet:
+            The alphabet in which the packed fields were encoded.
+        timings:
+            A mapping in which to store the time in seconds taken to parse
+            each field. See :meth:`build_component`.
+        cache:
+            The cache in which to look up and store the loaded values. See
+            :meth:`build_component`.
+
+        Returns
+        -------
+        :class:`RichComponent`:
+            The newly created component.
+
+        """
+        codec = self._packed_codec
+        parsed = await self._load_params_cached(
+            params, codec, alphabet if codec.packed else None, timings, cache
+        )
+        return self.component(**parsed, **(component_params or {}))
+
+    async def _load_params_cached(
+        self,
+        params: typing.Sequence[str],
+        codec: _Codec,
+        alphabet: alphabet_utils.Alphabet | None,
+        timings: dict[str, float] | None,
+        cache: DecodeCache | None,
+    ) -> typing.Mapping[str, object]:
+        if cache is None or not self._pure:
+            if timings is None:
+                return await self._load_params(params, codec, alphabet)
+
+            return await self._load_params_timed(params, codec, alphabet, timings)
+
+        # Packed params are only equal if they were encoded in the same alphabet.
+        key = (self.component, alphabet, tuple(params))
+        if codec.async_loaders:
+            if timings is None:
+                fetch = functools.partial(self._load_params, params, codec, alphabet)
+            else:
+                fetch = functools.partial(self._load_params_timed, params, codec, alphabet, timings)
+
+            return await cache.get_or_fetch(key, fetch)
+
+        # Without any async parsers, misses are loaded in place; there is
+        # nothing to await and thus no need to share the load between tasks.
+        if timings is None:
+            load = functools.partial(self._load_sync_params, params, codec, alphabet)
+        else:
+            load = functools.partial(self._load_sync_params_timed, params, codec, alphabet, timings)
+
+        return cache.get_or_load(key, load)
+
+    def load_params_sync(
+        self,
+        params: typing.Sequence[str],
+    ) -> typing.Mapping[str, object]:
+        """Load the provided custom id parameters synchronously.
+
+        This can only be used if :attr:`is_sync` is ``True``. See
+        :meth:`load_params` for further details.
+
+        Parameters
+        ----------
+        params:
+            A sequence of to-be-parsed field values.
+
+        Raises
+        ------
+        :class:`TypeError`:
+            Any of the parsers of this factory cannot parse synchronously.
+
+        """
+        self._ensure_sync()
+        self._validate_params(params, self._codec)
+
         return {
-            param: await self.parsers[param].loads(value)
-            for param, value in zip(self.parsers, params, strict=True)
-            if value  # TODO: Check this, I think this is wrong.
-        }
+            name: loads(params[index])
+            for index, name, loads in self._codec.sync_loaders
+            if params[index]
+        }  # fmt: skip
 
-    async def dump_params(  # noqa: D102
+    def dump_params_sync(
         self,
         component: component_api.ComponentT,
     ) -> typing.Mapping[str, str]:
-        # <<docstring inherited from api.components.ComponentFactory>>
+        """Dump a component's custom id parameters synchronously.
+
+        This can only be used if :attr:`is_sync` is ``True``. See
+        :meth:`dump_params` for further details.
+
+        Parameters
+        ----------
+        component:
+            The component to dump into custom id parameters.
+
+        Raises
+        ------
+        :class:`TypeError`:
+            Any of the parsers of this factory cannot parse synchronously.
+
+        """
+        self._ensure_sync()
 
         return {
-            field: await self.parsers[field].dumps(getattr(component, field))
-            for field in self.parsers
-        }
+            name: dumps(getattr(component, name))
+            for _, name, dumps in self._codec.sync_dumpers
+        }  # fmt: skip
 
-    async def build_component(  # noqa: D102
+    def build_component_sync(
         self,
         params: typing.Sequence[str],
         component_params: typing.Mapping[str, object] | None = None,
     ) -> component_api.ComponentT:
-        # <<docstring inherited from api.components.ComponentFactory>>
-
-        parsed = await self.load_params(params)
+        """Create a new component instance from the provided parameters synchronously.
+
+        This can only be used if :attr:`is_sync` is ``True``. See
+        :meth:`build_component` for further details.
+
+        Parameters
+        ----------
+        params:
+            A sequence of to-be-parsed field values.
+        component_params:
+            A mapping of parameters that is to be directly passed to the
+            component constructor.
+
+        Raises
+        ------
+        :class:`TypeError`:
+            Any of the parsers of this factory cannot parse synchronously.
+
+        """
+        parsed = self.load_params_sync(params)
         return self.component(**parsed, **(component_params or {}))
 
 
+def _pack(fields: tuple[_PackedField, ...], component: object) -> int:
+    packed = 0
+    for name, parser, bits in fields:
+        packed = (packed << bits) | parser.pack(getattr(component, name))
+
+    return packed
+
+
+def _unpack(fields: tuple[_PackedField, ...], packed: int) -> dict[str, object]:
+    unpacked: dict[str, object] = {}
+    for name, parser, bits in reversed(fields):
+        unpacked[name] = parser.unpack(packed & ((1 << bits) - 1))
+        packed >>= bits
+
+    return unpacked
+
+
 class NoopFactory(component_api.ComponentFactory[typing.Any]):
     """Factory class to make component protocols typesafe.
 
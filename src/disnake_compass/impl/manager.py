@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
 import contextvars
 import logging
 import sys
+import time
 import typing
 import weakref
 
@@ -16,7 +18,11 @@ import typing_extensions
 from disnake_compass import fields
 from disnake_compass.api import component as component_api
 from disnake_compass.api import disnake_compat as disnake_api
-from disnake_compass.internal import di, omit
+from disnake_compass.impl import factory as factory_impl
+from disnake_compass.impl.parser import base as parser_base
+from disnake_compass.internal import concurrency, deadline, di, omit
+from disnake_compass.internal import dedupe as dedupe_utils
+from disnake_compass.internal import metrics as metrics_utils
 
 __all__: typing.Sequence[str] = ("ComponentManager", "check_manager", "get_manager")
 
@@ -30,6 +36,10 @@ _IS_COMPONENTS_V2 = 1 << 15
 _COMPONENT_CTX: contextvars.ContextVar[tuple[component_api.RichComponent, str]] = (
     contextvars.ContextVar("_COMPONENT_CTX")
 )
+# Custom ids rendered ahead of time by update_layout, keyed by component id.
+_RENDERED_CUSTOM_IDS: contextvars.ContextVar[dict[int, str]] = contextvars.ContextVar(
+    "_RENDERED_CUSTOM_IDS"
+)
 
 
 T = typing.TypeVar("T")
@@ -101,6 +111,14 @@ ExceptionHandlerFuncT = typing.TypeVar(
 
 RichComponentT = typing.TypeVar("RichComponentT", bound=component_api.RichComponent)
 RichComponentType: typing.TypeAlias = type[component_api.RichComponent]
+_AnyInteraction: typing.TypeAlias = (
+    disnake.MessageInteraction[disnake.Client] | disnake.ModalInteraction[disnake.Client]
+)
+# The identifier of a custom id and the index of the separator following it.
+_IdentifierMatch: typing.TypeAlias = tuple[str, int]
+_PreparedComponent: typing.TypeAlias = tuple[
+    str, RichComponentType, typing.Sequence[str], typing.Mapping[str, object]
+]
 
 
 _MAX_COUNT = 1 << 8 - 1  # 1 byte, starting at 0
@@ -115,11 +133,12 @@ def _minimise_count(count: int) -> str:
     return byte.decode("latin-1")
 
 
-_COUNT_CHARS: typing.Final[tuple[str, ...]] = tuple(
+_COUNT_CHARS: typing.Final[frozenset[str]] = frozenset(
     map(_minimise_count, range(_MAX_COUNT)),
 )
 _DEFAULT_SEP: typing.Final[str] = sys.intern("|")
 _DEFAULT_COUNT: typing.Final = True
+_DEFAULT_PACKED: typing.Final = False
 
 
 @contextlib.asynccontextmanager
@@ -127,13 +146,13 @@ async def default_dependency_provider(
     manager: component_api.ComponentManager,  # noqa: ARG001
     *dependencies: object,
 ) -> typing.AsyncGenerator[None, None]:
-    tokens = di.register_dependencies(
+    token = di.register_dependencies(
         *(dependency for dependency in dependencies if dependency is not None),
     )
 
     yield
 
-    di.reset_dependencies(tokens)
+    di.reset_dependencies(token)
 
 
 @contextlib.asynccontextmanager
@@ -195,16 +214,39 @@ class _ModuleData:
         module = sys.modules[obj.__module__]
         return cls(obj.__module__, id(module))
 
-    def is_active(self) -> bool:
-        if self.name not in sys.modules:
-            return False
-
-        return self.id == id(sys.modules[self.name])
-
     def is_reload_of(self, other: typing_extensions.Self) -> bool:
         return self.name == other.name and self.id != other.id
 
 
+@attrs.define(slots=True, frozen=True)
+class _ResolvedConfig:
+    # The effective configuration of a manager, taking its parents into account.
+
+    generation: int
+    parents: tuple[ComponentManager, ...]
+    count: bool
+    sep: str
+    packed: bool
+    client: disnake.Client | None
+    # Non-default callback wrappers, from root to this manager.
+    callback_wrappers: tuple[tuple[ComponentManager, CallbackWrapper], ...]
+    # Exception handlers from this manager to root, skipping default handlers
+    # that would just pass the exception on to the next manager.
+    exception_handlers: tuple[tuple[ComponentManager, ExceptionHandlerFunc], ...]
+    # Managers from this manager to root that have any concurrency limits.
+    limiters: tuple[ComponentManager, ...]
+
+
+# Bumped whenever the configuration of any manager or the manager hierarchy
+# changes, invalidating the resolved configuration of all managers.
+_config_generation: int = 0
+
+
+def _invalidate_config() -> None:
+    global _config_generation  # noqa: PLW0603
+    _config_generation += 1
+
+
 class ComponentManager(component_api.ComponentManager):
     """The standard implementation of a component manager.
 
@@ -253,6 +295,13 @@ class ComponentManager(component_api.ComponentManager):
 
         If not set, the manager will use its parents' settings. The default
         set on the root manager is ``"|"``.
+    packed:
+        Whether the component manager should pack custom id fields with a
+        known bit size (e.g. booleans, enums and snowflakes) into a single
+        custom id parameter. See :attr:`packed` for further details.
+
+        If not set, the manager will use its parents' settings. The default
+        set on the root manager is ``False``.
     client:
         The client to which to register this manager. This can be specified at any
         point through :meth:`.add_to_client`.
@@ -261,32 +310,55 @@ class ComponentManager(component_api.ComponentManager):
 
     __slots__: typing.Sequence[str] = (
         "__weakref__",
+        "_auto_defer",
         "_children",
         "_client",
+        "_component_limits",
         "_components",
+        "_concurrency_limit",
         "_count",
         "_counter",
+        "_decode_cache",
+        "_dedupe",
+        "_handle_exception",
         "_identifiers",
+        "_metrics",
         "_module_data",
+        "_module_index",
         "_name",
+        "_packed",
         "_registrars",
+        "_resolved_config",
         "_sep",
-        "handle_exception",
+        "_wrap_callback",
         "set_invocation_dependencies",
-        "wrap_callback",
     )
 
+    _auto_defer: deadline.AutoDefer | None
     _client: disnake.Client | None
     _children: set[ComponentManager]
+    _component_limits: dict[str, concurrency.ConcurrencyLimit]
     _components: weakref.WeakValueDictionary[str, RichComponentType]
+    _concurrency_limit: concurrency.ConcurrencyLimit | None
     _count: bool | None
     _counter: int
+    _decode_cache: factory_impl.DecodeCache | None
+    _dedupe: dedupe_utils.DedupeWindow | None
+    _handle_exception: ExceptionHandlerFunc
     _identifiers: dict[str, str]
+    _metrics: metrics_utils.Metrics | None
     # TODO: Refactor module data to go somewhere else now that only the root manager is aware of it.
     _module_data: dict[str, _ModuleData]
+    # A mapping of module name to the id of the module and the identifiers of
+    # the components defined in it, such that all components of a module can be
+    # purged at once.
+    _module_index: dict[str, tuple[int, set[str]]]
     _name: str
+    _packed: bool | None
     _registrars: weakref.WeakValueDictionary[str, ComponentManager]
+    _resolved_config: _ResolvedConfig | None
     _sep: str | None
+    _wrap_callback: CallbackWrapper
 
     def __init__(
         self,
@@ -294,20 +366,31 @@ class ComponentManager(component_api.ComponentManager):
         *,
         count: bool | None = None,
         sep: str | None = None,
+        packed: bool | None = None,
         client: disnake.Client | None = None,
     ) -> None:
         self._name = name
+        self._auto_defer = None
         self._children = set()
+        self._client = None
+        self._component_limits = {}
         self._components = weakref.WeakValueDictionary()
+        self._concurrency_limit = None
         self._identifiers = {}
+        self._metrics = None
         self._count = count
         self._counter = 0
+        self._decode_cache = None
+        self._dedupe = None
         self._module_data = {}
+        self._module_index = {}
+        self._packed = packed
         self._registrars = weakref.WeakValueDictionary()
+        self._resolved_config = None
         self._sep = sep
         self.set_invocation_dependencies: DependencyProvider = default_dependency_provider
-        self.wrap_callback: CallbackWrapper = default_callback_wrapper
-        self.handle_exception: ExceptionHandlerFunc = default_exception_handler
+        self._wrap_callback = default_callback_wrapper
+        self._handle_exception = default_exception_handler
 
         if client:
             self.add_to_client(client)
@@ -336,7 +419,7 @@ class ComponentManager(component_api.ComponentManager):
             It is therefore generally recommended to set the client on the root
             manager so that all other managers automatically have access to it.
         """
-        client = _recurse_parents_getattr(self, "_client", None)
+        client = self._get_config().client
         if client:
             return client
 
@@ -381,7 +464,7 @@ class ComponentManager(component_api.ComponentManager):
             As this takes 1 character, the effective maximum custom id length
             is reduced to 99 characters.
         """
-        return _recurse_parents_getattr(self, "_count", _DEFAULT_COUNT)
+        return self._get_config().count
 
     @property
     def counter(self) -> int:  # noqa: D102
@@ -402,7 +485,201 @@ class ComponentManager(component_api.ComponentManager):
             child ``get_manager("foo.bar").sep`` will also return ``"|"``
             unless explicitly set to some other value.
         """
-        return _recurse_parents_getattr(self, "_sep", _DEFAULT_SEP)
+        return self._get_config().sep
+
+    @property
+    def packed(self) -> bool:
+        """Whether this manager packs custom id fields with a known bit size.
+
+        If enabled, all custom id fields of which the parsers implement
+        :class:`~disnake_compass.api.PackableParser` are combined into a
+        single integer, which is stored as the first custom id parameter using
+        a wide unicode alphabet. For example, a boolean then takes a single
+        bit and a snowflake takes 64 bits, rather than a full character or
+        a base-36 number, respectively, plus a separator each.
+
+        By default, this is set to :obj:`False`. This can be changed using
+        :meth:`config`.
+
+        .. note::
+            This is recursively accessed for all the parents of this manager.
+            For example, if ``get_manager("foo").packed == True``, then its
+            child ``get_manager("foo.bar").packed`` will also return ``True``
+            unless explicitly set to ``False``.
+
+        .. warning::
+            Custom ids created with packing enabled cannot be parsed with
+            packing disabled, and vice versa. Changing this setting therefore
+            makes components on existing messages unresponsive.
+        """
+        return self._get_config().packed
+
+    @property
+    def wrap_callback(self) -> CallbackWrapper:
+        """The callback wrapper of this manager.
+
+        This can be set using :meth:`as_callback_wrapper`.
+        """
+        return self._wrap_callback
+
+    @wrap_callback.setter
+    def wrap_callback(self, wrapper: CallbackWrapper) -> None:
+        self._wrap_callback = wrapper
+        _invalidate_config()
+
+    @property
+    def handle_exception(self) -> ExceptionHandlerFunc:
+        """The exception handler of this manager.
+
+        This can be set using :meth:`as_exception_handler`.
+        """
+        return self._handle_exception
+
+    @handle_exception.setter
+    def handle_exception(self, handler: ExceptionHandlerFunc) -> None:
+        self._handle_exception = handler
+        _invalidate_config()
+
+    @property
+    def metrics(self) -> metrics_utils.Metrics | None:
+        """The metrics recorded by this manager, if enabled.
+
+        By default, this is :obj:`None`, meaning no metrics are recorded. To
+        enable metrics, set this to a new
+        :class:`~disnake_compass.internal.metrics.Metrics` instance.
+
+        If enabled, this records the duration of every stage of parsing and
+        invoking components, per component identifier, alongside counters for
+        unknown custom ids, deregistrations of components of stale modules,
+        and handled and unhandled exceptions. See
+        :class:`~disnake_compass.internal.metrics.Metrics` for details.
+
+        .. note::
+            Metrics are recorded by the manager that parses and invokes the
+            component, i.e. the manager that was registered to the client
+            through :meth:`add_to_client`. This is usually the root manager.
+        """
+        return self._metrics
+
+    @metrics.setter
+    def metrics(self, metrics: metrics_utils.Metrics | None) -> None:
+        self._metrics = metrics
+
+    @property
+    def dedupe(self) -> dedupe_utils.DedupeWindow | None:
+        """The window within which repeated clicks are suppressed, if enabled.
+
+        By default, this is :obj:`None`, meaning every click invokes the
+        component. If set, a click on a component by the same user on the same
+        message is acknowledged without invoking the component if another such
+        click is still being processed or started less than
+        :attr:`~disnake_compass.internal.dedupe.DedupeWindow.ttl` seconds ago.
+
+        .. note::
+            Like :attr:`metrics`, this only applies to the manager that was
+            registered to the client through :meth:`add_to_client`.
+        """
+        return self._dedupe
+
+    @dedupe.setter
+    def dedupe(self, window: dedupe_utils.DedupeWindow | None) -> None:
+        self._dedupe = window
+
+    @property
+    def decode_cache(self) -> factory_impl.DecodeCache | None:
+        """The cache in which parsed custom id parameters are stored, if enabled.
+
+        By default, this is :obj:`None`, meaning every custom id is parsed
+        anew. If set to a :class:`~disnake_compass.impl.factory.DecodeCache`,
+        the values parsed for components of which all parsers are pure (see
+        :class:`~disnake_compass.api.PureParser`) are stored, such that
+        repeated clicks on the same component skip parsing entirely.
+        Components with any impure field, e.g. a member, are always parsed.
+
+        The hit rate and number of evictions of the cache can be inspected
+        through its :attr:`~disnake_compass.internal.cache.FetchCache.stats`
+        to size it appropriately. As parsed values never go stale, entries of
+        a :class:`~disnake_compass.impl.factory.DecodeCache` do not expire by
+        default.
+
+        .. note::
+            Like :attr:`metrics`, this only applies to the manager that was
+            registered to the client through :meth:`add_to_client`.
+        """
+        return self._decode_cache
+
+    @decode_cache.setter
+    def decode_cache(self, cache: factory_impl.DecodeCache | None) -> None:
+        self._decode_cache = cache
+
+    @property
+    def auto_defer(self) -> deadline.AutoDefer | None:
+        """The settings for automatically deferring slow invocations, if enabled.
+
+        By default, this is :obj:`None`, meaning components must always
+        respond within three seconds by themselves. If set, a deadline timer
+        is started as soon as an interaction is found to be for a component of
+        this manager, and the interaction is deferred if it was not responded
+        to by the time the threshold is reached. This includes time spent
+        waiting for concurrency limits and parsing the custom id.
+
+        .. note::
+            Like :attr:`metrics`, this only applies to the manager that was
+            registered to the client through :meth:`add_to_client`.
+        """
+        return self._auto_defer
+
+    @auto_defer.setter
+    def auto_defer(self, auto_defer: deadline.AutoDefer | None) -> None:
+        self._auto_defer = auto_defer
+
+    @property
+    def concurrency_limit(self) -> concurrency.ConcurrencyLimit | None:
+        """The limit on concurrent invocations of components of this manager.
+
+        This limits the invocations of all components registered to this
+        manager or any of its children. Use :meth:`set_concurrency_limit` to
+        set this, or to limit a single component class instead.
+        """
+        return self._concurrency_limit
+
+    def set_concurrency_limit(
+        self,
+        limit: concurrency.ConcurrencyLimit | None,
+        /,
+        *,
+        component_type: RichComponentType | None = None,
+    ) -> None:
+        """Limit the number of concurrent invocations of components.
+
+        Invocations exceeding the limit are queued, rejected or dropped
+        depending on the :attr:`~disnake_compass.internal.concurrency.ConcurrencyLimit.policy`
+        of the limit. An invocation must pass the limit of its component class
+        and the limits of the manager it was registered to and all of its
+        parents, in that order.
+
+        .. note::
+            Queued invocations still have to be responded to within three
+            seconds of the interaction being created.
+
+        Parameters
+        ----------
+        limit:
+            The limit to set. Set this to :obj:`None` to remove the limit.
+        component_type:
+            The component class to limit. This must be registered to this
+            manager. If not provided, the limit applies to all components of
+            this manager.
+
+        """
+        if component_type is None:
+            self._concurrency_limit = limit
+        elif limit is None:
+            self._component_limits.pop(self.lookup_identifier(component_type), None)
+        else:
+            self._component_limits[self.lookup_identifier(component_type)] = limit
+
+        _invalidate_config()
 
     @property
     def parent(self) -> component_api.ComponentManager | None:  # noqa: D102
@@ -425,6 +702,7 @@ class ComponentManager(component_api.ComponentManager):
         *,
         count: omit.OmittedNoneOr[bool] = omit.Omitted,
         sep: omit.OmittedNoneOr[str] = omit.Omitted,
+        packed: omit.OmittedNoneOr[bool] = omit.Omitted,
     ) -> None:
         """Set configuration options on this manager."""
         if not omit.is_omitted(count):
@@ -433,6 +711,45 @@ class ComponentManager(component_api.ComponentManager):
         if not omit.is_omitted(sep):
             self._sep = sep
 
+        if not omit.is_omitted(packed):
+            self._packed = packed
+
+        _invalidate_config()
+
+    def _get_config(self) -> _ResolvedConfig:
+        # Resolve the effective configuration once, rather than walking the
+        # parents each time any configuration option is accessed.
+        config = self._resolved_config
+        if config is not None and config.generation == _config_generation:
+            return config
+
+        parents = tuple(_recurse_parents(self))
+        self._resolved_config = config = _ResolvedConfig(
+            # Read this only now, as walking the parents may create managers.
+            generation=_config_generation,
+            parents=parents,
+            count=_resolve_option(parents, "_count", _DEFAULT_COUNT),
+            sep=_resolve_option(parents, "_sep", _DEFAULT_SEP),
+            packed=_resolve_option(parents, "_packed", _DEFAULT_PACKED),
+            client=_resolve_option(parents, "_client", None),
+            callback_wrappers=tuple(
+                (manager, manager.wrap_callback)
+                for manager in reversed(parents)
+                if manager.wrap_callback is not default_callback_wrapper
+            ),
+            exception_handlers=tuple(
+                (manager, manager.handle_exception)
+                for manager in parents
+                if manager.is_root or manager.handle_exception is not default_exception_handler
+            ),
+            limiters=tuple(
+                manager
+                for manager in parents
+                if manager._concurrency_limit or manager._component_limits  # noqa: SLF001
+            ),
+        )
+        return config
+
     def make_identifier(self, component_type: RichComponentType, /) -> str:  # noqa: D102
         # <<docstring inherited from api.components.ComponentManager>>
 
@@ -441,14 +758,20 @@ class ComponentManager(component_api.ComponentManager):
     def get_identifier(self, custom_id: str, /) -> tuple[str, typing.Sequence[str]]:  # noqa: D102
         # <<docstring inherited from api.components.ComponentManager>>
 
-        name, *params = custom_id.split(self.sep)
+        sep = self.sep
+        name, found_sep, rest = custom_id.partition(sep)
+        params = rest.split(sep) if found_sep else []
 
-        if self.count and name.endswith(_COUNT_CHARS):
+        if self.count and name[-1:] in _COUNT_CHARS:
             # Count is always the single last character in the name part.
             return name[:-1], params
 
         return name, params
 
+    def _match_identifier(self, custom_id: str, /) -> _IdentifierMatch | None:
+        config = self._get_config()
+        return _match_identifier(self._components, custom_id, config.sep, config.count)
+
     def increment(self) -> str:  # noqa: D102
         count = _minimise_count(self._counter)
 
@@ -466,14 +789,82 @@ class ComponentManager(component_api.ComponentManager):
     async def make_custom_id(self, component: component_api.RichComponent, /) -> str:  # noqa: D102
         # <<docstring inherited from api.components.ComponentManager>>
 
+        rendered = _RENDERED_CUSTOM_IDS.get(None)
+        if rendered is not None:
+            custom_id = rendered.pop(id(component), None)
+            if custom_id is not None:
+                return custom_id
+
         identifier = self.lookup_identifier(type(component))
 
         if self.count:
             identifier = identifier + self.increment()
 
-        dumped_params = await component.get_factory().dump_params(component)
+        factory = component.get_factory()
+        if self.packed and isinstance(factory, factory_impl.ComponentFactory):
+            dumped_params = await factory.dump_params_packed(component)
+        else:
+            dumped_params = (await factory.dump_params(component)).values()
+
+        return self.sep.join([identifier, *dumped_params])
+
+    async def make_custom_ids(
+        self,
+        components: typing.Sequence[component_api.RichComponent],
+        /,
+    ) -> typing.Sequence[str]:
+        """Make custom ids for multiple components at once.
 
-        return self.sep.join([identifier, *dumped_params.values()])
+        This is equivalent to calling :meth:`make_custom_id` for each of the
+        provided components, except that equal values dumped by the same
+        parser are only dumped once. For example, if 25 buttons all store the
+        same member, the member is only dumped once.
+
+        Parameters
+        ----------
+        components:
+            The components for which to create custom ids.
+
+        Returns
+        -------
+        :class:`Sequence`[:class:`str`]
+            The custom ids, in the same order as the provided components.
+
+        """
+        return await self._make_custom_ids(components, {})
+
+    async def _make_custom_ids(
+        self,
+        components: typing.Sequence[component_api.RichComponent],
+        memo: factory_impl.DumpMemo,
+        /,
+    ) -> list[str]:
+        sep = self.sep
+        count = self.count
+        packed = self.packed
+        identifiers: dict[RichComponentType, str] = {}
+
+        custom_ids: list[str] = []
+        for component in components:
+            component_type = type(component)
+            identifier = identifiers.get(component_type)
+            if identifier is None:
+                identifier = identifiers[component_type] = self.lookup_identifier(component_type)
+
+            if count:
+                identifier = identifier + self.increment()
+
+            factory = component.get_factory()
+            if not isinstance(factory, factory_impl.ComponentFactory):
+                dumped_params = (await factory.dump_params(component)).values()
+            elif packed:
+                dumped_params = await factory.dump_params_packed(component, memo=memo)
+            else:
+                dumped_params = (await factory.dump_params(component, memo=memo)).values()
+
+            custom_ids.append(sep.join([identifier, *dumped_params]))
+
+        return custom_ids
 
     @typing_extensions.deprecated("Please use parse_raw_component(interaction.component) instead.")
     async def parse_message_interaction(  # noqa: D102
@@ -486,47 +877,144 @@ class ComponentManager(component_api.ComponentManager):
 
         raise NotImplementedError
 
-    async def _parse_raw_component(
+    def _prepare_raw_component(
         self,
         component: disnake.Button | disnake.BaseSelectMenu,
         /,
-    ) -> tuple[str, component_api.RichComponent] | tuple[None, None]:
+        match: _IdentifierMatch | None = None,
+    ) -> _PreparedComponent | None:
+        # Everything that needs to happen before the custom id params can be
+        # parsed, which notably does not need to await anything.
         custom_id = component.custom_id
         if not custom_id:
-            return None, None
+            return None
 
-        identifier, params = self.get_identifier(custom_id)
-        if identifier not in self._components:
-            return None, None
+        routed = self._route_custom_id(custom_id, match)
+        if routed is None:
+            return None
 
-        component_type = self._components[identifier]
-
-        module_data = self._module_data[identifier]
-        if not module_data.is_active():
-            # NOTE: This occurs if:
-            #       - The module on which the component is defined was unloaded.
-            #       - The module on which the component is defined was reloaded
-            #         and the component was never overwritten. It could either
-            #         have been removed, or simply no longer be registered. The
-            #         component *should* therefore be unresponsive.
-            #
-            #       Since we do not want to fire components that (to the user)
-            #       do not exist anymore, we should remove them from the
-            #       manager and return None.
-            self.deregister_component(identifier)
-            return None, None
+        identifier, component_type, params = routed
+        component_params = fields.get_layout(component_type).get_internal(component)
+        return identifier, component_type, params, component_params
 
+    def _prepare_modal(
+        self,
+        interaction: disnake.ModalInteraction[disnake.Client],
+        /,
+        match: _IdentifierMatch | None = None,
+    ) -> _PreparedComponent | None:
+        # Same as _prepare_raw_component, except that the component params are
+        # the values submitted through the modal.
+        routed = self._route_custom_id(interaction.custom_id, match)
+        if routed is None:
+            return None
+
+        identifier, component_type, params = routed
+        values = interaction.resolved_values
         component_params = {
-            field.name: getattr(component, field.name)
-            for field in fields.get_fields(component_type, kind=fields.FieldType.INTERNAL)
+            name: values[name] for name in fields.get_layout(component_type).modal if name in values
         }
+        return identifier, component_type, params, component_params
+
+    def _route_custom_id(
+        self,
+        custom_id: str,
+        /,
+        match: _IdentifierMatch | None = None,
+    ) -> tuple[str, RichComponentType, typing.Sequence[str]] | None:
+        # If the custom id was already matched by the client router, the
+        # match is reused instead of looking up the identifier again.
+        metrics = self._metrics
+        start = time.perf_counter() if metrics is not None else 0.0
+
+        if match is None:
+            match = self._match_identifier(custom_id)
+            if match is None:
+                if metrics is not None:
+                    metrics.increment("unknown_ids")
+                return None
+
+        identifier, end = match
+        component_type = self._components[identifier]
+
+        sep = self.sep
+        params = custom_id[end + len(sep) :].split(sep) if end < len(custom_id) else []
+
+        if metrics is not None:
+            metrics.observe(identifier, "route", time.perf_counter() - start)
+
+        return identifier, component_type, params
+
+    def _build_component(
+        self,
+        identifier: str,
+        component_type: RichComponentType,
+        params: typing.Sequence[str],
+        component_params: typing.Mapping[str, object],
+    ) -> typing.Awaitable[component_api.RichComponent]:
+        if self._metrics is not None:
+            return self._build_component_timed(
+                self._metrics, identifier, component_type, params, component_params
+            )
+
+        factory = component_type.get_factory()
+        if not isinstance(factory, factory_impl.ComponentFactory):
+            return factory.build_component(params, component_params=component_params)
+
+        if self.packed:
+            return factory.build_component_packed(
+                params, component_params, cache=self._decode_cache
+            )
+
+        return factory.build_component(params, component_params, cache=self._decode_cache)
+
+    async def _build_component_timed(
+        self,
+        metrics: metrics_utils.Metrics,
+        identifier: str,
+        component_type: RichComponentType,
+        params: typing.Sequence[str],
+        component_params: typing.Mapping[str, object],
+    ) -> component_api.RichComponent:
+        factory = component_type.get_factory()
+        start = time.perf_counter()
+
+        if not isinstance(factory, factory_impl.ComponentFactory):
+            component = await factory.build_component(params, component_params=component_params)
+            metrics.observe(identifier, "decode", time.perf_counter() - start)
+            return component
+
+        timings: dict[str, float] = {}
+        cache = self._decode_cache
+        if self.packed:
+            component = await factory.build_component_packed(
+                params, component_params, timings=timings, cache=cache
+            )
+        else:
+            component = await factory.build_component(
+                params, component_params, timings=timings, cache=cache
+            )
+
+        metrics.observe(identifier, "decode", time.perf_counter() - start)
+        for name, seconds in timings.items():
+            parser_name = type(factory.parsers[name]).__name__
+            metrics.observe(identifier, f"decode.{name}:{parser_name}", seconds)
+
+        return component
+
+    async def _parse_raw_component(
+        self,
+        component: disnake.Button | disnake.BaseSelectMenu,
+        /,
+    ) -> tuple[str, component_api.RichComponent] | tuple[None, None]:
+        prepared = self._prepare_raw_component(component)
+        if prepared is None:
+            return None, None
 
-        return (
-            identifier,
-            await component_type
-                .get_factory()
-                .build_component(params, component_params=component_params),
-        )  # fmt: skip
+        identifier, component_type, params, component_params = prepared
+        return identifier, await self._build_component(
+            identifier, component_type, params, component_params
+        )
 
     async def parse_raw_component(
         self,
@@ -556,6 +1044,61 @@ class ComponentManager(component_api.ComponentManager):
         _identifier, rich_component = await self._parse_raw_component(component)
         return rich_component
 
+    async def parse_raw_components(
+        self,
+        components: typing.Sequence[disnake.Button | disnake.BaseSelectMenu],
+        /,
+    ) -> typing.Sequence[component_api.RichComponent | None]:
+        """Parse multiple rich message components from disnake raw components.
+
+        This is equivalent to calling :meth:`parse_raw_component` for each of
+        the provided components, except that the components are parsed
+        concurrently. This is significantly faster for components with
+        parsers that may need to make API requests, such as
+        :class:`~disnake_compass.impl.parser.MemberParser`. Concurrent requests
+        for the same object are made only once.
+
+        .. note::
+            This method only works for components registered to this manager.
+
+        Parameters
+        ----------
+        components:
+            The raw message components that are to be turned into rich
+            components.
+
+        Returns
+        -------
+        :class:`Sequence`[:class:`RichComponent` | :obj:`None`]
+            The newly created components, in the same order as the provided
+            raw components. Components that could not be parsed into a rich
+            component registered to this manager are :obj:`None`.
+
+        """
+        rich_components: list[component_api.RichComponent | None] = [None] * len(components)
+
+        indices: list[int] = []
+        builds: list[typing.Awaitable[component_api.RichComponent]] = []
+        for index, component in enumerate(components):
+            prepared = self._prepare_raw_component(component)
+            if prepared is None:
+                continue
+
+            identifier, component_type, params, component_params = prepared
+            indices.append(index)
+            builds.append(
+                self._build_component(identifier, component_type, params, component_params),
+            )
+
+        if len(builds) == 1:
+            rich_components[indices[0]] = await builds[0]
+
+        elif builds:
+            for index, rich_component in zip(indices, await asyncio.gather(*builds), strict=True):
+                rich_components[index] = rich_component
+
+        return rich_components
+
     async def parse_message_components(
         self, components: typing.Sequence[disnake.components.MessageTopLevelComponent]
     ) -> tuple[
@@ -595,23 +1138,29 @@ class ComponentManager(component_api.ComponentManager):
             to modify them.
 
         """  # noqa: E501
-        rich_components: list[component_api.RichComponent] = []
-
         current_component, current_component_id = _COMPONENT_CTX.get((None, None))
         should_test = current_component is not None
 
-        ui_components = [_to_ui_component(component) for component in components]
+        # Collect all parseable components in layout order, skipping the
+        # component that is currently being invoked (if any) such that the
+        # user's modifications to it are retained.
+        raw_components: list[disnake.Button | disnake.BaseSelectMenu] = []
+        current_index: int | None = None
         for component in disnake.ui.walk_components(components):
             if should_test and getattr(component, "custom_id", None) == current_component_id:
-                assert current_component
                 should_test = False
-                rich_components.append(current_component)
+                current_index = len(raw_components)
 
             elif isinstance(component, (disnake.Button, disnake.BaseSelectMenu)):
-                new_component = await self.parse_raw_component(component)
-                if new_component is not None:
-                    rich_components.append(new_component)
+                raw_components.append(component)
+
+        parsed = await self.parse_raw_components(raw_components)
+        if current_index is not None:
+            parsed = [*parsed[:current_index], current_component, *parsed[current_index:]]
+
+        rich_components = [component for component in parsed if component is not None]
 
+        ui_components = [_to_ui_component(component) for component in components]
         return ui_components, rich_components
 
     async def update_layout(
@@ -651,18 +1200,32 @@ class ComponentManager(component_api.ComponentManager):
         rich_component = next(rich_component_iter)
         identifier = self.lookup_identifier(type(rich_component))
 
-        for component in disnake.ui.walk_components(layout):
-            if not (_has_custom_id(component) and component.custom_id.startswith(identifier)):
-                continue
+        # Render all custom ids in one pass, such that values shared between
+        # components only need to be dumped once. as_ui_component picks these
+        # up through make_custom_id.
+        rendered = await _render_custom_ids(rich_components)
+        token = _RENDERED_CUSTOM_IDS.set(rendered)
+
+        try:
+            for component in disnake.ui.walk_components(layout):
+                if not _has_custom_id(component):
+                    continue
+
+                match = self._match_identifier(component.custom_id)
+                if match is None or match[0] != identifier:
+                    continue
 
-            finalised = await rich_component.as_ui_component()
-            component.refresh_component(finalised._underlying)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+                finalised = await rich_component.as_ui_component()
+                component.refresh_component(finalised._underlying)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
 
-            rich_component = next(rich_component_iter, None)
-            if rich_component is None:
-                return
+                rich_component = next(rich_component_iter, None)
+                if rich_component is None:
+                    return
 
-            identifier = self.lookup_identifier(type(rich_component))
+                identifier = self.lookup_identifier(type(rich_component))
+
+        finally:
+            _RENDERED_CUSTOM_IDS.reset(token)
 
     # Identifier and component: function call, return component
     @typing.overload
@@ -758,10 +1321,19 @@ class ComponentManager(component_api.ComponentManager):
                     )
                     raise RuntimeError(message)
 
-                # TODO: Pre-emptively remove all components that were registered
-                #       to the module that just went out-of-scope.
+            module_entry = self._module_index.get(module_data.name)
+            if module_entry is None or module_entry[0] != module_data.id:
+                # This is the first component of a new version of this module.
+                # Pre-emptively remove all other components that were
+                # registered by a previous version, as the reloaded module may
+                # no longer define them.
+                if module_entry is not None:
+                    self._purge_stale(module_data, module_entry[1], resolved_identifier)
+
+                module_entry = self._module_index[module_data.name] = (module_data.id, set())
 
             self._module_data[resolved_identifier] = module_data
+            module_entry[1].add(resolved_identifier)
 
         # Register to current manager and all parent managers.
         # for manager in _recurse_parents(self):
@@ -804,23 +1376,88 @@ class ComponentManager(component_api.ComponentManager):
             self.parent.deregister_component(identifier)
         else:
             # Only root has module data now.
-            del self._module_data[identifier]
+            module_data = self._module_data.pop(identifier)
+            module_entry = self._module_index.get(module_data.name)
+            if module_entry is not None and module_entry[0] == module_data.id:
+                module_identifiers = module_entry[1]
+                module_identifiers.discard(identifier)
+                if not module_identifiers:
+                    del self._module_index[module_data.name]
+
+    def _purge_stale(self, module_data: _ModuleData, identifiers: set[str], keep: str) -> None:
+        # Deregister the components of a previous version of a module, except
+        # for the component that is currently being re-registered.
+        stale = [identifier for identifier in identifiers if identifier != keep]
+        for identifier in stale:
+            # Count the deregistration on the manager that owned the component.
+            registrar = self._components[identifier].get_manager()
+            self.deregister_component(identifier)
+            if isinstance(registrar, ComponentManager) and registrar.metrics is not None:
+                registrar.metrics.increment("stale_deregistrations")
+
+        if stale:
+            di.evict_module(module_data.name)
+            parser_base.evict_parsers(module_data.name)
+
+    def purge_module(self, name: str, /) -> typing.Sequence[str]:
+        r"""Deregister all components defined in a module.
+
+        This is meant to be called when an extension is unloaded, such that
+        its components immediately become unresponsive. Components of a
+        module that is reloaded are purged automatically once the reloaded
+        module registers its first component. Components of a module that is
+        unloaded without being reloaded, or that is reloaded but no longer
+        registers any components, however, stay registered and thus keep
+        responding to interactions until this is called.
+
+        Parameters
+        ----------
+        name
+            The name of the module. Components of submodules of this module
+            are purged, too.
+
+        Returns
+        -------
+        :class:`~typing.Sequence`\[:class:`str`]
+            The identifiers of the components that were deregistered. Only
+            components that are registered to this manager or any of its
+            children are deregistered.
+
+        """
+        module_index = get_manager(_ROOT)._module_index  # noqa: SLF001
+        identifiers = [
+            identifier
+            for module, (_, module_identifiers) in module_index.items()
+            if module == name or module.startswith(name + ".")
+            for identifier in module_identifiers
+            if identifier in self._components
+        ]
+        for identifier in identifiers:
+            self.deregister_component(identifier)
+
+        di.evict_module(name)
+        parser_base.evict_parsers(name)
+        return identifiers
 
     def add_to_client(self, client: disnake.Client, /) -> None:  # noqa: D102
         # <<docstring inherited from api.components.ComponentManager>>
 
-        # Ensure we don't duplicate the listeners.
-        if (
-            self.invoke_component in client.extra_events.get(_COMPONENT_EVENT, [])
-            # or self.invoke_component in client.extra_events.get(_MODAL_EVENT, [])
-        ):
+        # All managers registered to the same client share a single router,
+        # such that every interaction is only routed and invoked once.
+        router = _ROUTERS.get(client)
+        if router is None:
+            router = _ROUTERS[client] = _ClientRouter()
+            client.add_listener(router.invoke_component, _COMPONENT_EVENT)
+            client.add_listener(router.invoke_modal, _MODAL_EVENT)
+
+        if self in router.managers:
             message = "This component manager is already registered to this client."
             raise RuntimeError(message)
 
-        client.add_listener(self.invoke_component, _COMPONENT_EVENT)
-        # client.add_listener(self.invoke, _MODAL_EVENT)  # noqa: ERA001
+        router.managers.add(self)
 
         self._client = client
+        _invalidate_config()
 
     @typing_extensions.deprecated("Please use add_to_client() instead.")
     def add_to_bot(self, bot: disnake.Client, /) -> None:  # noqa: D102
@@ -829,17 +1466,16 @@ class ComponentManager(component_api.ComponentManager):
     def remove_from_client(self, client: disnake.Client, /) -> None:  # noqa: D102
         # <<docstring inherited from api.components.ComponentManager>>
 
-        # client.remove_listener silently ignores if the event doesn't exist,
-        # so we manually handle raising an exception for it.
-        if not (
-            self.invoke_component in client.extra_events.get(_COMPONENT_EVENT, [])  # noqa: E713
-            # and self.invoke_component in client.extra_events.get(_MODAL_EVENT, [])
-        ):
+        router = _ROUTERS.get(client)
+        if router is None or self not in router.managers:
             message = "This component manager is not yet registered to this client."
             raise RuntimeError(message)
 
-        client.remove_listener(self.invoke_component, _COMPONENT_EVENT)
-        # client.remove_listener(self.invoke_component, _MODAL_EVENT)  # noqa: ERA001
+        router.managers.remove(self)
+        if not router.managers:
+            client.remove_listener(router.invoke_component, _COMPONENT_EVENT)
+            client.remove_listener(router.invoke_modal, _MODAL_EVENT)
+            del _ROUTERS[client]
 
     @typing_extensions.deprecated("Please use remove_from_client() instead.")
     def remove_from_bot(self, bot: disnake.Client, /) -> None:  # noqa: D102
@@ -873,9 +1509,9 @@ class ComponentManager(component_api.ComponentManager):
 
             @manager.as_dependency_provider
             async def provider(manager, *dependencies):
-                tokens = di.register_dependencies(*dependencies)
+                token = di.register_dependencies(*dependencies)
                 yield
-                di.reset_dependencies(tokens)
+                di.reset_dependencies(token)
 
         Parameters
         ----------
@@ -1007,51 +1643,175 @@ class ComponentManager(component_api.ComponentManager):
         self,
         interaction: disnake.MessageInteraction[disnake.Client],
         /,
+        match: _IdentifierMatch | None = None,
     ) -> None:
         # First, check if there even is a component.
         raw_component = interaction.component
         if not raw_component:
             return
 
-        # First, we check if the component is managed.
-        identifier, component = await self._parse_raw_component(raw_component)
-        if not (component and identifier):
-            # If the component was found, the manager is guaranteed to be
-            # defined but we need the extra check for type-safety.
+        # Next, we check if the component is managed.
+        prepared = self._prepare_raw_component(raw_component, match)
+        if prepared is None:
             return
 
-        # Store all managers that are aware of the invoked component in a list
-        # to be able to loop over them later.
-        manager = component.get_manager()
+        await self._invoke_prepared(interaction, prepared)
+
+    async def _invoke_modal(
+        self,
+        interaction: disnake.ModalInteraction[disnake.Client],
+        /,
+        match: _IdentifierMatch | None = None,
+    ) -> None:
+        prepared = self._prepare_modal(interaction, match)
+        if prepared is None:
+            return
+
+        await self._invoke_prepared(interaction, prepared)
+
+    async def _invoke_prepared(
+        self,
+        interaction: _AnyInteraction,
+        prepared: _PreparedComponent,
+    ) -> None:
+        window = self._dedupe
+        if window is None:
+            await self._dispatch_component(interaction, prepared)
+            return
+
+        message_id = interaction.message.id if interaction.message else None
+        key = (message_id, interaction.data.custom_id, interaction.author.id)
+        if not window.begin(key):
+            # Acknowledge repeated clicks without updating the message.
+            if self._metrics is not None:
+                self._metrics.increment("duplicates")
+
+            await interaction.response.defer()
+            return
+
+        try:
+            await self._dispatch_component(interaction, prepared)
+        finally:
+            window.end(key)
+
+    async def _dispatch_component(
+        self,
+        interaction: _AnyInteraction,
+        prepared: _PreparedComponent,
+    ) -> None:
+        # The wrappers, handlers and limits of all managers that are aware of
+        # the invoked component are compiled ahead of time.
+        component_type = prepared[1]
+        manager = component_type.get_manager()
         assert isinstance(manager, ComponentManager)
-        managers = list(_recurse_parents(manager))
+        config = manager._get_config()  # noqa: SLF001
 
-        assert interaction.component.custom_id
-        ctx_value = (component, interaction.component.custom_id)
-        component_ctx_token = _COMPONENT_CTX.set(ctx_value)
+        timer = self._auto_defer.start(interaction) if self._auto_defer is not None else None
+        try:
+            await self._limit_component(interaction, prepared, config, timer)
+        finally:
+            if timer is not None:
+                timer.cancel()
 
+    async def _limit_component(
+        self,
+        interaction: _AnyInteraction,
+        prepared: _PreparedComponent,
+        config: _ResolvedConfig,
+        timer: deadline.DeferTimer | None,
+    ) -> None:
+        if not config.limiters:
+            await self._run_component(interaction, prepared, config, timer)
+            return
+
+        identifier = prepared[0]
+        limits = [
+            limit
+            for limiter in config.limiters
+            for limit in limiter._get_limits(identifier)  # noqa: SLF001
+        ]
+        key = (interaction.data.custom_id, interaction.author.id)
+        acquired: list[concurrency.ConcurrencyLimit] = []
         try:
-            async with contextlib.AsyncExitStack() as stack:
-                # Before invocation, we wrap the callback in all parents'
-                # callback wrappers from root to the registrar.
-                for manager in reversed(managers):
-                    await stack.enter_async_context(
-                        manager.wrap_callback(manager, component, interaction),
-                    )
+            for limit in limits:
+                overflow = await limit.acquire(key)
+                if overflow is not None:
+                    if self._metrics is not None:
+                        dropped = overflow is concurrency.OverflowPolicy.DROP_DUPLICATES
+                        self._metrics.increment("dropped" if dropped else "rejected")
+
+                    if timer is not None:
+                        timer.cancel()
+                        await timer.wait()
 
-                # If none raised, we run the callback.
-                await component.callback(interaction)
+                    await limit.respond_overflow(interaction, overflow)
+                    return
+
+                acquired.append(limit)
+
+            await self._run_component(interaction, prepared, config, timer)
+
+        finally:
+            for limit in reversed(acquired):
+                limit.release(key)
+
+    def _get_limits(self, identifier: str) -> typing.Iterator[concurrency.ConcurrencyLimit]:
+        # Per-class limits come before per-manager limits, such that limits are
+        # always acquired in the same order.
+        component_limit = self._component_limits.get(identifier)
+        if component_limit is not None:
+            yield component_limit
+
+        if self._concurrency_limit is not None:
+            yield self._concurrency_limit
+
+    async def _run_component(
+        self,
+        interaction: _AnyInteraction,
+        prepared: _PreparedComponent,
+        config: _ResolvedConfig,
+        timer: deadline.DeferTimer | None,
+    ) -> None:
+        identifier, component_type, params, component_params = prepared
+        component = await self._build_component(
+            identifier, component_type, params, component_params
+        )
+
+        if timer is not None:
+            # Make sure a deferral started while parsing does not race any
+            # response made by the callback.
+            await timer.wait()
+
+        ctx_value = (component, interaction.data.custom_id)
+        component_ctx_token = _COMPONENT_CTX.set(ctx_value)
+
+        metrics = self._metrics
+        start = time.perf_counter()
+        try:
+            entered, called = await _call_wrapped(component, interaction, config.callback_wrappers)
 
         except Exception as exception:  # noqa: BLE001
             # Blanket exception catching is desired here as it's meant to
             # redirect all non-system errors to the error handler.
+            start = time.perf_counter()
 
             # Call all error handlers in order from registrar to root.
             # Short-circuit if any handler returns True.
-            for manager in managers:
-                if await manager.handle_exception(manager, component, interaction, exception):
+            handled = False
+            for manager, handler in config.exception_handlers:
+                if await handler(manager, component, interaction, exception):
+                    handled = True
                     break
 
+            if metrics is not None:
+                metrics.observe(identifier, "exception", time.perf_counter() - start)
+                metrics.increment("handled_exceptions" if handled else "unhandled_exceptions")
+
+        else:
+            if metrics is not None:
+                metrics.observe(identifier, "wrap", entered - start)
+                metrics.observe(identifier, "callback", called - entered)
+
         finally:
             _COMPONENT_CTX.reset(component_ctx_token)
 
@@ -1064,22 +1824,58 @@ class ComponentManager(component_api.ComponentManager):
     ) -> None:
         # <<docstring inherited from api.components.ComponentManager>>
 
-        if with_di:
-            async with self.set_invocation_dependencies(
-                self,
-                interaction,
-                interaction.guild,
-                interaction.bot,
-                interaction.channel,
-                interaction.author,
-                # XXX:  Potential edge-case here where a parser needs a user
-                #       but we can only provide a member.
-            ):
-                await self._invoke_component(interaction)
-
-        else:
+        async with self._invocation_dependencies(interaction, with_di=with_di):
             await self._invoke_component(interaction)
 
+    async def invoke_modal(
+        self,
+        interaction: disnake.ModalInteraction[disnake.Client],
+        /,
+        *,
+        with_di: bool = True,
+    ) -> None:
+        """Try to invoke a modal with the given interaction.
+
+        This is the modal counterpart of :meth:`invoke_component`. Modals go
+        through the same routing, parsing, callback wrappers and exception
+        handlers as message components.
+
+        Parameters
+        ----------
+        interaction
+            The modal interaction with which to try to invoke a modal callback.
+        with_di
+            Whether to register the dependencies of the interaction while
+            invoking the modal.
+
+        """
+        async with self._invocation_dependencies(interaction, with_di=with_di):
+            await self._invoke_modal(interaction)
+
+    @contextlib.asynccontextmanager
+    async def _invocation_dependencies(
+        self,
+        interaction: _AnyInteraction,
+        /,
+        *,
+        with_di: bool,
+    ) -> typing.AsyncGenerator[None, None]:
+        if not with_di:
+            yield
+            return
+
+        async with self.set_invocation_dependencies(
+            self,
+            interaction,
+            interaction.guild,
+            interaction.bot,
+            interaction.channel,
+            interaction.author,
+            # XXX:  Potential edge-case here where a parser needs a user
+            #       but we can only provide a member.
+        ):
+            yield
+
     def make_button(  # noqa: PLR0913
         self,
         identifier: str,
@@ -1237,18 +2033,171 @@ class ComponentManager(component_api.ComponentManager):
 _MANAGER_STORE: typing.Final[dict[str, ComponentManager]] = {}
 
 
+class _ClientRouter:
+    # Owns the listeners of a client, dispatching every interaction to the one
+    # registered manager that is closest to the registrar of the component.
+
+    __slots__: typing.Sequence[str] = ("_formats", "_generation", "managers")
+
+    managers: set[ComponentManager]
+    _formats: tuple[tuple[str, bool], ...]
+    _generation: int
+
+    def __init__(self) -> None:
+        self.managers = set()
+        self._formats = ()
+        self._generation = -1
+
+    def _get_formats(self) -> tuple[tuple[str, bool], ...]:
+        # The distinct (sep, count) configurations of all registered managers.
+        # In practice, this almost always contains a single entry.
+        if self._generation != _config_generation:
+            self._formats = tuple({(manager.sep, manager.count) for manager in self.managers})
+            self._generation = _config_generation
+
+        return self._formats
+
+    def resolve(
+        self,
+        custom_id: str,
+    ) -> tuple[ComponentManager, _IdentifierMatch | None] | None:
+        # Returns the manager to dispatch to, and the identifier match if the
+        # manager can reuse it, i.e. if it matches custom ids the same way.
+        # The root manager is aware of all components, so its components serve
+        # as the index of all identifiers.
+        root = get_manager(_ROOT)
+        components = root.components
+        for custom_id_format in self._get_formats():
+            match = _match_identifier(components, custom_id, *custom_id_format)
+            if match is not None:
+                break
+        else:
+            if root.metrics is not None:
+                root.metrics.increment("unknown_ids")
+            return None
+
+        registrar = components[match[0]].get_manager()
+        assert isinstance(registrar, ComponentManager)
+        for manager in _recurse_parents(registrar):
+            if manager in self.managers:
+                reusable = (manager.sep, manager.count) == custom_id_format
+                return manager, match if reusable else None
+
+        return None
+
+    async def invoke_component(
+        self,
+        interaction: disnake.MessageInteraction[disnake.Client],
+        /,
+    ) -> None:
+        custom_id = interaction.data.custom_id
+        resolved = self.resolve(custom_id) if custom_id else None
+        if resolved is not None:
+            manager, match = resolved
+            async with manager._invocation_dependencies(interaction, with_di=True):  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+                await manager._invoke_component(interaction, match)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+    async def invoke_modal(
+        self,
+        interaction: disnake.ModalInteraction[disnake.Client],
+        /,
+    ) -> None:
+        resolved = self.resolve(interaction.custom_id)
+        if resolved is not None:
+            manager, match = resolved
+            async with manager._invocation_dependencies(interaction, with_di=True):  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+                await manager._invoke_modal(interaction, match)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+
+
+_ROUTERS: weakref.WeakKeyDictionary[disnake.Client, _ClientRouter] = weakref.WeakKeyDictionary()
+
+
+async def _call_wrapped(
+    component: component_api.RichComponent,
+    interaction: _AnyInteraction,
+    wrappers: typing.Sequence[tuple[ComponentManager, CallbackWrapper]],
+) -> tuple[float, float]:
+    # Run the callback wrapped in the provided wrappers, from first to last.
+    # Returns the times at which the callback was entered and finished.
+    # Default wrappers are no-ops, so they are skipped entirely.
+    if not wrappers:
+        entered = time.perf_counter()
+        await component.callback(interaction)
+        return entered, time.perf_counter()
+
+    if len(wrappers) == 1:
+        manager, wrapper = wrappers[0]
+        async with wrapper(manager, component, interaction):
+            entered = time.perf_counter()
+            await component.callback(interaction)
+            return entered, time.perf_counter()
+
+    async with contextlib.AsyncExitStack() as stack:
+        for manager, wrapper in wrappers:
+            await stack.enter_async_context(wrapper(manager, component, interaction))
+
+        # If none raised, we run the callback.
+        entered = time.perf_counter()
+        await component.callback(interaction)
+        return entered, time.perf_counter()
+
+
+async def _render_custom_ids(
+    components: typing.Sequence[component_api.RichComponent],
+) -> dict[int, str]:
+    # Render the custom ids of the provided components using their respective
+    # managers, sharing dumped values between all of them.
+    by_manager: dict[ComponentManager, list[component_api.RichComponent]] = {}
+    for component in components:
+        manager = component.get_manager()
+        # Managers of other implementations render their own custom ids.
+        if isinstance(manager, ComponentManager):
+            by_manager.setdefault(manager, []).append(component)
+
+    memo: factory_impl.DumpMemo = {}
+    rendered: dict[int, str] = {}
+    for manager, group in by_manager.items():
+        custom_ids = await manager._make_custom_ids(group, memo)  # pyright: ignore[reportPrivateUsage]  # noqa: SLF001
+        rendered.update(zip(map(id, group), custom_ids, strict=True))
+
+    return rendered
+
+
+def _match_identifier(
+    components: typing.Mapping[str, RichComponentType],
+    custom_id: str,
+    sep: str,
+    count: bool,  # noqa: FBT001
+) -> _IdentifierMatch | None:
+    # Resolve the identifier of a custom id without splitting the params,
+    # such that foreign custom ids are rejected with a single dict lookup.
+    # Returns the identifier and the index of the first separator.
+    end = custom_id.find(sep)
+    if end == -1:
+        end = len(custom_id)
+
+    name = custom_id[:end]
+    if count and name[-1:] in _COUNT_CHARS:
+        name = name[:-1]
+
+    if name not in components:
+        return None
+
+    return name, end
+
+
 def _recurse_parents(manager: ComponentManager) -> typing.Iterator[ComponentManager]:
     yield manager
     while manager := manager.parent:  # pyright: ignore[reportAssignmentType]
         yield manager
 
 
-def _recurse_parents_getattr(
-    manager: ComponentManager,
+def _resolve_option(
+    managers: typing.Iterable[ComponentManager],
     attribute: str,
     default: T,
 ) -> T:
-    for parent in _recurse_parents(manager):
+    for parent in managers:
         value = getattr(parent, attribute)
         if value is not None:
             return value
@@ -1305,6 +2254,7 @@ def get_manager(name: str | None = None) -> ComponentManager:
         return _MANAGER_STORE[name]
 
     _MANAGER_STORE[name] = manager = ComponentManager(name)
+    _invalidate_config()
 
     if "." in name:
         root, _ = name.rsplit(".", 1)
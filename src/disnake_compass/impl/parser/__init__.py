@@ -2,15 +2,144 @@
 # pyright: reportWildcardImportFromLibrary = false
 # ^ This is a false positive as it is confused with site-packages' disnake.
 
-"""Implementations for all kinds of parser classes."""
-
-from disnake_compass.impl.parser.base import *
-from disnake_compass.impl.parser.builtins import *
-from disnake_compass.impl.parser.channel import *
-from disnake_compass.impl.parser.datetime import *
-from disnake_compass.impl.parser.emoji import *
-from disnake_compass.impl.parser.enum import *
-from disnake_compass.impl.parser.guild import *
-from disnake_compass.impl.parser.message import *
-from disnake_compass.impl.parser.snowflake import *
-from disnake_compass.impl.parser.user import *
+"""Implementations for all kinds of parser classes.
+
+To keep importing disnake-compass cheap, the parser implementations are only
+imported once they are first accessed, or once :func:`.get_parser` is first
+used.
+"""
+
+import importlib
+import typing
+
+from disnake_compass.impl.parser.base import Parser as Parser
+from disnake_compass.impl.parser.base import SyncParser as SyncParser
+from disnake_compass.impl.parser.base import evict_parsers as evict_parsers
+from disnake_compass.impl.parser.base import get_parser as get_parser
+from disnake_compass.impl.parser.base import is_packable_parser as is_packable_parser
+from disnake_compass.impl.parser.base import is_pure_parser as is_pure_parser
+from disnake_compass.impl.parser.base import is_sync_parser as is_sync_parser
+from disnake_compass.impl.parser.base import register_parser as register_parser
+from disnake_compass.impl.parser.base import set_parser_interning as set_parser_interning
+
+if typing.TYPE_CHECKING:
+    from disnake_compass.impl.parser.builtins import *
+    from disnake_compass.impl.parser.channel import *
+    from disnake_compass.impl.parser.datetime import *
+    from disnake_compass.impl.parser.emoji import *
+    from disnake_compass.impl.parser.enum import *
+    from disnake_compass.impl.parser.guild import *
+    from disnake_compass.impl.parser.lazy import *
+    from disnake_compass.impl.parser.message import *
+    from disnake_compass.impl.parser.snowflake import *
+    from disnake_compass.impl.parser.user import *
+
+_LAZY_ATTRIBUTES: typing.Final[typing.Mapping[str, str]] = {
+    name: module
+    for module, names in {
+        "builtins": (
+            "BoolParser",
+            "CollectionParser",
+            "FloatParser",
+            "IntParser",
+            "StringParser",
+            "TupleParser",
+            "UnionParser",
+        ),
+        "channel": (
+            "CategoryParser",
+            "DMChannelParser",
+            "ForumChannelParser",
+            "GroupChannelParser",
+            "GuildChannelParser",
+            "NewsChannelParser",
+            "PartialMessageableParser",
+            "PrivateChannelParser",
+            "StageChannelParser",
+            "TextChannelParser",
+            "ThreadParser",
+            "VoiceChannelParser",
+        ),
+        "datetime": (
+            "DateParser",
+            "DatetimeParser",
+            "TimeParser",
+            "TimedeltaParser",
+            "TimezoneParser",
+        ),
+        "emoji": ("EmojiParser", "PartialEmojiParser", "StickerParser"),
+        "enum": ("EnumParser", "FlagParser"),
+        "guild": ("GuildParser", "InviteParser", "RoleParser"),
+        "lazy": ("Lazy", "LazyParser"),
+        "message": ("MessageParser", "PartialMessageParser"),
+        "snowflake": ("SnowflakeParser",),
+        "user": ("MemberParser", "UserParser"),
+    }.items()
+    for name in names
+}
+
+__all__: typing.Sequence[str] = (
+    "BoolParser",
+    "CategoryParser",
+    "CollectionParser",
+    "DMChannelParser",
+    "DateParser",
+    "DatetimeParser",
+    "EmojiParser",
+    "EnumParser",
+    "FlagParser",
+    "FloatParser",
+    "ForumChannelParser",
+    "GroupChannelParser",
+    "GuildChannelParser",
+    "GuildParser",
+    "IntParser",
+    "InviteParser",
+    "Lazy",
+    "LazyParser",
+    "MemberParser",
+    "MessageParser",
+    "NewsChannelParser",
+    "Parser",
+    "PartialEmojiParser",
+    "PartialMessageParser",
+    "PartialMessageableParser",
+    "PrivateChannelParser",
+    "RoleParser",
+    "SnowflakeParser",
+    "StageChannelParser",
+    "StickerParser",
+    "StringParser",
+    "SyncParser",
+    "TextChannelParser",
+    "ThreadParser",
+    "TimeParser",
+    "TimedeltaParser",
+    "TimezoneParser",
+    "TupleParser",
+    "UnionParser",
+    "UserParser",
+    "VoiceChannelParser",
+    "evict_parsers",
+    "get_parser",
+    "is_packable_parser",
+    "is_pure_parser",
+    "is_sync_parser",
+    "register_parser",
+    "set_parser_interning",
+)
+
+
+def __getattr__(name: str) -> object:
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
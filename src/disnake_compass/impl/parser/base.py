@@ -2,19 +2,25 @@
 
 from __future__ import annotations
 
+import importlib
 import typing
+import weakref
 
 import attrs
+import typing_extensions
 
 from disnake_compass.api import parser as parser_api
 
-if typing.TYPE_CHECKING:
-    import typing_extensions
-
 __all__: typing.Sequence[str] = (
     "Parser",
+    "SyncParser",
+    "evict_parsers",
     "get_parser",
+    "is_packable_parser",
+    "is_pure_parser",
+    "is_sync_parser",
     "register_parser",
+    "set_parser_interning",
 )
 
 ParserT = typing.TypeVar("ParserT", bound=parser_api.Parser)
@@ -26,6 +32,34 @@ _REV_PARSERS: dict[
 ] = {}
 _PARSER_PRIORITY: dict[type[parser_api.Parser[typing.Any]], int] = {}
 
+# Submodules containing the default parser implementations. These are only
+# imported once they are needed, see _load_default_parsers.
+_DEFAULT_PARSER_MODULES: typing.Final[tuple[str, ...]] = (
+    "builtins",
+    "channel",
+    "datetime",
+    "emoji",
+    "enum",
+    "guild",
+    "lazy",
+    "message",
+    "snowflake",
+    "user",
+)
+_default_parsers_loaded: bool = False
+
+# Resolution caches, cleared whenever a parser is registered. Types are held
+# weakly, such that e.g. classes of reloaded extensions can be collected.
+_PARSER_TYPE_CACHE: weakref.WeakKeyDictionary[type, type[parser_api.Parser[typing.Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+# Interned parsers generally reference the type they parse (e.g. the enum
+# class of an enum parser), so holding types weakly would not allow them to be
+# collected. Instead, entries of unloaded modules are evicted explicitly
+# through evict_parsers.
+_PARSER_CACHE: dict[typing.Hashable, parser_api.Parser[typing.Any]] = {}
+_intern_parsers: bool = False
+
 
 def _issubclass(
     cls: type,
@@ -41,6 +75,22 @@ def _issubclass(
         return cls is class_or_tuple
 
 
+def _load_default_parsers() -> None:
+    # Import all default parser implementations such that they register
+    # themselves. This is deferred until a parser is first needed to keep
+    # importing disnake-compass itself cheap.
+    global _default_parsers_loaded  # noqa: PLW0603
+
+    if _default_parsers_loaded:
+        return
+
+    # Set this first, as the imported modules register their parsers.
+    _default_parsers_loaded = True
+    package, _ = __name__.rsplit(".", 1)
+    for module in _DEFAULT_PARSER_MODULES:
+        importlib.import_module(f"{package}.{module}")
+
+
 def register_parser(
     parser: type[parser_api.Parser[parser_api.ParserType]],
     *types: type[parser_api.ParserType],
@@ -67,6 +117,18 @@ def register_parser(
         Whether or not to overwrite existing defaults. Defaults to ``True``.
 
     """
+    # Ensure user-registered parsers are not overwritten by the defaults
+    # when those are loaded later.
+    _load_default_parsers()
+    _register_parser(parser, *types, priority=priority, force=force)
+
+
+def _register_parser(
+    parser: type[parser_api.Parser[parser_api.ParserType]],
+    *types: type[parser_api.ParserType],
+    priority: int = 0,
+    force: bool = True,
+) -> None:
     # This allows e.g. is_default_for=(Tuple[Any, ...],) so pyright doesn't complain.
     # The stored type will then still be tuple, as intended.
     types = tuple(typing.get_origin(type_) or type_ for type_ in types)
@@ -77,13 +139,79 @@ def register_parser(
     for type_ in types:
         setter(_PARSERS, type_, parser)
 
+    _PARSER_TYPE_CACHE.clear()
+    _PARSER_CACHE.clear()
+
+
+def set_parser_interning(enabled: bool) -> None:  # noqa: FBT001
+    """Set whether :func:`get_parser` should return shared parser instances.
+
+    When enabled, :func:`get_parser` returns the same parser instance for
+    every call with the same type, including the inner parsers of e.g.
+    tuples and unions. This greatly reduces the time spent creating parsers
+    when many component classes with similar fields are defined.
+
+    This is disabled by default, as it means that modifying a parser returned
+    by :func:`get_parser` affects every field that shares it.
+
+    Parameters
+    ----------
+    enabled:
+        Whether to enable parser interning.
+
+    """
+    global _intern_parsers  # noqa: PLW0603
+
+    _intern_parsers = enabled
+    _PARSER_CACHE.clear()
+
+
+def _references_module(annotation: object, name: str) -> bool:
+    module = getattr(annotation, "__module__", None)
+    if isinstance(module, str) and (module == name or module.startswith(name + ".")):
+        return True
+
+    return any(_references_module(arg, name) for arg in typing.get_args(annotation))
+
+
+def evict_parsers(name: str) -> int:
+    """Evict all cached parsers and parser types for types of a module.
+
+    This drops any parsers interned through :func:`set_parser_interning` for
+    types defined in the module, including e.g. unions or tuples containing
+    such types, such that the types of an unloaded module are not kept alive.
+
+    Parameters
+    ----------
+    name:
+        The name of the module. Submodules of this module are evicted too.
+
+    Returns
+    -------
+    :class:`int`
+        The number of cached entries that were evicted.
+
+    """
+    evicted = 0
+    for type_ in list(_PARSER_CACHE):
+        if _references_module(type_, name):
+            del _PARSER_CACHE[type_]
+            evicted += 1
+
+    for type_ in list(_PARSER_TYPE_CACHE.keys()):
+        if _references_module(type_, name):
+            del _PARSER_TYPE_CACHE[type_]
+            evicted += 1
+
+    return evicted
+
 
 def register_parser_for(
     *is_default_for: type[typing.Any],
     priority: int = 0,
 ) -> typing.Callable[[type[ParserT]], type[ParserT]]:
     def wrapper(cls: type[ParserT]) -> type[ParserT]:
-        register_parser(cls, *is_default_for, priority=priority)
+        _register_parser(cls, *is_default_for, priority=priority)
         return cls
 
     return wrapper
@@ -96,6 +224,9 @@ def _get_parser_type(
     if type_ in _PARSERS:
         return _PARSERS[type_]
 
+    if type_ in _PARSER_TYPE_CACHE:
+        return _PARSER_TYPE_CACHE[type_]
+
     # Slow lookup for subclasses of existing types...
     best_entry = max(
         (entry for entry, parser_types in _REV_PARSERS.items() if _issubclass(type_, parser_types)),
@@ -103,13 +234,13 @@ def _get_parser_type(
         key=_PARSER_PRIORITY.__getitem__,
     )
     if best_entry is not None:
+        _PARSER_TYPE_CACHE[type_] = best_entry
         return best_entry
 
     message = f"No parser available for type {type_.__name__!r}."
     raise TypeError(message)
 
 
-# TODO: Maybe cache this?
 def get_parser(  # noqa: D417
     type_: type[parser_api.ParserType],
 ) -> parser_api.Parser[parser_api.ParserType]:
@@ -117,6 +248,10 @@ def get_parser(  # noqa: D417
 
     Note that type annotations such as ``Union[int, str]`` are also valid.
 
+    The parser type resolved for each type is cached. If parser interning is
+    enabled through :func:`set_parser_interning`, the parser instances
+    themselves are cached, too.
+
     Parameters
     ----------
     type\_:
@@ -137,6 +272,25 @@ def get_parser(  # noqa: D417
     #       be neat to be able to pick between strictly sync/async parsers
     #       (mainly for the purpose of not making api requests); but perhaps
     #       allowing the user to pass a filter function could be cool?
+    _load_default_parsers()
+
+    if _intern_parsers:
+        try:
+            return _PARSER_CACHE[type_]
+        except KeyError:
+            pass
+        except TypeError:  # Unhashable annotation, e.g. with Annotated metadata.
+            return _make_parser(type_)
+
+        parser = _PARSER_CACHE[type_] = _make_parser(type_)
+        return parser
+
+    return _make_parser(type_)
+
+
+def _make_parser(
+    type_: type[parser_api.ParserType],
+) -> parser_api.Parser[parser_api.ParserType]:
     origin = typing.get_origin(type_)
     return _get_parser_type(origin or type_).default(type_)
 
@@ -183,3 +337,117 @@ class Parser(
     async def dumps(self, argument: parser_api.ParserType, /) -> str:  # noqa: D102
         # <<Docstring inherited from parser_api.Parser>>
         ...
+
+
+@typing.runtime_checkable
+@attrs.define(slots=True)
+class SyncParser(
+    Parser[parser_api.ParserType],
+    parser_api.SyncParser[parser_api.ParserType],
+    typing.Protocol[parser_api.ParserType],
+):
+    """Class that handles synchronously parsing one custom id field to and from a desired type.
+
+    Parsers that inherit from this class only need to implement
+    :meth:`loads_sync` and :meth:`dumps_sync`; :meth:`loads` and :meth:`dumps`
+    automatically defer to these.
+    """
+
+    @property
+    def is_sync(self) -> bool:  # noqa: D102
+        # <<Docstring inherited from parser_api.SyncParser>>
+        return True
+
+    def loads_sync(self, argument: str, /) -> parser_api.ParserType:  # noqa: D102
+        # <<Docstring inherited from parser_api.SyncParser>>
+        ...
+
+    def dumps_sync(self, argument: parser_api.ParserType, /) -> str:  # noqa: D102
+        # <<Docstring inherited from parser_api.SyncParser>>
+        ...
+
+    async def loads(self, argument: str, /) -> parser_api.ParserType:
+        """Load a value from a string.
+
+        This defers to :meth:`loads_sync`.
+
+        Parameters
+        ----------
+        argument:
+            The argument to parse into the desired type.
+
+        """
+        return self.loads_sync(argument)
+
+    async def dumps(self, argument: parser_api.ParserType, /) -> str:
+        """Dump a value into a string.
+
+        This defers to :meth:`dumps_sync`.
+
+        Parameters
+        ----------
+        argument:
+            The value that is to be dumped.
+
+        """
+        return self.dumps_sync(argument)
+
+
+def is_sync_parser(
+    parser: parser_api.Parser[parser_api.ParserType],
+) -> typing_extensions.TypeIs[parser_api.SyncParser[parser_api.ParserType]]:
+    r"""Check whether the provided parser can currently parse synchronously.
+
+    Parameters
+    ----------
+    parser:
+        The parser to check.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether the parser implements :class:`~disnake_compass.api.SyncParser`
+        and has :attr:`~disnake_compass.api.SyncParser.is_sync` set to ``True``.
+
+    """
+    return isinstance(parser, parser_api.SyncParser) and parser.is_sync
+
+
+def is_packable_parser(
+    parser: parser_api.Parser[parser_api.ParserType],
+) -> typing_extensions.TypeIs[parser_api.PackableParser[parser_api.ParserType]]:
+    r"""Check whether the provided parser can currently pack values into bits.
+
+    Parameters
+    ----------
+    parser:
+        The parser to check.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether the parser implements :class:`~disnake_compass.api.PackableParser`
+        and has a :attr:`~disnake_compass.api.PackableParser.bit_length`.
+
+    """
+    return isinstance(parser, parser_api.PackableParser) and parser.bit_length is not None
+
+
+def is_pure_parser(
+    parser: parser_api.Parser[parser_api.ParserType],
+) -> typing_extensions.TypeIs[parser_api.PureParser[parser_api.ParserType]]:
+    r"""Check whether the values loaded by the provided parser may be cached.
+
+    Parameters
+    ----------
+    parser:
+        The parser to check.
+
+    Returns
+    -------
+    :class:`bool`
+        Whether the parser implements :class:`~disnake_compass.api.PureParser`
+        and has :attr:`~disnake_compass.api.PureParser.is_pure` set to ``True``.
+
+    """
+    return isinstance(parser, parser_api.PureParser) and parser.is_pure
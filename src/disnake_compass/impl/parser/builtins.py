@@ -10,10 +10,9 @@ import typing
 import attrs
 import typing_extensions
 
+from disnake_compass.api import parser as parser_api
 from disnake_compass.impl.parser import base as parser_base
-
-if typing.TYPE_CHECKING:
-    from disnake_compass.api import parser as parser_api
+from disnake_compass.internal import alphabet as alphabet_utils
 
 __all__: typing.Sequence[str] = (
     "BoolParser",
@@ -28,6 +27,7 @@ __all__: typing.Sequence[str] = (
 _NoneType: type[None] = type(None)
 _NONES = (None, _NoneType)
 _INT_CHARS = string.digits + string.ascii_lowercase
+_BASE_ALPHABETS: dict[int, alphabet_utils.Alphabet] = {36: alphabet_utils.BASE36}
 
 _CollectionT = typing_extensions.TypeVar(  # Simplest iterable container object.
     "_CollectionT",
@@ -37,12 +37,20 @@ _CollectionT = typing_extensions.TypeVar(  # Simplest iterable container object.
 _TupleT = typing_extensions.TypeVar("_TupleT", bound=tuple[typing.Any, ...])
 _T = typing_extensions.TypeVar("_T")
 
+
+def _as_sync(parser: parser_api.Parser[_T]) -> parser_api.SyncParser[_T]:
+    # NOTE: Compound parsers only call their inner parsers' synchronous methods
+    #       if they themselves are sync, which implies all inner parsers are
+    #       sync. We can therefore safely skip any runtime checks here.
+    return typing.cast("parser_api.SyncParser[_T]", parser)
+
+
 # NONE
 
 
 @parser_base.register_parser_for(_NoneType)
 @attrs.define(slots=True)
-class NoneParser(parser_base.Parser[None]):
+class NoneParser(parser_base.SyncParser[None], parser_api.PureParser[None]):
     r"""Parser implementation for :obj:`None`.
 
     Mainly relevant for :obj:`~typing.Optional`\[...] parsers.
@@ -62,7 +70,12 @@ class NoneParser(parser_base.Parser[None]):
     See :meth:`loads` and :meth:`dumps` for the implications of strict-mode.
     """
 
-    async def loads(self, argument: str, /) -> None:
+    @property
+    def is_pure(self) -> bool:
+        # <<Docstring inherited from parser_api.PureParser>>
+        return True
+
+    def loads_sync(self, argument: str, /) -> None:
         """Load ``None`` from a string.
 
         If :attr:`strict` is set to ``True``, this will fail if the
@@ -87,7 +100,7 @@ class NoneParser(parser_base.Parser[None]):
         msg = f"Strict `NoneParser`s can only load the empty string, got {argument!r}."
         raise ValueError(msg)
 
-    async def dumps(self, argument: None, /) -> str:
+    def dumps_sync(self, argument: None, /) -> str:
         """Dump ``None`` into a string.
 
         If :attr:`strict` is set to ``True``, this will fail if the
@@ -133,10 +146,15 @@ def dumps_float(number: float) -> str:
 
 @parser_base.register_parser_for(float)
 @attrs.define(slots=True)
-class FloatParser(parser_base.Parser[float]):
+class FloatParser(parser_base.SyncParser[float], parser_api.PureParser[float]):
     r"""Parser implementation for :class:`float`\s."""
 
-    async def loads(self, argument: str, /) -> float:
+    @property
+    def is_pure(self) -> bool:  # noqa: D102
+        # <<Docstring inherited from parser_api.PureParser>>
+        return True
+
+    def loads_sync(self, argument: str, /) -> float:
         """Load a floating point number from a string.
 
         Parameters
@@ -147,7 +165,7 @@ class FloatParser(parser_base.Parser[float]):
         """
         return float(argument)
 
-    async def dumps(self, argument: float, /) -> str:
+    def dumps_sync(self, argument: float, /) -> str:
         """Dump a floating point number into a string.
 
         Strips trailing ".0" where possible.
@@ -167,9 +185,35 @@ def _validate_base(_instance: object, _attribute: object, base: int) -> None:
         raise ValueError(msg)
 
 
+def _get_base_alphabet(base: int) -> alphabet_utils.Alphabet:
+    # Alphabets precompute their tables, so share them between parsers.
+    alphabet = _BASE_ALPHABETS.get(base)
+    if alphabet is None:
+        alphabet = _BASE_ALPHABETS[base] = alphabet_utils.Alphabet(_INT_CHARS[:base])
+
+    return alphabet
+
+
+def _dumps_base(argument: int, base: int) -> str:
+    # Try to short-circuit as much as possible
+    if base == 10:  # noqa: PLR2004
+        return str(argument)
+    if base == 2:  # noqa: PLR2004
+        return f"{argument:b}"
+    if base == 8:  # noqa: PLR2004
+        return f"{argument:o}"
+    if base == 16:  # noqa: PLR2004
+        return f"{argument:x}"
+
+    # Can't short-circuit, convert to string using the digit table.
+    return _get_base_alphabet(base).encode(argument)
+
+
 @parser_base.register_parser_for(int)
 @attrs.define(slots=True)
-class IntParser(parser_base.Parser[int]):
+class IntParser(
+    parser_base.SyncParser[int], parser_api.PureParser[int], parser_api.PackableParser[int]
+):
     r"""Parser implementation for :class:`int`\s.
 
     Parameters
@@ -181,6 +225,14 @@ class IntParser(parser_base.Parser[int]):
         The base to use to use for storing integers.
         This is limited to ``2 <= base <= 36``.
         Defaults to ``36``.
+    alphabet:
+        The alphabet to use for storing integers, overriding ``base``. This
+        allows for bases greater than 36, e.g.
+        :data:`~disnake_compass.internal.alphabet.UNICODE`.
+        Defaults to ``None``.
+    bits:
+        The number of bits of the integers, if bounded. This allows
+        integers to be packed. Defaults to ``None``.
 
     """
 
@@ -191,11 +243,85 @@ class IntParser(parser_base.Parser[int]):
     This is limited to ``2 <= base <= 36`` as this is the range supported by
     python's :class:`int` constructor.
 
-    If a greater base is required, a custom integer parser will have to be
-    implemented.
+    If a greater base is required, use :attr:`alphabet` instead.
     """
+    alphabet: alphabet_utils.Alphabet | None = attrs.field(default=None, kw_only=True)
+    """The alphabet to use for storing integers.
 
-    async def loads(self, argument: str, /) -> int:
+    If set, this takes precedence over :attr:`base`. As alphabets need not
+    exclude the minus sign, signed integers are stored using zigzag encoding,
+    such that 0, -1, 1, -2, 2, ... are stored as 0, 1, 2, 3, 4, ...
+
+    .. note::
+        The alphabet must not contain the separator of the component manager.
+        For example, :data:`~disnake_compass.internal.alphabet.BASE93`
+        excludes the default separator ``"|"``.
+    """
+    bits: int | None = attrs.field(default=None, kw_only=True)
+    """The number of bits of the integers, if bounded.
+
+    If set, integers are packed using this number of bits. For signed
+    integers, this includes the sign bit. Integers outside of the range that
+    fits in this number of bits cannot be packed.
+    """
+
+    @property
+    def bit_length(self) -> int | None:
+        """The number of bits required to store any integer, if bounded.
+
+        This is the same as :attr:`bits`.
+        """
+        return self.bits
+
+    def _get_offset(self, bits: int) -> int:
+        # Signed integers are offset such that the lowest value maps onto 0.
+        return 1 << (bits - 1) if self.signed else 0
+
+    def pack(self, argument: int, /) -> int:
+        """Pack an integer into :attr:`bits` bits.
+
+        This can only be used if :attr:`bits` is set.
+
+        Parameters
+        ----------
+        argument:
+            The integer that is to be packed.
+
+        Raises
+        ------
+        ValueError:
+            The integer does not fit in :attr:`bits` bits.
+
+        """
+        assert self.bits is not None
+        packed = argument + self._get_offset(self.bits)
+        if not 0 <= packed < 1 << self.bits:
+            kind = "signed" if self.signed else "unsigned"
+            msg = f"{argument} does not fit in a {self.bits}-bit {kind} integer."
+            raise ValueError(msg)
+
+        return packed
+
+    def unpack(self, argument: int, /) -> int:
+        """Unpack an integer from :attr:`bits` bits.
+
+        This can only be used if :attr:`bits` is set.
+
+        Parameters
+        ----------
+        argument:
+            The integer that is to be unpacked.
+
+        """
+        assert self.bits is not None
+        return argument - self._get_offset(self.bits)
+
+    @property
+    def is_pure(self) -> bool:  # noqa: D102
+        # <<Docstring inherited from parser_api.PureParser>>
+        return True
+
+    def loads_sync(self, argument: str, /) -> int:
         r"""Load an integer from a string.
 
         Parameters
@@ -211,6 +337,14 @@ class IntParser(parser_base.Parser[int]):
             Alternatively, the provided argument is not a valid integer at all.
 
         """
+        if self.alphabet is not None:
+            result = self.alphabet.decode(argument)
+            if self.signed:
+                # Undo zigzag encoding.
+                return (result >> 1) ^ -(result & 1)
+
+            return result
+
         result = int(argument, self.base)
         if not self.signed and result < 0:
             msg = "Unsigned numbers cannot be < 0."
@@ -218,7 +352,7 @@ class IntParser(parser_base.Parser[int]):
 
         return result
 
-    async def dumps(self, argument: int, /) -> str:
+    def dumps_sync(self, argument: int, /) -> str:
         """Dump an integer into a string.
 
         Parameters
@@ -226,26 +360,28 @@ class IntParser(parser_base.Parser[int]):
         argument:
             The value that is to be dumped.
 
+        Raises
+        ------
+        ValueError:
+            The parser has :attr:`signed` set to ``False`` but the argument
+            is a negative number.
+
         """
-        # Try to short-circuit as much as possible
-        if argument < self.base:
-            return str(argument)
-        if self.base == 2:  # noqa: PLR2004
-            return f"{argument:b}"
-        if self.base == 8:  # noqa: PLR2004
-            return f"{argument:o}"
-        if self.base == 10:  # noqa: PLR2004
-            return str(argument)
-        if self.base == 16:  # noqa: PLR2004
-            return f"{argument:x}"
+        if not self.signed and argument < 0:
+            msg = "Unsigned numbers cannot be < 0."
+            raise ValueError(msg)
+
+        if self.alphabet is not None:
+            if self.signed:
+                # Zigzag encoding maps negative numbers onto odd numbers.
+                argument = argument << 1 if argument >= 0 else (~argument << 1) | 1
 
-        # Can't short-circuit, convert to string manually.
-        digits: list[int] = []
-        while argument:
-            digits.append(argument % self.base)
-            argument //= self.base
+            return self.alphabet.encode(argument)
 
-        return "".join(_INT_CHARS[d] for d in reversed(digits))
+        if argument < 0:
+            return "-" + _dumps_base(-argument, self.base)
+
+        return _dumps_base(argument, self.base)
 
 
 # BOOL
@@ -256,7 +392,9 @@ _DEFAULT_FALSES = frozenset(["false", "f", "no", "n", "0"])
 
 @parser_base.register_parser_for(bool)
 @attrs.define(slots=True)
-class BoolParser(parser_base.Parser[bool]):
+class BoolParser(
+    parser_base.SyncParser[bool], parser_api.PureParser[bool], parser_api.PackableParser[bool]
+):
     """Parser type with support for bools.
 
     This parser type can be supplied with a collection of strings for the
@@ -279,7 +417,12 @@ class BoolParser(parser_base.Parser[bool]):
     falses: typing.Collection[str] = attrs.field(factory=_DEFAULT_FALSES.copy)
     """A collection of values that should be considered ``False`` by this parser."""
 
-    async def loads(self, argument: str, /) -> bool:
+    @property
+    def is_pure(self) -> bool:  # noqa: D102
+        # <<Docstring inherited from parser_api.PureParser>>
+        return True
+
+    def loads_sync(self, argument: str, /) -> bool:
         """Load a boolean from a string.
 
         Parameters
@@ -306,7 +449,7 @@ class BoolParser(parser_base.Parser[bool]):
         )
         raise ValueError(msg)
 
-    async def dumps(self, argument: bool, /) -> str:  # noqa: FBT001
+    def dumps_sync(self, argument: bool, /) -> str:  # noqa: FBT001
         """Dump a boolean into a string.
 
         By default, this opts to dump as ``"1"`` for ``True`` or ``"0"`` for
@@ -320,19 +463,51 @@ class BoolParser(parser_base.Parser[bool]):
         """
         return "1" if argument else "0"
 
+    @property
+    def bit_length(self) -> int:
+        """The number of bits required to store a boolean, which is always 1."""
+        return 1
+
+    def pack(self, argument: bool, /) -> int:  # noqa: FBT001
+        """Pack a boolean into a single bit.
+
+        Parameters
+        ----------
+        argument:
+            The value that is to be packed.
+
+        """
+        return 1 if argument else 0
+
+    def unpack(self, argument: int, /) -> bool:
+        """Unpack a boolean from a single bit.
+
+        Parameters
+        ----------
+        argument:
+            The bit that is to be unpacked.
+
+        """
+        return bool(argument)
+
 
 # STRING
 
 
 @parser_base.register_parser_for(str)
 @attrs.define(slots=True)
-class StringParser(parser_base.Parser[str]):
+class StringParser(parser_base.SyncParser[str], parser_api.PureParser[str]):
     """Parser type with support for strings.
 
     Both loads and dumps are essentially no-ops.
     """
 
-    async def loads(self, argument: str, /) -> str:
+    @property
+    def is_pure(self) -> bool:  # noqa: D102
+        # <<Docstring inherited from parser_api.PureParser>>
+        return True
+
+    def loads_sync(self, argument: str, /) -> str:
         """Load a string from a string.
 
         Parameters
@@ -343,7 +518,7 @@ class StringParser(parser_base.Parser[str]):
         """
         return argument
 
-    async def dumps(self, argument: str, /) -> str:
+    def dumps_sync(self, argument: str, /) -> str:
         """Dump a string into a string.
 
         Parameters
@@ -370,10 +545,10 @@ def _resolve_collection(type_: type[_CollectionT]) -> type[_CollectionT]:
 
     # Try to resolve an abstract type to a valid concrete structural subtype.
     if issubclass(type_, typing.Sequence):
-        return typing.cast(type[_CollectionT], list)
+        return typing.cast("type[_CollectionT]", list)
 
     if issubclass(type_, typing.AbstractSet):
-        return typing.cast(type[_CollectionT], set)
+        return typing.cast("type[_CollectionT]", set)
 
     msg = f"Cannot infer a concrete type for abstract type {type_.__name__!r}."
     raise TypeError(msg)
@@ -384,7 +559,7 @@ def _resolve_collection(type_: type[_CollectionT]) -> type[_CollectionT]:
 
 @parser_base.register_parser_for(tuple, priority=10)
 @attrs.define(slots=True, init=False)
-class TupleParser(parser_base.Parser[_TupleT]):
+class TupleParser(parser_base.SyncParser[_TupleT], parser_api.PureParser[_TupleT]):
     r"""Parser type with support for :class:`tuple`\s.
 
     The benefit of a tuple parser is fixed-length checks and the ability to set
@@ -451,6 +626,64 @@ class TupleParser(parser_base.Parser[_TupleT]):
         inner_parsers = [parser_base.get_parser(arg) for arg in args]
         return cls(*inner_parsers, tuple_cls=type_)
 
+    @property
+    def is_sync(self) -> bool:
+        """Whether this parser can parse synchronously.
+
+        This is the case if all of the :attr:`inner_parsers` can parse
+        synchronously.
+        """
+        return all(parser_base.is_sync_parser(parser) for parser in self.inner_parsers)
+
+    @property
+    def is_pure(self) -> bool:
+        """Whether the values loaded by this parser may be cached.
+
+        This is the case if all of the :attr:`inner_parsers` are pure.
+        """
+        return all(parser_base.is_pure_parser(parser) for parser in self.inner_parsers)
+
+    def loads_sync(self, argument: str, /) -> _TupleT:
+        """Load a tuple from a string synchronously.
+
+        This can only be used if :attr:`is_sync` is ``True``. See
+        :meth:`loads` for further details.
+
+        Parameters
+        ----------
+        argument:
+            The string that is to be converted into a tuple.
+
+        """
+        parts = argument.split(self.sep)
+
+        initialiser = getattr(self.tuple_cls, "_make", self.tuple_cls)
+        return initialiser(
+            [
+                _as_sync(parser).loads_sync(part)
+                for parser, part in zip(self.inner_parsers, parts, strict=True)
+            ],
+        )
+
+    def dumps_sync(self, argument: _TupleT, /) -> str:
+        """Dump a tuple into a string synchronously.
+
+        This can only be used if :attr:`is_sync` is ``True``. See
+        :meth:`dumps` for further details.
+
+        Parameters
+        ----------
+        argument:
+            The value that is to be dumped.
+
+        """
+        return self.sep.join(
+            [
+                _as_sync(parser).dumps_sync(part)
+                for parser, part in zip(self.inner_parsers, argument, strict=True)
+            ],
+        )
+
     async def loads(self, argument: str, /) -> _TupleT:
         """Load a tuple from a string.
 
@@ -505,7 +738,7 @@ class TupleParser(parser_base.Parser[_TupleT]):
 
 @parser_base.register_parser_for(typing.Collection)
 @attrs.define(slots=True, init=False)
-class CollectionParser(parser_base.Parser[_CollectionT]):
+class CollectionParser(parser_base.SyncParser[_CollectionT], parser_api.PureParser[_CollectionT]):
     r"""Parser type with support for :class:`typing.Collection`\s.
 
     This supports types such as :class:`list`, :class:`set`, etc.; but also
@@ -569,7 +802,7 @@ class CollectionParser(parser_base.Parser[_CollectionT]):
     ) -> None:
         self.sep = sep
         self.collection_type = typing.cast(  # Pyright do be whack sometimes.
-            type[_CollectionT],
+            "type[_CollectionT]",
             list if collection_type is None else _resolve_collection(collection_type),
         )
         self.inner_parser = StringParser.default(str) if inner_parser is None else inner_parser
@@ -587,6 +820,58 @@ class CollectionParser(parser_base.Parser[_CollectionT]):
         inner_parser = parser_base.get_parser(inner_type)
         return cls(inner_parser, collection_type=origin)
 
+    @property
+    def is_sync(self) -> bool:
+        """Whether this parser can parse synchronously.
+
+        This is the case if the :attr:`inner_parser` can parse synchronously.
+        """
+        return parser_base.is_sync_parser(self.inner_parser)
+
+    @property
+    def is_pure(self) -> bool:
+        """Whether the values loaded by this parser may be cached.
+
+        This is the case if the :attr:`inner_parser` is pure and the
+        :attr:`collection_type` is immutable, i.e. a :class:`tuple` or a
+        :class:`frozenset`.
+        """
+        return issubclass(self.collection_type, tuple | frozenset) and parser_base.is_pure_parser(
+            self.inner_parser
+        )
+
+    def loads_sync(self, argument: str, /) -> _CollectionT:
+        """Load a collection from a string synchronously.
+
+        This can only be used if :attr:`is_sync` is ``True``. See
+        :meth:`loads` for further details.
+
+        Parameters
+        ----------
+        argument:
+            The string that is to be converted into a collection.
+
+        """
+        loads = _as_sync(self.inner_parser).loads_sync
+        parsed = [loads(part) for part in argument.split(self.sep) if not part.isspace()]
+
+        return self.collection_type(parsed)  # pyright: ignore[reportCallIssue]
+
+    def dumps_sync(self, argument: _CollectionT, /) -> str:
+        """Dump a collection into a string synchronously.
+
+        This can only be used if :attr:`is_sync` is ``True``. See
+        :meth:`dumps` for further details.
+
+        Parameters
+        ----------
+        argument:
+            The value that is to be dumped.
+
+        """
+        dumps = _as_sync(self.inner_parser).dumps_sync
+        return self.sep.join([dumps(part) for part in argument])
+
     async def loads(self, argument: str, /) -> _CollectionT:
         """Load a collection from a string.
 
@@ -617,12 +902,12 @@ class CollectionParser(parser_base.Parser[_CollectionT]):
             The value that is to be dumped.
 
         """
-        return ",".join([await self.inner_parser.dumps(part) for part in argument])
+        return self.sep.join([await self.inner_parser.dumps(part) for part in argument])
 
 
 @parser_base.register_parser_for(typing.Union)  # pyright: ignore[reportArgumentType]
 @attrs.define(slots=True, init=False)
-class UnionParser(parser_base.Parser[_T], typing.Generic[_T]):
+class UnionParser(parser_base.SyncParser[_T], parser_api.PureParser[_T], typing.Generic[_T]):
     r"""Parser type with support for :class:`~typing.Union`\s.
 
     The provided parsers are sequentially tried until one passes. If none work,
@@ -677,6 +962,23 @@ class UnionParser(parser_base.Parser[_T], typing.Generic[_T]):
         inner_parsers = [parser_base.get_parser(arg) for arg in args]
         return cls(*inner_parsers)
 
+    @property
+    def is_sync(self) -> bool:
+        """Whether this parser can parse synchronously.
+
+        This is the case if all of the :attr:`inner_parsers` can parse
+        synchronously.
+        """
+        return all(parser_base.is_sync_parser(parser) for parser in self.inner_parsers)
+
+    @property
+    def is_pure(self) -> bool:
+        """Whether the values loaded by this parser may be cached.
+
+        This is the case if all of the :attr:`inner_parsers` are pure.
+        """
+        return all(parser_base.is_pure_parser(parser) for parser in self.inner_parsers)
+
     @property
     def strict(self) -> bool:
         """Whether this parser is strict.
@@ -702,6 +1004,53 @@ class UnionParser(parser_base.Parser[_T], typing.Generic[_T]):
         assert isinstance(none_parser, NoneParser)
         none_parser.strict = strict
 
+    def loads_sync(self, argument: str, /) -> _T:
+        """Load a union of types from a string synchronously.
+
+        This can only be used if :attr:`is_sync` is ``True``. See
+        :meth:`loads` for further details.
+
+        Parameters
+        ----------
+        argument:
+            The string that is to be converted into one of the types in this union.
+
+        """
+        if not argument and self.optional:
+            return typing.cast("_T", None)
+
+        for parser in self.inner_parsers:
+            with contextlib.suppress(Exception):
+                return _as_sync(parser).loads_sync(argument)
+
+        msg = "Failed to parse input to any type in the Union."
+        raise RuntimeError(msg)
+
+    def dumps_sync(self, argument: _T, /) -> str:
+        """Dump a union of types into a string synchronously.
+
+        This can only be used if :attr:`is_sync` is ``True``. See
+        :meth:`dumps` for further details.
+
+        Parameters
+        ----------
+        argument:
+            The value that is to be dumped.
+
+        """
+        if not argument and self.optional:
+            return ""
+
+        for parser in self.inner_parsers:
+            with contextlib.suppress(Exception):
+                return _as_sync(parser).dumps_sync(argument)
+
+        if self.optional and not self.strict:
+            return ""
+
+        msg = f"Failed to parse input {argument!r} to any type in the Union."
+        raise RuntimeError(msg)
+
     async def loads(self, argument: str, /) -> _T:
         """Load a union of types from a string.
 
@@ -726,7 +1075,7 @@ class UnionParser(parser_base.Parser[_T], typing.Generic[_T]):
         if not argument and self.optional:
             # Quick-return: if no argument was provided and the parser is
             # optional, just return None without trying any parsers.
-            return typing.cast(_T, None)
+            return typing.cast("_T", None)
 
         # Try all parsers sequentially. If any succeeds, return the result.
         for parser in self.inner_parsers:
@@ -771,7 +1120,12 @@ class UnionParser(parser_base.Parser[_T], typing.Generic[_T]):
 
 @parser_base.register_parser_for(typing.Literal)  # pyright: ignore[reportArgumentType]
 @attrs.define(slots=True, init=False)
-class LiteralParser(parser_base.Parser[_T], typing.Generic[_T]):
+class LiteralParser(
+    parser_base.SyncParser[_T],
+    parser_api.PureParser[_T],
+    parser_api.PackableParser[_T],
+    typing.Generic[_T],
+):
     options: typing.Sequence[_T]
     inner_parser: parser_api.Parser[_T]
 
@@ -799,14 +1153,15 @@ class LiteralParser(parser_base.Parser[_T], typing.Generic[_T]):
 
         return cls(*args, inner_parser=parser_base.get_parser(arg_type))
 
-    async def loads(self, argument: str, /) -> _T:
-        value = await self.inner_parser.loads(argument)
-
-        assert value in self.options
+    @property
+    def is_sync(self) -> bool:
+        return parser_base.is_sync_parser(self.inner_parser)
 
-        return value
+    @property
+    def is_pure(self) -> bool:
+        return parser_base.is_pure_parser(self.inner_parser)
 
-    async def dumps(self, argument: _T, /) -> str:
+    def _validate(self, argument: _T) -> None:
         if argument not in self.options:
             msg = (
                 f"{argument!r} is not a valid option for this parser."
@@ -814,4 +1169,35 @@ class LiteralParser(parser_base.Parser[_T], typing.Generic[_T]):
             )
             raise ValueError(msg)
 
+    def loads_sync(self, argument: str, /) -> _T:
+        value = _as_sync(self.inner_parser).loads_sync(argument)
+
+        assert value in self.options
+
+        return value
+
+    def dumps_sync(self, argument: _T, /) -> str:
+        self._validate(argument)
+        return _as_sync(self.inner_parser).dumps_sync(argument)
+
+    @property
+    def bit_length(self) -> int:
+        return (len(self.options) - 1).bit_length()
+
+    def pack(self, argument: _T, /) -> int:
+        self._validate(argument)
+        return self.options.index(argument)
+
+    def unpack(self, argument: int, /) -> _T:
+        return self.options[argument]
+
+    async def loads(self, argument: str, /) -> _T:
+        value = await self.inner_parser.loads(argument)
+
+        assert value in self.options
+
+        return value
+
+    async def dumps(self, argument: _T, /) -> str:
+        self._validate(argument)
         return await self.inner_parser.dumps(argument)
@@ -7,9 +7,11 @@ import typing
 
 import attrs
 import disnake
+import typing_extensions
 
 from disnake_compass.impl.parser import base as parser_base
 from disnake_compass.impl.parser import builtins as builtins_parsers
+from disnake_compass.internal import cache as cache_utils
 from disnake_compass.internal import di
 
 __all__: typing.Sequence[str] = (
@@ -50,10 +52,13 @@ class ChannelParserBase(parser_base.Parser[_ChannelT]):
         internally for this parser.
     allow_api_requests:
         Whether or not to allow this parser to make API requests.
+    cache:
+        The :class:`~disnake_compass.internal.cache.FetchCache` in which to
+        store API request results.
 
     """
 
-    parser_type: type[_ChannelT]  # NOTE: Intentionally undocumented.
+    parser_type: typing.ClassVar[type[_AnyChannel]]  # NOTE: Intentionally undocumented.
     int_parser: builtins_parsers.IntParser
     """The :class:`~disnake_compass.impl.parser.builtins.IntParser` to use
     internally for this parser.
@@ -66,12 +71,20 @@ class ChannelParserBase(parser_base.Parser[_ChannelT]):
 
     Parsers will always try getting a result from cache first.
     """
+    cache: cache_utils.FetchCache[typing.Any, typing.Any] | None
+    """The cache in which to store channels fetched through the API.
+
+    If set, channels fetched through the API are stored in this cache, and
+    concurrent fetches of the same channel share a single request. The same
+    cache can be shared between multiple parsers. Defaults to ``None``.
+    """
 
     def __init__(
         self,
         int_parser: builtins_parsers.IntParser | None = None,
         *,
         allow_api_requests: bool = True,
+        cache: cache_utils.FetchCache[typing.Any, typing.Any] | None = None,
     ) -> None:
         if type(self) is ChannelParserBase:
             msg = "'GetChannelParserBase' is a base class and should not be instantiated directly."
@@ -79,6 +92,10 @@ class ChannelParserBase(parser_base.Parser[_ChannelT]):
 
         self.int_parser = int_parser or builtins_parsers.IntParser.default(int)
         self.allow_api_requests = allow_api_requests
+        self.cache = cache
+
+    def _is_parser_type(self, channel: object) -> typing_extensions.TypeIs[_ChannelT]:
+        return isinstance(channel, self.parser_type)
 
     async def loads(self, argument: str, /) -> _ChannelT:
         """Load a channel from a string.
@@ -108,26 +125,30 @@ class ChannelParserBase(parser_base.Parser[_ChannelT]):
             or di.resolve_dependency(disnake.Thread, None)
             or di.resolve_dependency(disnake.abc.PrivateChannel, None)
         )
-        if maybe_channel and isinstance(maybe_channel, self.parser_type):
+        if maybe_channel and self._is_parser_type(maybe_channel):
             return maybe_channel
 
         maybe_guild = di.resolve_dependency(disnake.Guild, None)
         if maybe_guild:
             maybe_channel = maybe_guild.get_channel(channel_id)
-            if maybe_channel and isinstance(maybe_channel, self.parser_type):
+            if maybe_channel and self._is_parser_type(maybe_channel):
                 return maybe_channel
 
         maybe_client = di.resolve_dependency(disnake.Client, None)
         if maybe_client:
             maybe_channel = maybe_client.get_channel(channel_id)
-            if maybe_channel and isinstance(maybe_channel, self.parser_type):
+            if maybe_channel and self._is_parser_type(maybe_channel):
                 return maybe_channel
 
             if self.allow_api_requests:
                 with contextlib.suppress(disnake.HTTPException):
-                    maybe_channel = await maybe_client.fetch_channel(channel_id)
+                    maybe_channel = await cache_utils.cached_fetch(
+                        self.cache,
+                        ("channel", channel_id),
+                        lambda: maybe_client.fetch_channel(channel_id),
+                    )
 
-                if isinstance(maybe_channel, self.parser_type):
+                if self._is_parser_type(maybe_channel):
                     return maybe_channel
 
         if maybe_channel is None:
@@ -158,7 +179,7 @@ class ChannelParserBase(parser_base.Parser[_ChannelT]):
 
 
 @parser_base.register_parser_for(disnake.abc.GuildChannel)
-@attrs.define(slots=True)
+@attrs.define(slots=True, init=False)
 class GuildChannelParser(ChannelParserBase[disnake.abc.GuildChannel]):
     r"""Parser type with support for guild channels.
 
@@ -177,7 +198,7 @@ class GuildChannelParser(ChannelParserBase[disnake.abc.GuildChannel]):
 
 
 @parser_base.register_parser_for(disnake.abc.PrivateChannel)
-@attrs.define(slots=True)
+@attrs.define(slots=True, init=False)
 class PrivateChannelParser(ChannelParserBase[disnake.abc.PrivateChannel]):
     r"""Parser type with support for private channels.
 
@@ -199,7 +220,7 @@ class PrivateChannelParser(ChannelParserBase[disnake.abc.PrivateChannel]):
 
 
 @parser_base.register_parser_for(disnake.DMChannel)
-@attrs.define(slots=True)
+@attrs.define(slots=True, init=False)
 class DMChannelParser(ChannelParserBase[disnake.DMChannel]):
     r"""Parser type with support for DM channels.
 
@@ -218,7 +239,7 @@ class DMChannelParser(ChannelParserBase[disnake.DMChannel]):
 
 
 @parser_base.register_parser_for(disnake.GroupChannel)
-@attrs.define(slots=True)
+@attrs.define(slots=True, init=False)
 class GroupChannelParser(ChannelParserBase[disnake.GroupChannel]):
     r"""Parser type with support for group channels.
 
@@ -240,7 +261,7 @@ class GroupChannelParser(ChannelParserBase[disnake.GroupChannel]):
 
 
 @parser_base.register_parser_for(disnake.ForumChannel)
-@attrs.define(slots=True)
+@attrs.define(slots=True, init=False)
 class ForumChannelParser(ChannelParserBase[disnake.ForumChannel]):
     r"""Parser type with support for forum channels.
 
@@ -259,7 +280,7 @@ class ForumChannelParser(ChannelParserBase[disnake.ForumChannel]):
 
 
 @parser_base.register_parser_for(disnake.NewsChannel)
-@attrs.define(slots=True)
+@attrs.define(slots=True, init=False)
 class NewsChannelParser(ChannelParserBase[disnake.NewsChannel]):
     r"""Parser type with support for news channels.
 
@@ -278,7 +299,7 @@ class NewsChannelParser(ChannelParserBase[disnake.NewsChannel]):
 
 
 @parser_base.register_parser_for(disnake.VoiceChannel)
-@attrs.define(slots=True)
+@attrs.define(slots=True, init=False)
 class VoiceChannelParser(ChannelParserBase[disnake.VoiceChannel]):
     r"""Parser type with support for voice channels.
 
@@ -297,7 +318,7 @@ class VoiceChannelParser(ChannelParserBase[disnake.VoiceChannel]):
 
 
 @parser_base.register_parser_for(disnake.StageChannel)
-@attrs.define(slots=True)
+@attrs.define(slots=True, init=False)
 class StageChannelParser(ChannelParserBase[disnake.StageChannel]):
     r"""Parser type with support for stage channels.
 
@@ -316,7 +337,7 @@ class StageChannelParser(ChannelParserBase[disnake.StageChannel]):
 
 
 @parser_base.register_parser_for(disnake.TextChannel)
-@attrs.define(slots=True)
+@attrs.define(slots=True, init=False)
 class TextChannelParser(ChannelParserBase[disnake.TextChannel]):
     r"""Parser type with support for text channels.
 
@@ -335,7 +356,7 @@ class TextChannelParser(ChannelParserBase[disnake.TextChannel]):
 
 
 @parser_base.register_parser_for(disnake.Thread)
-@attrs.define(slots=True)
+@attrs.define(slots=True, init=False)
 class ThreadParser(ChannelParserBase[disnake.Thread]):
     r"""Parser type with support for threads.
 
@@ -354,7 +375,7 @@ class ThreadParser(ChannelParserBase[disnake.Thread]):
 
 
 @parser_base.register_parser_for(disnake.CategoryChannel)
-@attrs.define(slots=True)
+@attrs.define(slots=True, init=False)
 class CategoryParser(ChannelParserBase[disnake.CategoryChannel]):
     r"""Parser type with support for categories.
 
@@ -374,7 +395,7 @@ class CategoryParser(ChannelParserBase[disnake.CategoryChannel]):
 
 @parser_base.register_parser_for(disnake.PartialMessageable)
 @attrs.define(slots=True)
-class PartialMessageableParser(parser_base.Parser[disnake.PartialMessageable]):
+class PartialMessageableParser(parser_base.SyncParser[disnake.PartialMessageable]):
     r"""Parser type with support for partial messageables.
 
     Parameters
@@ -406,7 +427,7 @@ class PartialMessageableParser(parser_base.Parser[disnake.PartialMessageable]):
     default channel parser will also return compressed results.
     """
 
-    async def loads(self, argument: str, /) -> disnake.PartialMessageable:
+    def loads_sync(self, argument: str, /) -> disnake.PartialMessageable:
         """Load a partial messageable from a string.
 
         This uses the underlying :attr:`int_parser`.
@@ -420,9 +441,12 @@ class PartialMessageableParser(parser_base.Parser[disnake.PartialMessageable]):
 
         """
         client = di.resolve_dependency(disnake.Client)
-        return client.get_partial_messageable(int(argument), type=self.channel_type)
+        return client.get_partial_messageable(
+            self.int_parser.loads_sync(argument),
+            type=self.channel_type,
+        )
 
-    async def dumps(self, argument: disnake.PartialMessageable, /) -> str:
+    def dumps_sync(self, argument: disnake.PartialMessageable, /) -> str:
         """Dump a partial messageable into a string.
 
         This uses the underlying :attr:`int_parser`.
@@ -433,4 +457,4 @@ class PartialMessageableParser(parser_base.Parser[disnake.PartialMessageable]):
             The value that is to be dumped.
 
         """
-        return await self.int_parser.dumps(argument.id)
+        return self.int_parser.dumps_sync(argument.id)
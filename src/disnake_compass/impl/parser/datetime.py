@@ -6,6 +6,7 @@ import typing
 
 import attrs
 
+from disnake_compass.api import parser as parser_api
 from disnake_compass.impl.parser import base as parser_base
 from disnake_compass.impl.parser import builtins as builtins_parsers
 
@@ -74,7 +75,9 @@ def _validate_resolution(
 #       Probably.
 @parser_base.register_parser_for(datetime.datetime)
 @attrs.define(slots=True)
-class DatetimeParser(parser_base.Parser[datetime.datetime]):
+class DatetimeParser(
+    parser_base.SyncParser[datetime.datetime], parser_api.PureParser[datetime.datetime]
+):
     r"""Parser type with support for datetimes.
 
     Parameters
@@ -131,7 +134,12 @@ class DatetimeParser(parser_base.Parser[datetime.datetime]):
     datetime object to be of the correct :attr:`timezone`.
     """
 
-    async def loads(self, argument: str, /) -> datetime.datetime:
+    @property
+    def is_pure(self) -> bool:  # noqa: D102
+        # <<Docstring inherited from parser_api.PureParser>>
+        return True
+
+    def loads_sync(self, argument: str, /) -> datetime.datetime:
         """Load a datetime from a string.
 
         This uses the underlying :attr:`int_parser`.
@@ -145,11 +153,11 @@ class DatetimeParser(parser_base.Parser[datetime.datetime]):
 
         """
         return datetime.datetime.fromtimestamp(
-            await self.int_parser.loads(argument) * self.resolution,
+            self.int_parser.loads_sync(argument) * self.resolution,
             tz=self.timezone,
         )
 
-    async def dumps(self, argument: datetime.datetime, /) -> str:
+    def dumps_sync(self, argument: datetime.datetime, /) -> str:
         """Dump a datetime into a string.
 
         This uses the underlying :attr:`int_parser`.
@@ -189,12 +197,14 @@ class DatetimeParser(parser_base.Parser[datetime.datetime]):
         if self.resolution != 0:
             timestamp //= self.resolution
 
-        return await self.int_parser.dumps(int(timestamp))
+        return self.int_parser.dumps_sync(int(timestamp))
 
 
 @parser_base.register_parser_for(datetime.timedelta)
 @attrs.define(slots=True)
-class TimedeltaParser(parser_base.Parser[datetime.timedelta]):
+class TimedeltaParser(
+    parser_base.SyncParser[datetime.timedelta], parser_api.PureParser[datetime.timedelta]
+):
     r"""Parser type with support for :class:`datetime.timedelta`\s.
 
     Parameters
@@ -233,7 +243,12 @@ class TimedeltaParser(parser_base.Parser[datetime.timedelta]):
         Since custom id space is limited, seconds was chosen as the default.
     """
 
-    async def loads(self, argument: str, /) -> datetime.timedelta:
+    @property
+    def is_pure(self) -> bool:  # noqa: D102
+        # <<Docstring inherited from parser_api.PureParser>>
+        return True
+
+    def loads_sync(self, argument: str, /) -> datetime.timedelta:
         """Load a timedelta from a string.
 
         This uses the underlying :attr:`int_parser`.
@@ -244,10 +259,10 @@ class TimedeltaParser(parser_base.Parser[datetime.timedelta]):
             The string that is to be converted into a timedelta.
 
         """
-        seconds = await self.int_parser.loads(argument) * self.resolution
+        seconds = self.int_parser.loads_sync(argument) * self.resolution
         return datetime.timedelta(seconds=seconds)
 
-    async def dumps(self, argument: datetime.timedelta, /) -> str:
+    def dumps_sync(self, argument: datetime.timedelta, /) -> str:
         """Dump a timedelta into a string.
 
         This uses the underlying :attr:`int_parser`.
@@ -258,12 +273,12 @@ class TimedeltaParser(parser_base.Parser[datetime.timedelta]):
             The value that is to be dumped.
 
         """
-        return await self.int_parser.dumps(int(argument.total_seconds() // self.resolution))
+        return self.int_parser.dumps_sync(int(argument.total_seconds() // self.resolution))
 
 
 @parser_base.register_parser_for(datetime.date)
 @attrs.define(slots=True)
-class DateParser(parser_base.Parser[datetime.date]):
+class DateParser(parser_base.SyncParser[datetime.date], parser_api.PureParser[datetime.date]):
     """Parser type with support for dates.
 
     Parameters
@@ -282,7 +297,12 @@ class DateParser(parser_base.Parser[datetime.date]):
     default date parser will also return compressed results.
     """
 
-    async def loads(self, argument: str, /) -> datetime.date:
+    @property
+    def is_pure(self) -> bool:  # noqa: D102
+        # <<Docstring inherited from parser_api.PureParser>>
+        return True
+
+    def loads_sync(self, argument: str, /) -> datetime.date:
         """Load a date from a string.
 
         This uses the underlying :attr:`int_parser`.
@@ -293,9 +313,9 @@ class DateParser(parser_base.Parser[datetime.date]):
             The string that is to be converted into a date.
 
         """
-        return datetime.date.fromordinal(await self.int_parser.loads(argument))
+        return datetime.date.fromordinal(self.int_parser.loads_sync(argument))
 
-    async def dumps(self, argument: datetime.date, /) -> str:
+    def dumps_sync(self, argument: datetime.date, /) -> str:
         """Dump a datetime into a string.
 
         This uses the underlying :attr:`int_parser`.
@@ -306,12 +326,12 @@ class DateParser(parser_base.Parser[datetime.date]):
             The value that is to be dumped.
 
         """
-        return await self.int_parser.dumps(datetime.date.toordinal(argument))
+        return self.int_parser.dumps_sync(datetime.date.toordinal(argument))
 
 
 @parser_base.register_parser_for(datetime.time)
 @attrs.define(slots=True)
-class TimeParser(parser_base.Parser[datetime.time]):
+class TimeParser(parser_base.SyncParser[datetime.time], parser_api.PureParser[datetime.time]):
     r"""Parser type with support for times.
 
     .. important::
@@ -374,7 +394,12 @@ class TimeParser(parser_base.Parser[datetime.time]):
     def resolution(self, resolution: float) -> None:
         self.timedelta_parser.resolution = resolution
 
-    async def loads(self, argument: str, /) -> datetime.time:
+    @property
+    def is_pure(self) -> bool:  # noqa: D102
+        # <<Docstring inherited from parser_api.PureParser>>
+        return True
+
+    def loads_sync(self, argument: str, /) -> datetime.time:
         """Load a time from a string.
 
         This uses the underlying :attr:`timedelta_parser`.
@@ -387,10 +412,10 @@ class TimeParser(parser_base.Parser[datetime.time]):
             The string that is to be converted into a time.
 
         """
-        dt = datetime.datetime.min + await self.timedelta_parser.loads(argument)
+        dt = datetime.datetime.min + self.timedelta_parser.loads_sync(argument)
         return dt.time().replace(tzinfo=self.timezone)
 
-    async def dumps(self, argument: datetime.time, /) -> str:
+    def dumps_sync(self, argument: datetime.time, /) -> str:
         """Dump a time into a string.
 
         This uses the underlying :attr:`timedelta_parser`.
@@ -426,7 +451,7 @@ class TimeParser(parser_base.Parser[datetime.time]):
             )
             raise ValueError(msg)
 
-        return await self.timedelta_parser.dumps(
+        return self.timedelta_parser.dumps_sync(
             datetime.timedelta(
                 hours=argument.hour,
                 minutes=argument.minute,
@@ -438,7 +463,9 @@ class TimeParser(parser_base.Parser[datetime.time]):
 
 @parser_base.register_parser_for(datetime.timezone)
 @attrs.define(slots=True)
-class TimezoneParser(parser_base.Parser[datetime.timezone]):
+class TimezoneParser(
+    parser_base.SyncParser[datetime.timezone], parser_api.PureParser[datetime.timezone]
+):
     r"""Parser type with support for :class:`~datetime.timezone`\s.
 
     .. important::
@@ -483,7 +510,12 @@ class TimezoneParser(parser_base.Parser[datetime.timezone]):
     def resolution(self, resolution: float) -> None:
         self.timedelta_parser.resolution = resolution
 
-    async def loads(self, argument: str, /) -> datetime.timezone:
+    @property
+    def is_pure(self) -> bool:  # noqa: D102
+        # <<Docstring inherited from parser_api.PureParser>>
+        return True
+
+    def loads_sync(self, argument: str, /) -> datetime.timezone:
         """Load a timezone from a string.
 
         This uses the underlying :attr:`timedelta_parser`.
@@ -494,9 +526,9 @@ class TimezoneParser(parser_base.Parser[datetime.timezone]):
             The string that is to be converted into a timezone.
 
         """
-        return datetime.timezone(await self.timedelta_parser.loads(argument))
+        return datetime.timezone(self.timedelta_parser.loads_sync(argument))
 
-    async def dumps(self, argument: datetime.timezone, /) -> str:
+    def dumps_sync(self, argument: datetime.timezone, /) -> str:
         """Dump a timezone into a string.
 
         This uses the underlying :attr:`timedelta_parser`.
@@ -507,4 +539,4 @@ class TimezoneParser(parser_base.Parser[datetime.timezone]):
             The value that is to be dumped.
 
         """
-        return await self.timedelta_parser.dumps(argument.utcoffset(None))
+        return self.timedelta_parser.dumps_sync(argument.utcoffset(None))
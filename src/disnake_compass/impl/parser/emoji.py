@@ -9,6 +9,7 @@ import disnake
 
 from disnake_compass.impl.parser import base as parser_base
 from disnake_compass.impl.parser import builtins as builtins_parsers
+from disnake_compass.internal import cache as cache_utils
 from disnake_compass.internal import di
 
 __all__: typing.Sequence[str] = (
@@ -25,7 +26,7 @@ __all__: typing.Sequence[str] = (
 # TODO: Maybe implement some way of *not* requiring ids for partial emoji
 @parser_base.register_parser_for(disnake.PartialEmoji)
 @attrs.define(slots=True)
-class PartialEmojiParser(parser_base.Parser[disnake.PartialEmoji]):
+class PartialEmojiParser(parser_base.SyncParser[disnake.PartialEmoji]):
     r"""Parser type with support for partial emoji.
 
     Parameters
@@ -46,7 +47,7 @@ class PartialEmojiParser(parser_base.Parser[disnake.PartialEmoji]):
     default partial emoji parser will also return compressed results.
     """
 
-    async def loads(self, argument: str, /) -> disnake.PartialEmoji:
+    def loads_sync(self, argument: str, /) -> disnake.PartialEmoji:
         """Load a partial emoji from a string.
 
         This uses the underlying :attr:`int_parser`.
@@ -57,9 +58,9 @@ class PartialEmojiParser(parser_base.Parser[disnake.PartialEmoji]):
             The value that is to be loaded into a partial emoji.
 
         """
-        return disnake.PartialEmoji.from_dict({"id": self.int_parser.loads(argument)})
+        return disnake.PartialEmoji.from_dict({"id": self.int_parser.loads_sync(argument)})
 
-    async def dumps(self, argument: disnake.PartialEmoji, /) -> str:
+    def dumps_sync(self, argument: disnake.PartialEmoji, /) -> str:
         """Dump a partial emoji into a string.
 
         This uses the underlying :attr:`int_parser`.
@@ -74,7 +75,7 @@ class PartialEmojiParser(parser_base.Parser[disnake.PartialEmoji]):
             msg = "PartialEmojiParser requires PartialEmoji.id to be set."
             raise ValueError(msg)
 
-        return await self.int_parser.dumps(argument.id)
+        return self.int_parser.dumps_sync(argument.id)
 
 
 @parser_base.register_parser_for(disnake.Emoji)
@@ -89,6 +90,9 @@ class EmojiParser(parser_base.Parser[disnake.Emoji]):
         internally for this parser.
     allow_api_requests:
         Whether or not to allow this parser to make API requests.
+    cache:
+        The :class:`~disnake_compass.internal.cache.FetchCache` in which to
+        store API request results.
 
     """
 
@@ -106,6 +110,15 @@ class EmojiParser(parser_base.Parser[disnake.Emoji]):
 
     Parsers will always try getting a result from cache first.
     """
+    cache: cache_utils.FetchCache[typing.Any, typing.Any] | None = attrs.field(
+        default=None, kw_only=True
+    )
+    """The cache in which to store emojis fetched through the API.
+
+    If set, emojis fetched through the API are stored in this cache, and
+    concurrent fetches of the same emoji share a single request. The same
+    cache can be shared between multiple parsers. Defaults to ``None``.
+    """
 
     async def loads(self, argument: str, /) -> disnake.Emoji:
         """Load an emoji from a string.
@@ -132,7 +145,9 @@ class EmojiParser(parser_base.Parser[disnake.Emoji]):
 
         if self.allow_api_requests:
             guild = di.resolve_dependency(disnake.Guild)
-            return await guild.fetch_emoji(emoji_id)
+            return await cache_utils.cached_fetch(
+                self.cache, ("emoji", emoji_id), lambda: guild.fetch_emoji(emoji_id)
+            )
 
         msg = f"Could not find an emoji with id {emoji_id}."
         raise LookupError(msg)
@@ -163,6 +178,9 @@ class StickerParser(parser_base.Parser[disnake.Sticker]):
         internally for this parser.
     allow_api_requests:
         Whether or not to allow this parser to make API requests.
+    cache:
+        The :class:`~disnake_compass.internal.cache.FetchCache` in which to
+        store API request results.
 
     """
 
@@ -180,6 +198,15 @@ class StickerParser(parser_base.Parser[disnake.Sticker]):
 
     Parsers will always try getting a result from cache first.
     """
+    cache: cache_utils.FetchCache[typing.Any, typing.Any] | None = attrs.field(
+        default=None, kw_only=True
+    )
+    """The cache in which to store stickers fetched through the API.
+
+    If set, stickers fetched through the API are stored in this cache, and
+    concurrent fetches of the same sticker share a single request. The same
+    cache can be shared between multiple parsers. Defaults to ``None``.
+    """
 
     async def loads(self, argument: str, /) -> disnake.Sticker:
         """Load a sticker from a string.
@@ -206,7 +233,9 @@ class StickerParser(parser_base.Parser[disnake.Sticker]):
 
         if self.allow_api_requests:
             guild = di.resolve_dependency(disnake.Guild)
-            return await guild.fetch_sticker(sticker_id)
+            return await cache_utils.cached_fetch(
+                self.cache, ("sticker", sticker_id), lambda: guild.fetch_sticker(sticker_id)
+            )
 
         msg = f"Could not find an emoji with id {sticker_id}."
         raise LookupError(msg)
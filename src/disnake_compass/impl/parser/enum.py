@@ -5,6 +5,7 @@ import typing
 
 import attrs
 import disnake
+import typing_extensions
 
 from disnake_compass.api import parser as parser_api
 from disnake_compass.impl.parser import base as parser_base
@@ -47,12 +48,18 @@ def _get_enum_type(enum_class: type[_AnyEnum]) -> type | None:
     priority=20,
 )
 @attrs.define(slots=True, init=False)
-class EnumParser(parser_base.Parser[_EnumT]):
+class EnumParser(
+    parser_base.SyncParser[_EnumT], parser_api.PureParser[_EnumT], parser_api.PackableParser[_EnumT]
+):
     """Parser type for enums and flags.
 
     Enums and flags are stored by value instead of by name. This makes parsing
     a bit slower, but values are generally shorter than names.
 
+    Enums (but not flags) can additionally be packed, in which case members
+    are stored by their index in the enum, using only as many bits as needed
+    to distinguish between all members.
+
     This parser type works for standard library and disnake enums and flags.
     Note that this only works for enums and flags where all values are of the
     same type.
@@ -87,6 +94,9 @@ class EnumParser(parser_base.Parser[_EnumT]):
     :class:`~disnake_compass.parser.StringParser`.
     """
 
+    _members: tuple[_EnumT, ...] = attrs.field(init=False, repr=False)
+    _indices: dict[_EnumT, int] = attrs.field(init=False, repr=False)
+
     def __init__(
         self,
         enum_class: type[_EnumT],
@@ -127,6 +137,113 @@ class EnumParser(parser_base.Parser[_EnumT]):
         self.enum_class = enum_class
         self.value_parser = parser_base.get_parser(value_type)
 
+        if issubclass(enum_class, enum.Flag | disnake.flags.BaseFlags):
+            # Combinations of flags are not members, so they cannot be indexed.
+            self._members = ()
+        else:
+            self._members = tuple(enum_class)
+        self._indices = {member: index for index, member in enumerate(self._members)}
+
+    @classmethod
+    def default(cls, target_type: type[_EnumT], /) -> typing_extensions.Self:  # noqa: D102
+        # <<Docstring inherited from parser_api.Parser>>
+        return cls(target_type)
+
+    @property
+    def is_sync(self) -> bool:
+        """Whether this parser can parse synchronously.
+
+        This is the case if the :attr:`value_parser` can parse synchronously.
+        """
+        return parser_base.is_sync_parser(self.value_parser)
+
+    @property
+    def is_pure(self) -> bool:
+        """Whether the values loaded by this parser may be cached.
+
+        This is the case if the :attr:`value_parser` is pure, unless
+        :attr:`enum_class` is a disnake flag, as these are mutable.
+        """
+        return not issubclass(self.enum_class, disnake.flags.BaseFlags) and (
+            parser_base.is_pure_parser(self.value_parser)
+        )
+
+    @property
+    def bit_length(self) -> int | None:
+        """The number of bits required to store any member of the enum by index.
+
+        This is ``None`` for flags, as these cannot be packed.
+        """
+        if not self._members:
+            return None
+
+        return (len(self._members) - 1).bit_length()
+
+    def pack(self, argument: _EnumT, /) -> int:
+        """Pack an enum member into its index in the enum.
+
+        This can only be used if :attr:`bit_length` is not ``None``.
+
+        Parameters
+        ----------
+        argument:
+            The enum member that is to be packed.
+
+        """
+        return self._indices[argument]
+
+    def unpack(self, argument: int, /) -> _EnumT:
+        """Unpack an enum member from its index in the enum.
+
+        This can only be used if :attr:`bit_length` is not ``None``.
+
+        Parameters
+        ----------
+        argument:
+            The index of the enum member.
+
+        """
+        return self._members[argument]
+
+    def loads_sync(self, argument: str, /) -> _EnumT:
+        """Load an enum member from a string synchronously.
+
+        This can only be used if :attr:`is_sync` is ``True``. See
+        :meth:`loads` for further details.
+
+        Parameters
+        ----------
+        argument:
+            The value that is to be loaded into an enum member.
+
+        """
+        parsed = typing.cast(parser_api.SyncParser[typing.Any], self.value_parser).loads_sync(
+            argument
+        )
+
+        if self.store_by_value:
+            return self.enum_class(parsed)  # pyright: ignore[reportCallIssue]
+        return self.enum_class[parsed]  # pyright: ignore[reportInvalidTypeArguments]
+
+    def dumps_sync(self, argument: _EnumT, /) -> str:
+        """Dump an enum member into a string synchronously.
+
+        This can only be used if :attr:`is_sync` is ``True``. See
+        :meth:`dumps` for further details.
+
+        Parameters
+        ----------
+        argument:
+            The value that is to be dumped.
+
+        """
+        dumps = typing.cast(parser_api.SyncParser[typing.Any], self.value_parser).dumps_sync
+        if self.store_by_value:
+            return dumps(argument.value)
+
+        assert not isinstance(argument, disnake.flags.BaseFlags)
+        return dumps(argument.name)
+
     async def loads(self, argument: str, /) -> _EnumT:
         """Load an enum member from a string.
 
@@ -10,6 +10,7 @@ import disnake
 
 from disnake_compass.impl.parser import base as parser_base
 from disnake_compass.impl.parser import builtins as builtins_parsers
+from disnake_compass.internal import cache as cache_utils
 from disnake_compass.internal import di
 
 __all__: typing.Sequence[str] = (
@@ -18,6 +19,10 @@ __all__: typing.Sequence[str] = (
     "RoleParser",
 )
 
+# Shared between all role parsers such that concurrent loads of roles in the
+# same guild make only one fetch_roles request.
+_ROLE_FETCHES: cache_utils.SingleFlight[int, list[disnake.Role]] = cache_utils.SingleFlight()
+
 
 @parser_base.register_parser_for(disnake.Guild)
 @attrs.define(slots=True)
@@ -34,6 +39,9 @@ class GuildParser(parser_base.Parser[disnake.Guild]):
         internally for this parser.
     allow_api_requests:
         Whether or not to allow this parser to make API requests.
+    cache:
+        The :class:`~disnake_compass.internal.cache.FetchCache` in which to
+        store API request results.
 
     """
 
@@ -51,6 +59,15 @@ class GuildParser(parser_base.Parser[disnake.Guild]):
 
     Parsers will always try getting a result from cache first.
     """
+    cache: cache_utils.FetchCache[typing.Any, typing.Any] | None = attrs.field(
+        default=None, kw_only=True
+    )
+    """The cache in which to store guilds fetched through the API.
+
+    If set, guilds fetched through the API are stored in this cache, and
+    concurrent fetches of the same guild share a single request. The same
+    cache can be shared between multiple parsers. Defaults to ``None``.
+    """
 
     async def loads(self, argument: str, /) -> disnake.Guild:
         """Load a guild from a string.
@@ -82,7 +99,9 @@ class GuildParser(parser_base.Parser[disnake.Guild]):
 
             if self.allow_api_requests:
                 with contextlib.suppress(disnake.HTTPException):
-                    return await maybe_client.fetch_guild(guild_id)
+                    return await cache_utils.cached_fetch(
+                        self.cache, ("guild", guild_id), lambda: maybe_client.fetch_guild(guild_id)
+                    )
 
         msg = f"Could not find a guild with id {guild_id}."
         raise LookupError(msg)
@@ -185,6 +204,9 @@ class RoleParser(parser_base.Parser[disnake.Role]):
         internally for this parser.
     allow_api_requests:
         Whether or not to allow this parser to make API requests.
+    cache:
+        The :class:`~disnake_compass.internal.cache.FetchCache` in which to
+        store API request results.
 
     """
 
@@ -202,6 +224,15 @@ class RoleParser(parser_base.Parser[disnake.Role]):
 
     Parsers will always try getting a result from cache first.
     """
+    cache: cache_utils.FetchCache[typing.Any, typing.Any] | None = attrs.field(
+        default=None, kw_only=True
+    )
+    """The cache in which to store roles fetched through the API.
+
+    If set, roles fetched through the API are stored in this cache, and
+    concurrent fetches of the same role share a single request. The same
+    cache can be shared between multiple parsers. Defaults to ``None``.
+    """
 
     async def loads(self, argument: str) -> disnake.Role:
         """Load a role from a string.
@@ -227,14 +258,28 @@ class RoleParser(parser_base.Parser[disnake.Role]):
             return role
 
         if self.allow_api_requests:
-            with contextlib.suppress(disnake.HTTPException):
-                for role in await guild.fetch_roles():
-                    if role.id == role_id:
-                        return role
+            with contextlib.suppress(disnake.HTTPException, LookupError):
+                return await cache_utils.cached_fetch(
+                    self.cache, ("role", role_id), lambda: self._fetch_role(guild, role_id)
+                )
 
         msg = f"Could not find a role with id {argument!r}."
         raise LookupError(msg)
 
+    async def _fetch_role(self, guild: disnake.Guild, role_id: int) -> disnake.Role:
+        roles = await _ROLE_FETCHES.do(guild.id, guild.fetch_roles)
+        if self.cache is not None:
+            # We get all roles anyway, so we may as well cache all of them.
+            for role in roles:
+                self.cache.set(("role", role.id), role)
+
+        for role in roles:
+            if role.id == role_id:
+                return role
+
+        msg = f"Could not find a role with id {role_id}."
+        raise LookupError(msg)
+
     async def dumps(self, argument: disnake.Role) -> str:
         """Dump a role into a string.
 
@@ -0,0 +1,261 @@
+"""Parser implementation for lazily loaded custom id fields."""
+
+from __future__ import annotations
+
+import typing
+
+import attrs
+import typing_extensions
+
+from disnake_compass.api import parser as parser_api
+from disnake_compass.impl.parser import base as parser_base
+
+__all__: typing.Sequence[str] = ("Lazy", "LazyParser")
+
+_T = typing_extensions.TypeVar("_T")
+
+
+class _Unloaded:
+    __slots__: typing.Sequence[str] = ()
+
+    def __repr__(self) -> str:
+        return "<unloaded>"
+
+
+_UNLOADED: typing.Final = _Unloaded()
+
+
+class Lazy(typing.Generic[_T]):
+    r"""A custom id field value that is only loaded once it is accessed.
+
+    Annotating a custom id field as ``Lazy[T]`` makes the component store the
+    raw custom id segment for that field instead of immediately parsing it
+    into a ``T``. The value is then only parsed when it is first requested,
+    after which it is cached on the :class:`Lazy` instance.
+
+    This is mainly useful for fields of which the parsers may need to make api
+    requests, such as :class:`~disnake.Member` or :class:`~disnake.Message`,
+    and which are not needed in every invocation of the component callback.
+
+    .. code-block:: python
+
+        class MyButton(disnake_compass.RichButton):
+            target: disnake_compass.parser.Lazy[disnake.Member]
+
+            async def callback(self, interaction):
+                if some_condition:
+                    member = await self.target  # Only fetched here.
+
+    To create a component with a lazy field, wrap the value using
+    :meth:`from_value`.
+
+    .. note::
+        As parsers may depend on the dependencies set by the component manager
+        during invocation, lazy values should be loaded inside the component
+        callback.
+
+    Parameters
+    ----------
+    argument:
+        The raw custom id segment to load the value from.
+    parser:
+        The parser with which to load the value.
+
+    """
+
+    __slots__: typing.Sequence[str] = ("_argument", "_parser", "_value")
+
+    _argument: str | None
+    _parser: parser_api.Parser[_T] | None
+    _value: _T | _Unloaded
+
+    def __init__(self, argument: str, parser: parser_api.Parser[_T]) -> None:
+        self._argument = argument
+        self._parser = parser
+        self._value = _UNLOADED
+
+    @classmethod
+    def from_value(cls, value: _T) -> Lazy[_T]:
+        """Create a lazy value that is already loaded.
+
+        When dumped, the value is dumped using the inner parser of the
+        :class:`LazyParser` of the field.
+
+        Parameters
+        ----------
+        value:
+            The value to wrap.
+
+        """
+        self = cls.__new__(cls)
+        self._argument = None
+        self._parser = None
+        self._value = value
+        return self
+
+    def __repr__(self) -> str:
+        if self.is_loaded:
+            return f"Lazy({self._value!r})"
+
+        return f"Lazy(<unloaded {self._argument!r}>)"
+
+    def __await__(self) -> typing.Generator[typing.Any, None, _T]:
+        return self.get().__await__()
+
+    @property
+    def argument(self) -> str | None:
+        """The raw custom id segment from which this value is loaded.
+
+        This is ``None`` if this value was created using :meth:`from_value`.
+        """
+        return self._argument
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether the value has been loaded."""
+        return self._value is not _UNLOADED
+
+    @property
+    def is_sync(self) -> bool:
+        """Whether the value can be loaded using :meth:`get_sync`.
+
+        This is the case if the value was already loaded, or if the underlying
+        parser can parse synchronously.
+        """
+        return self.is_loaded or (
+            self._parser is not None and parser_base.is_sync_parser(self._parser)
+        )
+
+    def get_sync(self) -> _T:
+        """Get the value, loading it synchronously if it was not yet loaded.
+
+        This can only be used if :attr:`is_sync` is ``True``.
+
+        Raises
+        ------
+        :class:`TypeError`:
+            The value was not yet loaded and the underlying parser cannot
+            parse synchronously.
+
+        """
+        if not isinstance(self._value, _Unloaded):
+            return self._value
+
+        assert self._parser is not None
+        assert self._argument is not None
+        if not parser_base.is_sync_parser(self._parser):
+            msg = (
+                f"Parser {type(self._parser).__name__!r} cannot load synchronously."
+                " Use 'await Lazy.get()' instead."
+            )
+            raise TypeError(msg)
+
+        self._value = value = self._parser.loads_sync(self._argument)
+        return value
+
+    async def get(self) -> _T:
+        """Get the value, loading it if it was not yet loaded."""
+        if not isinstance(self._value, _Unloaded):
+            return self._value
+
+        assert self._parser is not None
+        assert self._argument is not None
+        self._value = value = await self._parser.loads(self._argument)
+        return value
+
+
+@parser_base.register_parser_for(Lazy)
+@attrs.define(slots=True)
+class LazyParser(parser_base.SyncParser[Lazy[_T]], typing.Generic[_T]):
+    r"""Parser type with support for :class:`Lazy` values.
+
+    Loading a value with this parser never calls the :attr:`inner_parser`;
+    it merely wraps the argument in a :class:`Lazy`. Similarly, dumping a
+    :class:`Lazy` that was loaded by this parser reuses the original argument.
+
+    Parameters
+    ----------
+    inner_parser:
+        The parser with which to load and dump the wrapped value.
+
+    """
+
+    inner_parser: parser_api.Parser[_T]
+    """The parser with which to load and dump the wrapped value."""
+
+    @classmethod
+    def default(cls, type_: type[Lazy[_T]], /) -> typing_extensions.Self:  # noqa: D102
+        # <<Docstring inherited from parser_api.Parser>>
+        args = typing.get_args(type_)
+        if not args:
+            msg = "Lazy requires a type argument, e.g. Lazy[disnake.Member]."
+            raise TypeError(msg)
+
+        return cls(parser_base.get_parser(args[0]))
+
+    @property
+    def is_sync(self) -> bool:
+        """Whether this parser can parse synchronously.
+
+        This is the case if the :attr:`inner_parser` can parse synchronously.
+        Note that loading is always synchronous, and that dumping is only
+        asynchronous for values created through :meth:`Lazy.from_value`.
+        """
+        return parser_base.is_sync_parser(self.inner_parser)
+
+    def loads_sync(self, argument: str, /) -> Lazy[_T]:
+        """Wrap a string in a :class:`Lazy` without loading it.
+
+        Parameters
+        ----------
+        argument:
+            The string that is to be loaded lazily.
+
+        """
+        return Lazy(argument, self.inner_parser)
+
+    def dumps_sync(self, argument: Lazy[_T], /) -> str:
+        """Dump a :class:`Lazy` value into a string synchronously.
+
+        This can only be used if :attr:`is_sync` is ``True``. See
+        :meth:`dumps` for further details.
+
+        Parameters
+        ----------
+        argument:
+            The value that is to be dumped.
+
+        """
+        if argument.argument is not None:
+            return argument.argument
+
+        parser = typing.cast(parser_api.SyncParser[_T], self.inner_parser)
+        return parser.dumps_sync(argument.get_sync())
+
+    async def loads(self, argument: str, /) -> Lazy[_T]:
+        """Wrap a string in a :class:`Lazy` without loading it.
+
+        Parameters
+        ----------
+        argument:
+            The string that is to be loaded lazily.
+
+        """
+        return self.loads_sync(argument)
+
+    async def dumps(self, argument: Lazy[_T], /) -> str:
+        """Dump a :class:`Lazy` value into a string.
+
+        If the value was loaded by this parser, the original argument is
+        returned without invoking the :attr:`inner_parser`.
+
+        Parameters
+        ----------
+        argument:
+            The value that is to be dumped.
+
+        """
+        if argument.argument is not None:
+            return argument.argument
+
+        return await self.inner_parser.dumps(await argument.get())
@@ -10,6 +10,7 @@ import disnake
 
 from disnake_compass.impl.parser import base as parser_base
 from disnake_compass.impl.parser import builtins as builtins_parsers
+from disnake_compass.internal import cache as cache_utils
 from disnake_compass.internal import di
 
 __all__: typing.Sequence[str] = ("MessageParser", "PartialMessageParser")
@@ -30,7 +31,7 @@ class SupportsGetPartialMessage(typing.Protocol):
 
 @parser_base.register_parser_for(disnake.PartialMessage)
 @attrs.define(slots=True)
-class PartialMessageParser(parser_base.Parser[disnake.PartialMessage]):
+class PartialMessageParser(parser_base.SyncParser[disnake.PartialMessage]):
     r"""Parser type with support for partial messages.
 
     Parameters
@@ -58,7 +59,7 @@ class PartialMessageParser(parser_base.Parser[disnake.PartialMessage]):
     channel: SupportsGetPartialMessage | None = attrs.field(default=None, kw_only=True)
     """The channel in which to make the partial message."""
 
-    async def loads(self, argument: str, /) -> disnake.PartialMessage:
+    def loads_sync(self, argument: str, /) -> disnake.PartialMessage:
         """Load a partial message from a string.
 
         This uses the underlying :attr:`int_parser`.
@@ -83,9 +84,9 @@ class PartialMessageParser(parser_base.Parser[disnake.PartialMessage]):
             )
             raise RuntimeError(msg)
 
-        return channel.get_partial_message(await self.int_parser.loads(argument))
+        return channel.get_partial_message(self.int_parser.loads_sync(argument))
 
-    async def dumps(self, argument: disnake.PartialMessage, /) -> str:
+    def dumps_sync(self, argument: disnake.PartialMessage, /) -> str:
         """Dump a partial message into a string.
 
         This uses the underlying :attr:`int_parser`.
@@ -96,7 +97,7 @@ class PartialMessageParser(parser_base.Parser[disnake.PartialMessage]):
             The value that is to be dumped.
 
         """
-        return await self.int_parser.dumps(argument.id)
+        return self.int_parser.dumps_sync(argument.id)
 
 
 @parser_base.register_parser_for(disnake.Message)
@@ -114,6 +115,9 @@ class MessageParser(parser_base.Parser[disnake.Message]):
         internally for this parser.
     allow_api_requests:
         Whether or not to allow this parser to make API requests.
+    cache:
+        The :class:`~disnake_compass.internal.cache.FetchCache` in which to
+        store API request results.
 
     """
 
@@ -131,6 +135,15 @@ class MessageParser(parser_base.Parser[disnake.Message]):
 
     Parsers will always try getting a result from cache first.
     """
+    cache: cache_utils.FetchCache[typing.Any, typing.Any] | None = attrs.field(
+        default=None, kw_only=True
+    )
+    """The cache in which to store messages fetched through the API.
+
+    If set, messages fetched through the API are stored in this cache, and
+    concurrent fetches of the same message share a single request. The same
+    cache can be shared between multiple parsers. Defaults to ``None``.
+    """
 
     async def loads(self, argument: str, /) -> disnake.Message:
         """Load a message from a string.
@@ -170,7 +183,11 @@ class MessageParser(parser_base.Parser[disnake.Message]):
             maybe_messageable = di.resolve_dependency(disnake.abc.Messageable, None)
             if maybe_messageable:
                 with contextlib.suppress(disnake.HTTPException):
-                    return await maybe_messageable.fetch_message(message_id)
+                    return await cache_utils.cached_fetch(
+                        self.cache,
+                        ("message", message_id),
+                        lambda: maybe_messageable.fetch_message(message_id),
+                    )
 
         msg = f"Could not find a message with id {argument!r}."
         raise LookupError(msg)
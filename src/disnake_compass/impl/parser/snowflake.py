@@ -7,19 +7,25 @@ import typing
 import attrs
 import disnake
 
+from disnake_compass.api import parser as parser_api
 from disnake_compass.impl.parser import base as parser_base
 from disnake_compass.impl.parser import builtins as builtins_parsers
 
 __all__: typing.Sequence[str] = ("SnowflakeParser",)
 
+_SNOWFLAKE_BITS: typing.Final[int] = 64
+
 
 @parser_base.register_parser_for(disnake.abc.Snowflake, disnake.Object)
 @attrs.define(slots=True)
-class SnowflakeParser(parser_base.Parser[disnake.abc.Snowflake]):
+class SnowflakeParser(
+    parser_base.SyncParser[disnake.abc.Snowflake],
+    parser_api.PackableParser[disnake.abc.Snowflake],
+):
     r"""Parser implementation for :class:`disnake.abc.Snowflake`\s.
 
     .. note::
-        As snowflakes are abstact, :meth:`loads` returns a
+        As snowflakes are abstact, :meth:`loads` and :meth:`unpack` return a
         :class:`disnake.Object` instead.
 
     Parameters
@@ -39,7 +45,7 @@ class SnowflakeParser(parser_base.Parser[disnake.abc.Snowflake]):
     default guild parser will also return compressed results.
     """
 
-    async def loads(self, argument: str, /) -> disnake.Object:
+    def loads_sync(self, argument: str, /) -> disnake.Object:
         """Load a snowflake from a string.
 
         This uses the underlying :attr:`int_parser`.
@@ -50,9 +56,9 @@ class SnowflakeParser(parser_base.Parser[disnake.abc.Snowflake]):
             The value that is to be loaded into a floating point number.
 
         """
-        return disnake.Object(await self.int_parser.loads(argument))
+        return disnake.Object(self.int_parser.loads_sync(argument))
 
-    async def dumps(self, argument: disnake.abc.Snowflake, /) -> str:
+    def dumps_sync(self, argument: disnake.abc.Snowflake, /) -> str:
         """Dump a snowflake into a string.
 
         This uses the underlying :attr:`int_parser`.
@@ -63,4 +69,31 @@ class SnowflakeParser(parser_base.Parser[disnake.abc.Snowflake]):
             The value that is to be dumped.
 
         """
-        return await self.int_parser.dumps(argument.id)
+        return self.int_parser.dumps_sync(argument.id)
+
+    @property
+    def bit_length(self) -> int:
+        """The number of bits required to store a snowflake, which is always 64."""
+        return _SNOWFLAKE_BITS
+
+    def pack(self, argument: disnake.abc.Snowflake, /) -> int:
+        """Pack a snowflake into its id.
+
+        Parameters
+        ----------
+        argument:
+            The value that is to be packed.
+
+        """
+        return argument.id
+
+    def unpack(self, argument: int, /) -> disnake.Object:
+        """Unpack a snowflake from its id.
+
+        Parameters
+        ----------
+        argument:
+            The id of the snowflake.
+
+        """
+        return disnake.Object(argument)
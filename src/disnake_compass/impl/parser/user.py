@@ -10,6 +10,7 @@ import disnake
 
 from disnake_compass.impl.parser import base as parser_base
 from disnake_compass.impl.parser import builtins as builtins_parsers
+from disnake_compass.internal import cache as cache_utils
 from disnake_compass.internal import di
 
 __all__: typing.Sequence[str] = ("MemberParser", "UserParser")
@@ -30,6 +31,9 @@ class UserParser(parser_base.Parser[disnake.User]):
         internally for this parser.
     allow_api_requests:
         Whether or not to allow this parser to make API requests.
+    cache:
+        The :class:`~disnake_compass.internal.cache.FetchCache` in which to
+        store API request results.
 
     """
 
@@ -47,6 +51,15 @@ class UserParser(parser_base.Parser[disnake.User]):
 
     Parsers will always try getting a result from cache first.
     """
+    cache: cache_utils.FetchCache[typing.Any, typing.Any] | None = attrs.field(
+        default=None, kw_only=True
+    )
+    """The cache in which to store users fetched through the API.
+
+    If set, users fetched through the API are stored in this cache, and
+    concurrent fetches of the same user share a single request. The same
+    cache can be shared between multiple parsers. Defaults to ``None``.
+    """
 
     async def loads(self, argument: str, /) -> disnake.User:
         """Load a user from a string.
@@ -81,7 +94,9 @@ class UserParser(parser_base.Parser[disnake.User]):
 
             if self.allow_api_requests:
                 with contextlib.suppress(disnake.HTTPException):
-                    return await maybe_client.fetch_user(user_id)
+                    return await cache_utils.cached_fetch(
+                        self.cache, ("user", user_id), lambda: maybe_client.fetch_user(user_id)
+                    )
 
         msg = f"Could not find a user with id {argument!r}."
         raise LookupError(msg)
@@ -115,6 +130,9 @@ class MemberParser(parser_base.Parser[disnake.Member]):
         internally for this parser.
     allow_api_requests:
         Whether or not to allow this parser to make API requests.
+    cache:
+        The :class:`~disnake_compass.internal.cache.FetchCache` in which to
+        store API request results.
 
     """
 
@@ -132,6 +150,15 @@ class MemberParser(parser_base.Parser[disnake.Member]):
 
     Parsers will always try getting a result from cache first.
     """
+    cache: cache_utils.FetchCache[typing.Any, typing.Any] | None = attrs.field(
+        default=None, kw_only=True
+    )
+    """The cache in which to store members fetched through the API.
+
+    If set, members fetched through the API are stored in this cache, and
+    concurrent fetches of the same member share a single request. The same
+    cache can be shared between multiple parsers. Defaults to ``None``.
+    """
 
     async def loads(self, argument: str, /) -> disnake.Member:
         """Load a member from a string.
@@ -162,7 +189,11 @@ class MemberParser(parser_base.Parser[disnake.Member]):
 
         if self.allow_api_requests:
             with contextlib.suppress(disnake.HTTPException):
-                return await guild.fetch_member(member_id)
+                return await cache_utils.cached_fetch(
+                    self.cache,
+                    ("member", guild.id, member_id),
+                    lambda: guild.fetch_member(member_id),
+                )
 
         msg = f"Could not find a member with id {argument!r}."
         raise LookupError(msg)
@@ -0,0 +1,184 @@
+"""Table-driven conversion between non-negative integers and strings."""
+
+from __future__ import annotations
+
+import string
+import typing
+
+__all__: typing.Sequence[str] = ("BASE36", "BASE62", "BASE93", "UNICODE", "Alphabet")
+
+# The maximum size of the encoding table. Bases for which two digits fit in
+# this table are encoded two digits at a time.
+_MAX_TABLE_SIZE: typing.Final[int] = 1 << 14
+_BASE36_CHARACTERS: typing.Final[str] = string.digits + string.ascii_lowercase
+
+
+class Alphabet:
+    """A set of characters used to represent integers in a given base.
+
+    The base of the alphabet is the number of characters it contains, such that
+    the first character represents 0, the second represents 1, and so on.
+
+    Encoding and decoding are table-driven: the digits of each character are
+    precomputed upon creation, and small alphabets additionally precompute all
+    two-digit strings, halving the number of divisions needed to encode a
+    number.
+
+    .. note::
+        When used in custom ids, the alphabet must not contain the separator
+        of the component manager.
+
+    Parameters
+    ----------
+    characters:
+        The characters of the alphabet, in order of the digits they represent.
+        These must be unique, and there must be at least two of them.
+
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_chunk",
+        "_chunk_base",
+        "_digits",
+        "_int_compatible",
+        "_table",
+        "characters",
+    )
+
+    characters: str
+    """The characters of this alphabet, in order of the digits they represent."""
+
+    _chunk: int
+    _chunk_base: int
+    _digits: dict[str, int]
+    _int_compatible: bool
+    _table: tuple[str, ...]
+
+    def __init__(self, characters: str) -> None:
+        if len(characters) < 2:  # noqa: PLR2004
+            msg = "An alphabet must contain at least two characters."
+            raise ValueError(msg)
+
+        if len(set(characters)) != len(characters):
+            msg = "The characters of an alphabet must be unique."
+            raise ValueError(msg)
+
+        self.characters = characters
+        self._digits = {character: digit for digit, character in enumerate(characters)}
+
+        base = len(characters)
+        self._chunk = 2 if base * base <= _MAX_TABLE_SIZE else 1
+        self._chunk_base = base**self._chunk
+        if self._chunk == 1:
+            self._table = tuple(characters)
+        else:
+            self._table = tuple(high + low for high in characters for low in characters)
+
+        # Alphabets that are a prefix of python's own digits can defer to int().
+        self._int_compatible = base <= 36 and characters == _BASE36_CHARACTERS[:base]  # noqa: PLR2004
+
+    def __repr__(self) -> str:
+        return f"Alphabet(base={self.base})"
+
+    def __len__(self) -> int:
+        return len(self.characters)
+
+    def __contains__(self, character: str) -> bool:
+        return character in self._digits
+
+    @property
+    def base(self) -> int:
+        """The base of this alphabet, i.e. the number of characters in it."""
+        return len(self.characters)
+
+    def encode(self, number: int, /) -> str:
+        """Encode a non-negative integer into a string of this alphabet.
+
+        Parameters
+        ----------
+        number:
+            The integer to encode.
+
+        Raises
+        ------
+        :class:`ValueError`:
+            The integer is negative.
+
+        """
+        if number < 0:
+            msg = "Only non-negative integers can be encoded."
+            raise ValueError(msg)
+
+        if number < self.base:
+            return self.characters[number]
+
+        table, chunk_base = self._table, self._chunk_base
+        chunks: list[str] = []
+        while number:
+            number, remainder = divmod(number, chunk_base)
+            chunks.append(table[remainder])
+
+        encoded = "".join(reversed(chunks))
+        if self._chunk > 1 and encoded[0] == self.characters[0]:
+            # The most significant chunk was zero-padded.
+            return encoded[1:]
+
+        return encoded
+
+    def decode(self, encoded: str, /) -> int:
+        """Decode a string of this alphabet into a non-negative integer.
+
+        Parameters
+        ----------
+        encoded:
+            The string to decode.
+
+        Raises
+        ------
+        :class:`ValueError`:
+            The string is empty or contains characters outside this alphabet.
+
+        """
+        if self._int_compatible:
+            if not (encoded.isascii() and encoded.isalnum()):
+                msg = f"{encoded!r} is not a valid base-{self.base} number."
+                raise ValueError(msg)
+
+            return int(encoded, self.base)
+
+        if not encoded:
+            msg = "Cannot decode an empty string."
+            raise ValueError(msg)
+
+        digits, base = self._digits, self.base
+        number = 0
+        try:
+            for character in encoded:
+                number = number * base + digits[character]
+
+        except KeyError as exc:
+            msg = f"{encoded!r} contains characters outside of this base-{base} alphabet."
+            raise ValueError(msg) from exc
+
+        return number
+
+
+BASE36: typing.Final[Alphabet] = Alphabet(_BASE36_CHARACTERS)
+"""Digits and lowercase ascii letters. This matches python's :class:`int` conversion."""
+
+BASE62: typing.Final[Alphabet] = Alphabet(_BASE36_CHARACTERS + string.ascii_uppercase)
+"""Digits, lowercase and uppercase ascii letters."""
+
+BASE93: typing.Final[Alphabet] = Alphabet(
+    "".join(chr(code) for code in range(0x21, 0x7F) if chr(code) != "|"),
+)
+"""All printable, non-whitespace ascii characters except for the default separator ``"|"``."""
+
+UNICODE: typing.Final[Alphabet] = Alphabet(
+    "".join(chr(code) for code in range(0x4E00, 0xA000)),
+)
+"""The 20992 characters of the CJK Unified Ideographs block.
+
+Each character stores a little over 14 bits, compared to just over 5 bits for
+:data:`BASE36`.
+"""
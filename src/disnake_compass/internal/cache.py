@@ -0,0 +1,349 @@
+"""Caching and request coalescing for values that are expensive to obtain."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import time
+import typing
+
+import attrs
+
+__all__: typing.Sequence[str] = ("CacheStats", "FetchCache", "SingleFlight", "cached_fetch")
+
+_KeyT = typing.TypeVar("_KeyT", bound=typing.Hashable)
+_ValueT = typing.TypeVar("_ValueT")
+
+
+class SingleFlight(typing.Generic[_KeyT, _ValueT]):
+    """A group of in-flight fetches, keyed by what they fetch.
+
+    Concurrent :meth:`do` calls for the same key share the result of the
+    first call, such that only one fetch is in progress per key at any time.
+    Results are not stored once the fetch completes; see :class:`FetchCache`
+    for that.
+    """
+
+    __slots__: typing.Sequence[str] = ("_futures",)
+
+    _futures: dict[_KeyT, asyncio.Future[_ValueT]]
+
+    def __init__(self) -> None:
+        self._futures = {}
+
+    def __len__(self) -> int:
+        return len(self._futures)
+
+    def __contains__(self, key: _KeyT) -> bool:
+        return key in self._futures
+
+    async def do(
+        self,
+        key: _KeyT,
+        fetch: typing.Callable[[], typing.Awaitable[_ValueT]],
+    ) -> _ValueT:
+        """Fetch a value, or wait for the fetch already in progress for the same key.
+
+        The fetch runs in a task of its own, such that cancelling any caller,
+        including the one that started the fetch, does not cancel the fetch
+        for any other caller. If the fetch raises, the exception is propagated
+        to all callers.
+
+        Parameters
+        ----------
+        key:
+            The key identifying the value that is fetched.
+        fetch:
+            A function returning an awaitable that resolves to the value. This
+            is only called if no fetch for the key is in progress.
+
+        """
+        future = self._futures.get(key)
+        if future is None:
+            future = self._futures[key] = asyncio.ensure_future(fetch())
+            future.add_done_callback(lambda done: self._finish(key, done))
+
+        return await asyncio.shield(future)
+
+    def _finish(self, key: _KeyT, future: asyncio.Future[_ValueT]) -> None:
+        if self._futures.get(key) is future:
+            del self._futures[key]
+
+        if not future.cancelled():
+            # Mark the exception as retrieved in case every caller was cancelled.
+            future.exception()
+
+
+_SINGLE_FLIGHT: typing.Final[SingleFlight[typing.Any, typing.Any]] = SingleFlight()
+
+
+@attrs.define(slots=True)
+class CacheStats:
+    """Hit/miss statistics of a :class:`FetchCache`."""
+
+    hits: int = 0
+    """The number of lookups that were served from the cache."""
+    misses: int = 0
+    """The number of lookups that had to fetch the value."""
+    coalesced: int = 0
+    """The number of lookups that awaited a fetch already in progress for the same key."""
+    evictions: int = 0
+    """The number of entries that were removed because the cache was full."""
+    expirations: int = 0
+    """The number of entries that were removed because they outlived the ttl."""
+
+    @property
+    def lookups(self) -> int:
+        """The total number of lookups."""
+        return self.hits + self.misses + self.coalesced
+
+    @property
+    def hit_rate(self) -> float:
+        """The fraction of lookups that did not need to fetch the value.
+
+        This is ``0.0`` if no lookups have been made yet.
+        """
+        lookups = self.lookups
+        return (self.hits + self.coalesced) / lookups if lookups else 0.0
+
+    def reset(self) -> None:
+        """Reset all statistics to zero."""
+        self.hits = self.misses = self.coalesced = self.evictions = self.expirations = 0
+
+
+class FetchCache(typing.Generic[_KeyT, _ValueT]):
+    """A size- and ttl-bounded least-recently-used cache.
+
+    This is intended to sit in front of api requests made by parsers. Parsers
+    that support this take a ``cache`` parameter; the same cache instance may
+    be shared between multiple parsers. To this end, parsers prefix their keys
+    with the kind of object they store, e.g. ``("guild", guild_id)``, as e.g.
+    the id of a guild equals the id of its default role.
+
+    Concurrent :meth:`get_or_fetch` calls for the same key share a single
+    fetch, such that e.g. many simultaneous clicks on the same button result
+    in only one api request.
+
+    Parameters
+    ----------
+    max_size:
+        The maximum number of entries to store. When exceeded, the least
+        recently used entry is evicted.
+    ttl:
+        The time in seconds after which an entry expires. If ``None``, entries
+        never expire.
+    clock:
+        The function used to get the current time in seconds. Defaults to
+        :func:`time.monotonic`.
+
+    """
+
+    __slots__: typing.Sequence[str] = ("_clock", "_data", "_in_flight", "max_size", "stats", "ttl")
+
+    max_size: int
+    """The maximum number of entries to store."""
+    ttl: float | None
+    """The time in seconds after which an entry expires."""
+    stats: CacheStats
+    """The hit/miss statistics of this cache."""
+
+    _clock: typing.Callable[[], float]
+    _data: collections.OrderedDict[_KeyT, tuple[float, _ValueT]]
+    _in_flight: SingleFlight[_KeyT, _ValueT]
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        ttl: float | None = 300.0,
+        *,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_size < 1:
+            msg = f"max_size must be a positive integer, got {max_size}."
+            raise ValueError(msg)
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._clock = clock
+        self._data = collections.OrderedDict()
+        self._in_flight = SingleFlight()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(size={len(self)}, max_size={self.max_size},"
+            f" ttl={self.ttl}, stats={self.stats!r})"
+        )
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: _KeyT) -> bool:
+        return self._lookup(key) is not None
+
+    def _lookup(self, key: _KeyT) -> tuple[float, _ValueT] | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+
+        if self.ttl is not None and entry[0] <= self._clock():
+            del self._data[key]
+            self.stats.expirations += 1
+            return None
+
+        self._data.move_to_end(key)
+        return entry
+
+    def get(self, key: _KeyT, default: _ValueT | None = None) -> _ValueT | None:
+        """Get a value from the cache without fetching it.
+
+        This does not affect :attr:`stats`.
+
+        Parameters
+        ----------
+        key:
+            The key of the value to get.
+        default:
+            The value to return if the key is not in the cache.
+
+        """
+        entry = self._lookup(key)
+        return default if entry is None else entry[1]
+
+    def set(self, key: _KeyT, value: _ValueT) -> None:
+        """Store a value in the cache.
+
+        If the cache is full, the least recently used entry is evicted.
+
+        Parameters
+        ----------
+        key:
+            The key under which to store the value.
+        value:
+            The value to store.
+
+        """
+        expiry = float("inf") if self.ttl is None else self._clock() + self.ttl
+        self._data[key] = (expiry, value)
+        self._data.move_to_end(key)
+
+        while len(self._data) > self.max_size:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, key: _KeyT) -> None:
+        """Remove a value from the cache, if present.
+
+        Parameters
+        ----------
+        key:
+            The key of the value to remove.
+
+        """
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values from the cache.
+
+        This does not reset :attr:`stats`.
+        """
+        self._data.clear()
+
+    async def get_or_fetch(
+        self,
+        key: _KeyT,
+        fetch: typing.Callable[[], typing.Awaitable[_ValueT]],
+    ) -> _ValueT:
+        """Get a value from the cache, or fetch and store it if missing.
+
+        If a fetch for the same key is already in progress, this awaits that
+        fetch instead of starting a new one. If the fetch raises, the exception
+        is propagated to all waiters and nothing is stored.
+
+        Parameters
+        ----------
+        key:
+            The key of the value to get.
+        fetch:
+            A function returning an awaitable that resolves to the value. This
+            is only called on a cache miss.
+
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            self.stats.hits += 1
+            return entry[1]
+
+        if key in self._in_flight:
+            self.stats.coalesced += 1
+        else:
+            self.stats.misses += 1
+
+        return await self._in_flight.do(key, lambda: self._fetch_and_set(key, fetch))
+
+    def get_or_load(self, key: _KeyT, load: typing.Callable[[], _ValueT]) -> _ValueT:
+        """Get a value from the cache, or synchronously load and store it if missing.
+
+        Unlike :meth:`get_or_fetch`, this does not create any tasks; as the
+        value is loaded without awaiting anything, there are no concurrent
+        loads to coalesce. If the load raises, nothing is stored.
+
+        Parameters
+        ----------
+        key:
+            The key of the value to get.
+        load:
+            A function returning the value. This is only called on a cache
+            miss.
+
+        """
+        entry = self._lookup(key)
+        if entry is not None:
+            self.stats.hits += 1
+            return entry[1]
+
+        self.stats.misses += 1
+        value = load()
+        self.set(key, value)
+        return value
+
+    async def _fetch_and_set(
+        self,
+        key: _KeyT,
+        fetch: typing.Callable[[], typing.Awaitable[_ValueT]],
+    ) -> _ValueT:
+        value = await fetch()
+        self.set(key, value)
+        return value
+
+
+async def cached_fetch(
+    cache: FetchCache[_KeyT, _ValueT] | None,
+    key: _KeyT,
+    fetch: typing.Callable[[], typing.Awaitable[_ValueT]],
+) -> _ValueT:
+    """Fetch a value through the provided cache, if any.
+
+    This is a convenience function for parsers with an optional cache. If no
+    cache is provided, concurrent fetches for the same key are still
+    coalesced into a single fetch through a shared :class:`SingleFlight`.
+
+    As the cache may be shared between parsers, and the :class:`SingleFlight`
+    always is, keys should be prefixed with the kind of object that is
+    fetched, e.g. ``("guild", guild_id)``.
+
+    Parameters
+    ----------
+    cache:
+        The cache to use. If ``None``, the value is fetched unless a fetch
+        for the same key is already in progress.
+    key:
+        The key of the value to get.
+    fetch:
+        A function returning an awaitable that resolves to the value.
+
+    """
+    if cache is None:
+        return await _SINGLE_FLIGHT.do(key, fetch)
+
+    return await cache.get_or_fetch(key, fetch)
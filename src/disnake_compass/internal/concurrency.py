@@ -0,0 +1,227 @@
+"""Concurrency limits with configurable overflow behaviour."""
+
+from __future__ import annotations
+
+import asyncio
+import collections
+import contextlib
+import enum
+import typing
+
+if typing.TYPE_CHECKING:
+    import disnake
+
+__all__: typing.Sequence[str] = ("ConcurrencyLimit", "OverflowPolicy")
+
+
+class OverflowPolicy(enum.Enum):
+    """What to do with an invocation that exceeds a :class:`ConcurrencyLimit`."""
+
+    QUEUE = "queue"
+    """Wait until an invocation finishes.
+
+    If the queue of the limit is full, the invocation is rejected instead.
+    """
+    REJECT = "reject"
+    """Respond with an ephemeral message instead of running the invocation."""
+    DROP_DUPLICATES = "drop_duplicates"
+    """Silently acknowledge the invocation if an invocation with the same key
+    is already running or queued; queue it otherwise.
+    """
+
+
+class ConcurrencyLimit:
+    """A limit on the number of concurrently running invocations.
+
+    Unlike a plain :class:`asyncio.Semaphore`, a concurrency limit decides
+    what to do with invocations that exceed it based on its :attr:`policy`,
+    such that e.g. a single popular message cannot queue up an unbounded
+    number of invocations.
+
+    Invocations are identified by a key, which is used to detect duplicate
+    invocations for :attr:`OverflowPolicy.DROP_DUPLICATES`. For components,
+    this is the custom id and the id of the user that invoked it.
+
+    Parameters
+    ----------
+    limit:
+        The maximum number of concurrently running invocations.
+    policy:
+        What to do with invocations that exceed the limit.
+    max_queue:
+        The maximum number of invocations waiting for the limit. If ``None``,
+        the queue is unbounded. Invocations that would exceed this are
+        rejected.
+    reject_message:
+        The message with which to respond to rejected invocations.
+
+    """
+
+    __slots__: typing.Sequence[str] = (
+        "_active",
+        "_keys",
+        "_waiters",
+        "limit",
+        "max_queue",
+        "policy",
+        "reject_message",
+    )
+
+    limit: int
+    """The maximum number of concurrently running invocations."""
+    policy: OverflowPolicy
+    """What to do with invocations that exceed the limit."""
+    max_queue: int | None
+    """The maximum number of invocations waiting for the limit."""
+    reject_message: str
+    """The message with which to respond to rejected invocations."""
+
+    _active: int
+    _keys: collections.Counter[typing.Hashable]
+    _waiters: collections.deque[asyncio.Future[None]]
+
+    def __init__(
+        self,
+        limit: int,
+        *,
+        policy: OverflowPolicy = OverflowPolicy.QUEUE,
+        max_queue: int | None = None,
+        reject_message: str = "This is currently busy. Please try again in a moment.",
+    ) -> None:
+        if limit < 1:
+            msg = f"limit must be a positive integer, got {limit}."
+            raise ValueError(msg)
+
+        self.limit = limit
+        self.policy = policy
+        self.max_queue = max_queue
+        self.reject_message = reject_message
+        self._active = 0
+        self._keys = collections.Counter()
+        self._waiters = collections.deque()
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(limit={self.limit}, policy={self.policy},"
+            f" active={self.active}, queued={self.queued})"
+        )
+
+    @property
+    def active(self) -> int:
+        """The number of currently running invocations."""
+        return self._active
+
+    @property
+    def queued(self) -> int:
+        """The number of invocations waiting for the limit."""
+        return len(self._waiters)
+
+    async def acquire(self, key: typing.Hashable) -> OverflowPolicy | None:
+        """Wait for the limit to allow an invocation.
+
+        Every successful call must be followed by a call to :meth:`release`
+        with the same key once the invocation finishes.
+
+        Parameters
+        ----------
+        key:
+            The key identifying the invocation.
+
+        Returns
+        -------
+        :obj:`None`
+            The invocation may run.
+        :class:`OverflowPolicy`
+            The invocation must not run. This is
+            :attr:`OverflowPolicy.DROP_DUPLICATES` if it was dropped as a
+            duplicate, or :attr:`OverflowPolicy.REJECT` if it was rejected.
+
+        """
+        if self._active < self.limit and not self._waiters:
+            self._active += 1
+            self._keys[key] += 1
+            return None
+
+        if self.policy is OverflowPolicy.REJECT:
+            return OverflowPolicy.REJECT
+
+        if self.policy is OverflowPolicy.DROP_DUPLICATES and key in self._keys:
+            return OverflowPolicy.DROP_DUPLICATES
+
+        if self.max_queue is not None and len(self._waiters) >= self.max_queue:
+            return OverflowPolicy.REJECT
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self._keys[key] += 1
+        try:
+            await waiter
+
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was already handed to us; pass it on.
+                self.release(key)
+            else:
+                # A release may already have skipped past our cancelled waiter.
+                with contextlib.suppress(ValueError):
+                    self._waiters.remove(waiter)
+
+                self._discard_key(key)
+
+            raise
+
+        # The releasing invocation handed over its slot; _active is unchanged.
+        return None
+
+    def release(self, key: typing.Hashable) -> None:
+        """Release the limit after an invocation finishes.
+
+        Parameters
+        ----------
+        key:
+            The key identifying the invocation.
+
+        """
+        self._discard_key(key)
+
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self._active -= 1
+
+    def _discard_key(self, key: typing.Hashable) -> None:
+        self._keys[key] -= 1
+        if self._keys[key] <= 0:
+            del self._keys[key]
+
+    async def respond_overflow(
+        self,
+        interaction: disnake.Interaction[disnake.Client],
+        overflow: OverflowPolicy,
+    ) -> None:
+        """Respond to an interaction that was not allowed to run.
+
+        Dropped duplicates are silently acknowledged, whereas rejected
+        invocations receive an ephemeral :attr:`reject_message`. If the
+        interaction was already deferred, the message is sent as a followup.
+
+        Parameters
+        ----------
+        interaction:
+            The interaction that was not allowed to run.
+        overflow:
+            The reason it was not allowed to run, as returned by :meth:`acquire`.
+
+        """
+        if overflow is OverflowPolicy.DROP_DUPLICATES:
+            if not interaction.response.is_done():
+                await interaction.response.defer()
+
+        elif interaction.response.is_done():
+            await interaction.followup.send(self.reject_message, ephemeral=True)
+
+        else:
+            await interaction.response.send_message(self.reject_message, ephemeral=True)
@@ -0,0 +1,152 @@
+"""Automatic deferral of interactions that are about to miss their deadline."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import typing
+
+import disnake
+
+__all__: typing.Sequence[str] = ("INTERACTION_DEADLINE", "AutoDefer", "DeferTimer")
+
+_LOGGER = logging.getLogger(__name__)
+
+INTERACTION_DEADLINE: typing.Final[float] = 3.0
+"""The number of seconds within which discord requires an interaction response."""
+
+
+class AutoDefer:
+    """Settings for automatically deferring slow interactions.
+
+    Discord requires interactions to be responded to within three seconds.
+    When a component takes longer than that, e.g. because its parsers need to
+    fetch from the API, the interaction fails. With automatic deferral, the
+    interaction is deferred if it has not been responded to after
+    :attr:`threshold` seconds, giving the component fifteen minutes to
+    respond through :attr:`disnake.Interaction.followup` or
+    :meth:`disnake.Interaction.edit_original_response`.
+
+    .. warning::
+        A component that responds just as the threshold is reached may race
+        the deferral, in which case the response made last fails. Components
+        that may take long should therefore check
+        :meth:`disnake.InteractionResponse.is_done` before responding, or use
+        :attr:`eager` deferral.
+
+    Parameters
+    ----------
+    threshold:
+        The number of seconds after which to defer the interaction.
+    eager:
+        Whether to defer immediately, while the custom id is being parsed.
+        This saves a round-trip for components that always take long, but
+        prevents them from responding with anything other than a followup or
+        an edit.
+
+    """
+
+    __slots__: typing.Sequence[str] = ("eager", "threshold")
+
+    threshold: float
+    """The number of seconds after which to defer the interaction."""
+    eager: bool
+    """Whether to defer immediately, while the custom id is being parsed."""
+
+    def __init__(self, threshold: float = 2.0, *, eager: bool = False) -> None:
+        if not 0 <= threshold < INTERACTION_DEADLINE:
+            msg = f"The threshold must be between 0 and {INTERACTION_DEADLINE} seconds."
+            raise ValueError(msg)
+
+        self.threshold = threshold
+        self.eager = eager
+
+    def __repr__(self) -> str:
+        return f"AutoDefer(threshold={self.threshold}, eager={self.eager})"
+
+    def start(self, interaction: disnake.Interaction[disnake.Client]) -> DeferTimer:
+        """Start the deadline timer for an interaction.
+
+        Parameters
+        ----------
+        interaction:
+            The interaction to defer once the threshold is reached.
+
+        Returns
+        -------
+        :class:`DeferTimer`
+            The started timer. This should be cancelled once the interaction
+            is done being processed.
+
+        """
+        return DeferTimer(interaction, 0 if self.eager else self.threshold)
+
+
+class DeferTimer:
+    """A timer that defers an interaction unless it was responded to in time.
+
+    This is normally created through :meth:`AutoDefer.start`.
+
+    Parameters
+    ----------
+    interaction:
+        The interaction to defer.
+    delay:
+        The number of seconds after which to defer the interaction. If this
+        is zero, the deferral is started immediately.
+
+    """
+
+    __slots__: typing.Sequence[str] = ("_handle", "_interaction", "_task")
+
+    _handle: asyncio.TimerHandle | None
+    _interaction: disnake.Interaction[disnake.Client]
+    _task: asyncio.Task[None] | None
+
+    def __init__(self, interaction: disnake.Interaction[disnake.Client], delay: float) -> None:
+        self._interaction = interaction
+        self._task = None
+        self._handle = None
+
+        if delay > 0:
+            self._handle = asyncio.get_running_loop().call_later(delay, self._fire)
+        else:
+            self._fire()
+
+    @property
+    def deferred(self) -> bool:
+        """Whether this timer started deferring the interaction."""
+        return self._task is not None
+
+    def _fire(self) -> None:
+        self._handle = None
+        if not self._interaction.response.is_done():
+            self._task = asyncio.create_task(_defer(self._interaction))
+
+    def cancel(self) -> None:
+        """Stop the timer if it has not fired yet.
+
+        A deferral that is already in progress is not cancelled; use
+        :meth:`wait` to wait for it to finish.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+    async def wait(self) -> None:
+        """Wait for a deferral that is in progress, if any.
+
+        Awaiting this before responding to the interaction ensures that the
+        response does not race the deferral.
+        """
+        if self._task is not None:
+            await self._task
+
+
+async def _defer(interaction: disnake.Interaction[disnake.Client]) -> None:
+    try:
+        await interaction.response.defer()
+
+    except (disnake.InteractionResponded, disnake.HTTPException):
+        # The interaction was responded to while deferring.
+        _LOGGER.debug("Failed to automatically defer interaction %s.", interaction.id)
@@ -0,0 +1,122 @@
+"""Suppression of repeated invocations within a time window."""
+
+from __future__ import annotations
+
+import collections
+import math
+import time
+import typing
+
+__all__: typing.Sequence[str] = ("DedupeWindow",)
+
+
+class DedupeWindow:
+    """A window within which repeated invocations are considered duplicates.
+
+    Invocations are identified by a key, which for components consists of the
+    message id, the custom id and the id of the user that invoked it. An
+    invocation is a duplicate if an invocation with the same key started less
+    than :attr:`ttl` seconds ago, or if one is still in progress.
+
+    Keys are stored in buckets spanning a fraction of the ttl each, such that
+    expired keys are dropped a whole bucket at a time rather than tracking an
+    expiry time per key. As a consequence, keys may be remembered for up to
+    one bucket longer than the ttl.
+
+    Parameters
+    ----------
+    ttl:
+        The number of seconds for which an invocation suppresses repeated
+        invocations with the same key.
+    buckets:
+        The number of buckets across which the ttl is divided. More buckets
+        expire keys more precisely at the cost of more set lookups per check.
+
+    """
+
+    __slots__: typing.Sequence[str] = ("_buckets", "_in_flight", "_width", "bucket_count", "ttl")
+
+    ttl: float
+    """The number of seconds for which an invocation suppresses duplicates."""
+    bucket_count: int
+    """The number of buckets across which the ttl is divided."""
+
+    _buckets: collections.deque[tuple[int, set[typing.Hashable]]]
+    _in_flight: set[typing.Hashable]
+    _width: float
+
+    def __init__(self, ttl: float = 2.0, *, buckets: int = 4) -> None:
+        if ttl <= 0 or buckets < 1:
+            msg = "The ttl must be positive and there must be at least one bucket."
+            raise ValueError(msg)
+
+        self.ttl = ttl
+        self.bucket_count = buckets
+        self._width = ttl / buckets
+        self._buckets = collections.deque()
+        self._in_flight = set()
+
+    def __repr__(self) -> str:
+        return f"DedupeWindow(ttl={self.ttl}, size={len(self)}, in_flight={len(self._in_flight)})"
+
+    def __len__(self) -> int:
+        return sum(len(keys) for _, keys in self._buckets)
+
+    def __contains__(self, key: typing.Hashable) -> bool:
+        if key in self._in_flight:
+            return True
+
+        self._expire(self._now())
+        return any(key in keys for _, keys in self._buckets)
+
+    def _now(self) -> int:
+        return math.floor(time.monotonic() / self._width)
+
+    def _expire(self, now: int) -> None:
+        buckets = self._buckets
+        while buckets and buckets[0][0] <= now - self.bucket_count:
+            buckets.popleft()
+
+    def begin(self, key: typing.Hashable) -> bool:
+        """Start an invocation, unless it is a duplicate.
+
+        If this returns ``True``, :meth:`end` must be called with the same key
+        once the invocation finishes.
+
+        Parameters
+        ----------
+        key:
+            The key identifying the invocation.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether the invocation may run, i.e. whether it is not a duplicate.
+
+        """
+        if key in self:
+            return False
+
+        now = self._now()
+        if not self._buckets or self._buckets[-1][0] != now:
+            self._buckets.append((now, set()))
+
+        self._buckets[-1][1].add(key)
+        self._in_flight.add(key)
+        return True
+
+    def end(self, key: typing.Hashable) -> None:
+        """Finish an invocation started through :meth:`begin`.
+
+        Parameters
+        ----------
+        key:
+            The key identifying the invocation.
+
+        """
+        self._in_flight.discard(key)
+
+    def clear(self) -> None:
+        """Forget all keys, including those of invocations still in progress."""
+        self._buckets.clear()
+        self._in_flight.clear()
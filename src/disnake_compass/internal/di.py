@@ -4,52 +4,119 @@ from __future__ import annotations
 
 import contextvars
 import typing
+import weakref
 
 import typing_extensions
 
 from disnake_compass.internal import omit
 
 __all__: typing.Sequence[str] = (
+    "evict_module",
     "register_dependencies",
+    "registry_size",
     "reset_dependencies",
     "resolve_dependency",
 )
 
 _T = typing.TypeVar("_T")
-TokenMap: typing_extensions.TypeAlias = typing.Mapping[
+# A mapping of dependency types to the dependencies registered for them. Scopes
+# are never mutated once set; registering dependencies creates a new scope.
+_Scope: typing_extensions.TypeAlias = dict[type[typing.Any], object]
+ScopeToken: typing_extensions.TypeAlias = contextvars.Token[_Scope]
+"""A token used to restore the previous scope, see :func:`reset_dependencies`."""
+
+# All dependencies live in a single contextvar, such that registering any
+# number of them takes a single set and reset.
+_SCOPE: contextvars.ContextVar[_Scope] = contextvars.ContextVar(
+    "__disnake_compass_dependencies__",
+    default={},  # noqa: B039
+)
+# Whether a registered type resolves a requested type, keyed by requested type
+# and then by registered type. Types are held weakly, such that types of
+# unloaded or reloaded modules do not stay alive just because they were once
+# resolved.
+_SUBTYPE_CACHE: weakref.WeakKeyDictionary[
     type[typing.Any],
-    contextvars.Token[object],
-]
+    weakref.WeakKeyDictionary[type[typing.Any], bool],
+] = weakref.WeakKeyDictionary()
+
+
+def _is_subtype(registered_type: type[typing.Any], dependency_type: type[typing.Any]) -> bool:
+    cache = _SUBTYPE_CACHE.get(dependency_type)
+    if cache is not None and registered_type in cache:
+        return cache[registered_type]
+
+    try:
+        result = issubclass(registered_type, dependency_type)
+    except TypeError:  # e.g. non-runtime-checkable protocols.
+        return False
+
+    if cache is None:
+        cache = _SUBTYPE_CACHE[dependency_type] = weakref.WeakKeyDictionary()
+
+    cache[registered_type] = result
+    return result
+
+
+def _is_from_module(type_: type[typing.Any], name: str) -> bool:
+    module = type_.__module__
+    return module == name or module.startswith(name + ".")
+
+
+def evict_module(name: str) -> int:
+    """Evict all cached dependency resolutions for types of a module.
+
+    As cached types are held weakly, this is generally not necessary. It can
+    however be used to immediately drop any types of a module that is being
+    unloaded or reloaded, even if they are still referenced elsewhere.
+
+    Parameters
+    ----------
+    name:
+        The name of the module. Submodules of this module are evicted too.
+
+    Returns
+    -------
+    :class:`int`
+        The number of cached resolutions that were evicted.
+
+    """
+    evicted = 0
+    for dependency_type, cache in list(_SUBTYPE_CACHE.items()):
+        if _is_from_module(dependency_type, name):
+            evicted += len(cache)
+            del _SUBTYPE_CACHE[dependency_type]
+            continue
+
+        for registered_type in list(cache.keys()):
+            if _is_from_module(registered_type, name):
+                del cache[registered_type]
+                evicted += 1
+
+    return evicted
 
-# XXX:  This actually introduces a memory leak when combined with hot-reloading
-#       as old types will never be cleared from the dependency map. Since hot-
-#       reloading in production environments is ill-advised anyway, I don't
-#       think it's worth adding a lot more complexity to circumvent it.
-#       ...Unless, of course, someone can come up with a better approach.
-DEPENDENCY_MAP: dict[type[typing.Any], contextvars.ContextVar[typing.Any]] = {}
 
+def registry_size() -> int:
+    """Get the number of cached dependency resolutions.
 
-def _get_contextvar_for(dependency_type: type[_T], /) -> contextvars.ContextVar[_T]:
-    if dependency_type in DEPENDENCY_MAP:
-        return DEPENDENCY_MAP[dependency_type]
+    This can be used to monitor the memory use of dependency resolution.
 
-    # Resolve subclass of registered type and save it to speed up future lookups.
-    for registered_type, context in DEPENDENCY_MAP.items():
-        if issubclass(registered_type, dependency_type):
-            DEPENDENCY_MAP[dependency_type] = context
-            return context
+    Returns
+    -------
+    :class:`int`
+        The number of cached (registered type, requested type) pairs.
 
-    # Insert missing dependency type, use a name that is unlikely to lead to conflicts.
-    name = f"__disnake_ext_components__{dependency_type.__name__}__"
-    context = DEPENDENCY_MAP[dependency_type] = contextvars.ContextVar[_T](name)
-    return context
+    """
+    return sum(len(cache) for cache in _SUBTYPE_CACHE.values())
 
 
-def register_dependencies(*dependencies: object) -> TokenMap:
-    r"""Register any number of dependencies.
+def register_dependencies(*dependencies: object) -> ScopeToken:
+    """Register any number of dependencies.
 
-    This returns a mapping of :class:`contextvars.Token`\s that should be
-    passed to :func:`reset_dependencies` for cleanup.
+    This creates a new scope containing the provided dependencies on top of
+    any dependencies that were already registered in the current context, and
+    returns a token that should be passed to :func:`reset_dependencies` for
+    cleanup.
 
     While dependencies are registered, :func:`resolve_dependency` can be used
     to get it for the current async context.
@@ -62,35 +129,32 @@ def register_dependencies(*dependencies: object) -> TokenMap:
 
     Returns
     -------
-    typing.Dict[typing.Type[typing.Any], contextvars.Token[object]]
-        A mapping of the types of the registered dependencies to contextvar
-        tokens used to reset their respective contextvars. This is meant to be
-        passed to :func:`reset_dependencies` for cleanup.
+    :class:`contextvars.Token`
+        A token used to restore the scope to what it was before this call.
+        This is meant to be passed to :func:`reset_dependencies` for cleanup.
 
     """
-    tokens: dict[type, contextvars.Token[object]] = {}
+    scope = dict(_SCOPE.get())
     for dependency in dependencies:
-        dependency_type = type(dependency)
-        tokens[dependency_type] = _get_contextvar_for(dependency_type).set(dependency)
+        scope[type(dependency)] = dependency
 
-    return tokens
+    return _SCOPE.set(scope)
 
 
-def reset_dependencies(tokens: TokenMap) -> None:
+def reset_dependencies(token: ScopeToken) -> None:
     """Reset dependencies that are no longer in use.
 
     This is meant to be used in conjunction with :func:`register_dependencies`.
 
     Parameters
     ----------
-    tokens:
-        A mapping of the types of the registered dependencies to contextvar
-        tokens used to reset their respective contextvars. This mapping is
-        created and returned by :func:`register_dependencies`.
+    token:
+        The token used to restore the scope to what it was before the
+        dependencies were registered. This token is created and returned by
+        :func:`register_dependencies`.
 
     """
-    for dependency_type, token in tokens.items():
-        _get_contextvar_for(dependency_type).reset(token)
+    _SCOPE.reset(token)
 
 
 def resolve_dependency(
@@ -100,9 +164,12 @@ def resolve_dependency(
     """Resolve a dependency given a type and an optional default.
 
     If a dependency was set using :func:`register_dependency` in the current
-    context, this function returns it. If it is not found, the default is
-    returned instead. If no default was provided, a :class:`LookupError` is
-    raised instead.
+    context, this function returns it. If no dependency was registered for the
+    exact type, the dependency of a subtype is returned instead. If multiple
+    subtypes match, the type that was registered first wins; registering a
+    type again replaces its dependency but does not change its position. If
+    it is not found, the default is returned instead. If no default was
+    provided, a :class:`LookupError` is raised instead.
 
     Parameters
     ----------
@@ -122,10 +189,16 @@ def resolve_dependency(
         The dependency type could not be resolved and no default was provided.
 
     """
-    context = _get_contextvar_for(dependency_type)
-    resolved = context.get(omit.Omitted)
-    if not omit.is_omitted(resolved):
-        return resolved
+    scope = _SCOPE.get()
+    if dependency_type in scope:
+        return typing.cast(_T, scope[dependency_type])
+
+    # Resolve subclasses of the requested type in registration order. Notably,
+    # the default dependency provider registers the channel before the author,
+    # such that e.g. Messageable resolves to the channel.
+    for registered_type in scope:
+        if _is_subtype(registered_type, dependency_type):
+            return typing.cast(_T, scope[registered_type])
 
     if not omit.is_omitted(default):
         return default
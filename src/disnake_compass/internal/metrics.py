@@ -0,0 +1,231 @@
+"""In-process counters and latency histograms for component managers."""
+
+from __future__ import annotations
+
+import bisect
+import collections
+import typing
+
+__all__: typing.Sequence[str] = ("DEFAULT_BUCKETS", "Histogram", "Metrics")
+
+DEFAULT_BUCKETS: typing.Final[tuple[float, ...]] = (
+    0.00001,
+    0.000025,
+    0.00005,
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+"""The default upper bounds of the buckets of a :class:`Histogram`, in seconds."""
+
+
+class Histogram:
+    """A histogram of observed durations.
+
+    Observations are counted in buckets with fixed upper bounds, such that
+    observing a value takes constant memory. Observations greater than the
+    greatest bound are counted in an additional overflow bucket.
+
+    Parameters
+    ----------
+    buckets:
+        The upper bounds of the buckets, in ascending order.
+
+    """
+
+    __slots__: typing.Sequence[str] = ("bounds", "count", "counts", "maximum", "total")
+
+    bounds: tuple[float, ...]
+    """The upper bounds of the buckets, in ascending order."""
+    counts: list[int]
+    """The number of observations per bucket, including the overflow bucket."""
+    count: int
+    """The total number of observations."""
+    total: float
+    """The sum of all observations."""
+    maximum: float
+    """The greatest observation."""
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds = tuple(buckets)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def __repr__(self) -> str:
+        return f"Histogram(count={self.count}, mean={self.mean:.6f}, maximum={self.maximum:.6f})"
+
+    @property
+    def mean(self) -> float:
+        """The mean of all observations.
+
+        This is ``0.0`` if nothing has been observed yet.
+        """
+        return self.total / self.count if self.count else 0.0
+
+    def observe(self, value: float) -> None:
+        """Record an observation.
+
+        Parameters
+        ----------
+        value:
+            The observed value.
+
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.maximum = max(self.maximum, value)
+
+    def quantile(self, quantile: float) -> float:
+        """Estimate a quantile of the observations.
+
+        As observations are bucketed, this returns the upper bound of the
+        bucket in which the quantile lies. For the overflow bucket, this
+        returns the greatest observation.
+
+        Parameters
+        ----------
+        quantile:
+            The quantile to estimate, between ``0`` and ``1``.
+
+        """
+        if not self.count:
+            return 0.0
+
+        rank = quantile * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return bound
+
+        return self.maximum
+
+    def snapshot(self) -> dict[str, object]:
+        """Return the state of this histogram as a plain dict."""
+        return {
+            "count": self.count,
+            "sum": self.total,
+            "max": self.maximum,
+            "buckets": dict(zip((*self.bounds, float("inf")), self.counts, strict=True)),
+        }
+
+
+class Metrics:
+    """Counters and per-stage latency histograms of a component manager.
+
+    Histograms are stored per component identifier and stage. The stages
+    recorded by :class:`~disnake_compass.impl.ComponentManager` are:
+
+    - ``"route"``: matching a custom id to a component identifier,
+    - ``"decode"``: parsing the custom id into a component,
+    - ``"decode.<field>:<parser>"``: parsing a single custom id field,
+    - ``"wrap"``: entering the callback wrappers,
+    - ``"callback"``: running the component callback,
+    - ``"exception"``: running the exception handlers.
+
+    The counters recorded by :class:`~disnake_compass.impl.ComponentManager`
+    are ``"unknown_ids"``, ``"stale_deregistrations"``,
+    ``"handled_exceptions"``, ``"unhandled_exceptions"``, ``"duplicates"``
+    for suppressed repeated clicks, and ``"rejected"`` and ``"dropped"`` for
+    invocations that exceeded a concurrency limit.
+
+    Parameters
+    ----------
+    buckets:
+        The upper bounds of the buckets of all histograms.
+
+    """
+
+    __slots__: typing.Sequence[str] = ("buckets", "counters", "histograms")
+
+    buckets: tuple[float, ...]
+    """The upper bounds of the buckets of all histograms."""
+    counters: collections.Counter[str]
+    """A mapping of counter name to count."""
+    histograms: dict[tuple[str, str], Histogram]
+    """A mapping of (component identifier, stage) to the histogram of that stage."""
+
+    def __init__(self, buckets: typing.Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(buckets)
+        self.counters = collections.Counter()
+        self.histograms = {}
+
+    def __repr__(self) -> str:
+        return f"Metrics(counters={dict(self.counters)}, histograms={len(self.histograms)})"
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Increment a counter.
+
+        Parameters
+        ----------
+        counter:
+            The name of the counter.
+        amount:
+            The amount by which to increment the counter.
+
+        """
+        self.counters[counter] += amount
+
+    def observe(self, identifier: str, stage: str, seconds: float) -> None:
+        """Record the duration of a stage for a component.
+
+        Parameters
+        ----------
+        identifier:
+            The identifier of the component.
+        stage:
+            The name of the stage.
+        seconds:
+            The duration of the stage, in seconds.
+
+        """
+        key = (identifier, stage)
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram(self.buckets)
+
+        histogram.observe(seconds)
+
+    def get_histogram(self, identifier: str, stage: str) -> Histogram | None:
+        """Get the histogram of a stage for a component, if anything was recorded.
+
+        Parameters
+        ----------
+        identifier:
+            The identifier of the component.
+        stage:
+            The name of the stage.
+
+        """
+        return self.histograms.get((identifier, stage))
+
+    def snapshot(self) -> dict[str, typing.Any]:
+        """Return all counters and histograms as plain, nested dicts.
+
+        Histograms are nested by component identifier and then by stage.
+        """
+        histograms: dict[str, dict[str, dict[str, object]]] = {}
+        for (identifier, stage), histogram in self.histograms.items():
+            histograms.setdefault(identifier, {})[stage] = histogram.snapshot()
+
+        return {"counters": dict(self.counters), "histograms": histograms}
+
+    def reset(self) -> None:
+        """Reset all counters and histograms."""
+        self.counters.clear()
+        self.histograms.clear()
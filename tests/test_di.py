@@ -0,0 +1,45 @@
+"""Tests for dependency resolution."""
+
+import asyncio
+
+import disnake
+import pytest
+
+from disnake_compass.impl import manager as manager_impl
+from disnake_compass.internal import di
+
+
+def _make(cls: type) -> object:
+    # Dependency resolution only cares about types; skip the constructors.
+    return object.__new__(cls)
+
+
+def test_messageable_resolves_to_channel() -> None:
+    manager = manager_impl.get_manager()
+    channel = _make(disnake.TextChannel)
+    author = _make(disnake.Member)
+
+    async def invoke() -> None:
+        # Same order in which the manager passes dependencies on invocation.
+        async with manager_impl.default_dependency_provider(manager, manager, channel, author):
+            assert di.resolve_dependency(disnake.abc.Messageable) is channel
+
+    asyncio.run(invoke())
+
+
+def test_reregistration_keeps_position() -> None:
+    channel = _make(disnake.TextChannel)
+    author = _make(disnake.Member)
+    other_channel = _make(disnake.TextChannel)
+
+    outer = di.register_dependencies(channel, author)
+    inner = di.register_dependencies(other_channel)
+    try:
+        assert di.resolve_dependency(disnake.abc.Messageable) is other_channel
+
+    finally:
+        di.reset_dependencies(inner)
+        di.reset_dependencies(outer)
+
+    with pytest.raises(LookupError):
+        di.resolve_dependency(disnake.abc.Messageable)